@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 
-from .models import GlobalConfig
+from .models import DailyMetricRollup, ExportJob, GlobalConfig
 
 
 @admin.register(GlobalConfig)
@@ -32,3 +32,25 @@ class GlobalConfigAdmin(admin.ModelAdmin):
 
     def has_delete_permission(self, request, obj=None):
         return False
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = ["source", "format", "user", "organization", "status", "processed_rows", "total_rows", "created_at"]
+    list_filter = ["status", "format"]
+    search_fields = ["source", "user__email", "user__username"]
+    readonly_fields = [f.name for f in ExportJob._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(DailyMetricRollup)
+class DailyMetricRollupAdmin(admin.ModelAdmin):
+    list_display = ["metric", "organization", "day", "value", "updated_at"]
+    list_filter = ["metric"]
+    date_hierarchy = "day"
+    readonly_fields = [f.name for f in DailyMetricRollup._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
@@ -1,9 +1,29 @@
+from typing import Any, Callable
+
+from django.utils.functional import SimpleLazyObject
+
+from . import metrics
 from .models import GlobalConfig
 
 
+def lazy_context_value(processor: str, func: Callable[[], Any]) -> SimpleLazyObject:
+    """Valor de context processor evaluado recién cuando un template lo lee (una vez por render).
+
+    Contadores (apps.core.metrics): context_processor.called / context_processor.evaluated
+    por processor; en fragmentos HTMX "evaluated" no debería moverse.
+    """
+
+    metrics.incr("context_processor.called", processor=processor)
+
+    def evaluate() -> Any:
+        metrics.incr("context_processor.evaluated", processor=processor)
+        return func()
+
+    return SimpleLazyObject(evaluate)
+
+
 def global_config_context(request):
-    """Inyecta la configuración global en todos los templates."""
-    config = GlobalConfig.load()
+    """Inyecta la configuración global en todos los templates (lazy: solo si se lee)."""
     return {
-        "GLOBAL_CONFIG": config,
+        "GLOBAL_CONFIG": lazy_context_value("global_config", GlobalConfig.load),
     }
@@ -1,11 +1,15 @@
-from .config import CrudConfig
+from .config import CrudConfig, CrudParams
 from .defs import ColumnDef, FilterDef
 from .registry import register_crud, get_crud
+from .search import apply_search, register_search_index
 
 __all__ = [
     "CrudConfig",
+    "CrudParams",
     "ColumnDef",
     "FilterDef",
     "register_crud",
     "get_crud",
+    "apply_search",
+    "register_search_index",
 ]
@@ -5,12 +5,18 @@ from typing import Any, Type
 from urllib.parse import urlencode
 
 from django.core.paginator import Paginator
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from django import forms
 
+from .counting import CountResult, count_queryset
 from .defs import ColumnDef, FilterDef
+from .pagination import paginate_keyset, paginate_offset
 from .permissions import CrudPermissionSpec
+from .projection import ProjectedRow, Projection, apply_projection, build_projection
+from .rendering import CompiledColumns, Row
+from .routing import RowUrlTemplates
+from .search import apply_search
 
 
 @dataclass(frozen=True)
@@ -23,9 +29,13 @@ class CrudParams:
     # Compat con templates del kit (aunque MVP solo use algunos)
     date_from: str
     date_to: str
+    # Paginación keyset: cursor opaco (vacío = primera página).
+    cursor: str = ""
+    # Valores de FilterDef que no son params estándar (p.ej. role), en orden de declaración.
+    extra: tuple[tuple[str, str], ...] = ()
 
     def as_dict(self) -> dict[str, str]:
-        return {
+        data = {
             "q": self.q,
             "status": self.status,
             "sort": self.sort,
@@ -33,7 +43,15 @@ class CrudParams:
             "page": self.page,
             "from": self.date_from,
             "to": self.date_to,
+            "cursor": self.cursor,
         }
+        for name, value in self.extra:
+            data.setdefault(name, value)
+        return data
+
+
+# Nombres de querystring reservados por CrudParams.
+_STANDARD_PARAMS = frozenset({"q", "status", "sort", "dir", "page", "from", "to", "cursor"})
 
 
 class CrudConfig:
@@ -53,13 +71,42 @@ class CrudConfig:
     list_columns: list[ColumnDef]
     filters: list[FilterDef] = []
     search_fields: list[str] = []
+    # Backend de búsqueda para search_fields: "icontains" (default), "postgres",
+    # "trigram", "fts5" o "auto". Ver apps.core.crud.search.
+    # Ojo: "postgres" y "fts5" (y "auto" sobre ellos) buscan por prefijo de palabra, no por
+    # subcadena: "jua" encuentra "Juan", "uan" ya no (icontains y trigram sí).
+    search_backend: str = "icontains"
 
     default_sort_key: str = ""
     default_dir: str = "asc"
     page_size: int = 10
 
+    # "offset": Paginator clásico (page=N, OFFSET + COUNT).
+    # "keyset": seek sobre el orden + pk con cursores opacos (cursor=...);
+    # costo constante por página. Requiere columnas de orden NOT NULL.
+    pagination_mode: str = "offset"
+
+    # Conteo total: "exact" (COUNT por request), "cached" (por firma de filtro, TTL)
+    # o "estimated" (planner de PostgreSQL para tablas enormes: "~1.2M registros").
+    count_strategy: str = "exact"
+    count_cache_ttl: int = 60
+    # estimated: bajo este umbral la estimación no vale la pena y se cuenta exacto (cacheado).
+    count_estimate_threshold: int = 100_000
+
     status_options: list[tuple[str, str]] | None = None
 
+    # Proyección del queryset de listado (opt-in): None carga el modelo completo;
+    # "only" aplica .only() + select_related/prefetch_related según columnas;
+    # "values" usa .values() (filas como ProjectedRow, con acceso por atributo).
+    list_projection: str | None = None
+    # Campos adicionales que necesitan row_urls/overrides (p.ej. ["slug"]).
+    list_extra_fields: list[str] = []
+
+    # Acciones por fila declarativas: {"edit": "app:edit", "delete": "app:delete", "detail": None}.
+    # Cada ruta se resuelve una vez por render (pk centinela) en vez de reverse() por fila.
+    row_url_routes: dict[str, str | None] = {}
+    row_url_kwarg: str = "id"
+
     # --- Step 8 (MVP): formularios y metadatos de modales (sin generación automática) ---
     create_form_class: Type[forms.ModelForm] | None = None
     edit_form_class: Type[forms.ModelForm] | None = None
@@ -86,6 +133,12 @@ class CrudConfig:
     export_headers: dict[str, str] | None = None
     export_formats: list[str] | set[str] | tuple[str, ...] | None = None  # e.g. ["csv", "xlsx", "pdf"]
 
+    # Exports en segundo plano (apps.core.exports): formatos que además se ofrecen como job
+    # encolado (RQ). Pensado para XLSX/PDF grandes, que no deben ocupar un worker web.
+    export_async_formats: tuple[str, ...] = ("xlsx", "pdf")
+    export_filename_base: str | None = None
+    export_title: str | None = None
+
     def exports_declared(self) -> bool:
         return bool(self.export_fields)
 
@@ -116,6 +169,16 @@ class CrudConfig:
             return False
         return fmt in self.get_export_formats()
 
+    def allows_async_format(self, fmt: str) -> bool:
+        fmt = (fmt or "").strip().lower()
+        return self.allows_format(fmt) and fmt in set(self.export_async_formats or ())
+
+    def get_export_filename_base(self, request: HttpRequest | None = None) -> str:
+        return self.export_filename_base or self.crud_slug.replace(".", "_")
+
+    def get_export_title(self) -> str:
+        return self.export_title or self.page_title or self.entity_label_plural or "Export"
+
     def can_export(self, request: HttpRequest) -> bool:
         # Por ahora, export se alinea con permiso de list.
         return self.can_list(request)
@@ -138,10 +201,20 @@ class CrudConfig:
             page=page,
             date_from=(request.GET.get("from") or "").strip(),
             date_to=(request.GET.get("to") or "").strip(),
+            cursor=(request.GET.get("cursor") or "").strip(),
+            extra=tuple(
+                (f.name, (request.GET.get(f.name) or "").strip())
+                for f in self.filters
+                if f.name not in _STANDARD_PARAMS
+            ),
         )
 
     def build_qs_without_page(self, params: CrudParams) -> str:
-        data = {k: v for k, v in params.as_dict().items() if k != "page" and v not in {"", "all"}}
+        data = {
+            k: v
+            for k, v in params.as_dict().items()
+            if k not in {"page", "cursor"} and v not in {"", "all"}
+        }
         return urlencode(data)
 
     def get_base_queryset(self, request: HttpRequest) -> QuerySet:
@@ -151,10 +224,7 @@ class CrudConfig:
         if not params.q or not self.search_fields:
             return qs
 
-        query = Q()
-        for f in self.search_fields:
-            query |= Q(**{f"{f}__icontains": params.q})
-        return qs.filter(query)
+        return apply_search(qs, self.search_fields, params.q, backend=self.search_backend)
 
     def apply_filters(self, qs: QuerySet, params: CrudParams, request: HttpRequest) -> QuerySet:
         data = params.as_dict()
@@ -185,6 +255,34 @@ class CrudConfig:
 
         return qs.order_by(*[f"{prefix}{f}" for f in fields])
 
+    def get_list_fields(self) -> list[str] | None:
+        """Campos que la tabla necesita. None si alguna columna no los declara."""
+
+        paths: list[str] = list(self.list_extra_fields)
+        for c in self.list_columns:
+            needed = c.required_fields()
+            if needed is None:
+                return None
+            paths.extend(needed)
+        return paths
+
+    def get_list_projection(self) -> Projection | None:
+        cached = self.__dict__.get("_list_projection")
+        if cached is None or cached[0] is not self.list_columns:
+            cached = (self.list_columns, build_projection(self.model, self.get_list_fields()))
+            self.__dict__["_list_projection"] = cached
+        return cached[1]
+
+    def apply_projection(self, qs: QuerySet) -> QuerySet:
+        """Aplica list_projection al queryset de la tabla.
+
+        Solo para el listado: los exports reutilizan queryset_for_list con sus propios campos.
+        """
+
+        if not self.list_projection:
+            return qs
+        return apply_projection(qs, self.get_list_projection(), mode=self.list_projection)
+
     def queryset_for_list(self, request: HttpRequest, params: CrudParams) -> QuerySet:
         qs = self.get_base_queryset(request)
         qs = self.apply_search(qs, params)
@@ -192,22 +290,36 @@ class CrudConfig:
         qs = self.apply_ordering(qs, params)
         return qs
 
-    def columns_for_template(self) -> list[dict]:
-        return [c.to_template_dict() for c in self.list_columns]
+    def get_compiled_columns(self) -> CompiledColumns:
+        """Columnas compiladas una vez por config (se recompila si cambia list_columns)."""
+
+        cached = self.__dict__.get("_compiled_columns")
+        if cached is None or cached[0] is not self.list_columns:
+            cached = (self.list_columns, CompiledColumns(self.list_columns))
+            self.__dict__["_compiled_columns"] = cached
+        return cached[1]
+
+    def columns_for_template(self) -> list:
+        return list(self.get_compiled_columns().columns)
 
     def row_cells(self, obj: Any) -> list[Any]:
-        cells: list[Any] = []
-        for c in self.list_columns:
-            if c.value:
-                cells.append(c.value(obj))
-            else:
-                cells.append(getattr(obj, c.key, ""))
-        return cells
+        return list(self.get_compiled_columns().values(obj))
+
+    def get_row_url_templates(self, query: str = "") -> RowUrlTemplates | None:
+        if not self.row_url_routes:
+            return None
+        return RowUrlTemplates(self.row_url_routes, kwarg=self.row_url_kwarg, query=query)
 
     def row_urls(self, obj: Any, request: HttpRequest, params: CrudParams) -> dict:
-        """MVP: por defecto no define URLs. La app concreta debe sobrescribir."""
+        """URLs de acciones por fila.
 
-        return {"detail": None, "edit": "#", "delete": "#"}
+        Default: row_url_routes si está declarado; si no, sin URLs (la app puede sobrescribir).
+        """
+
+        templates = self.get_row_url_templates()
+        if templates is None:
+            return {"detail": None, "edit": "#", "delete": "#"}
+        return templates.for_pk(getattr(obj, "pk"))
 
     # --- Step 8 helpers (defaults deben calzar con Step 4) ---
     def get_create_form_class(self) -> Type[forms.ModelForm] | None:
@@ -258,38 +370,92 @@ class CrudConfig:
     def can_delete(self, request: HttpRequest) -> bool:
         return CrudPermissionSpec(self.permission_delete).is_allowed(request)
 
-    def build_items(self, page_obj, request: HttpRequest, params: CrudParams) -> list[dict]:
+    def build_items(self, page_obj, request: HttpRequest, params: CrudParams) -> list[Row]:
         data = {k: v for k, v in params.as_dict().items() if v not in {"", "all"}}
         qs_with_page = urlencode(data)
 
-        rows: list[dict] = []
+        compiled = self.get_compiled_columns()
+        # Respeta overrides de row_cells en subclases; si no, usa el extractor compilado.
+        row_values = compiled.values if type(self).row_cells is CrudConfig.row_cells else self.row_cells
+
+        # Rutas declarativas (sin override de row_urls): un reverse() por acción, no por fila.
+        # El querystring (incluye page, como en crud_example) ya va en el sufijo de la plantilla.
+        templates = None
+        if type(self).row_urls is CrudConfig.row_urls:
+            templates = self.get_row_url_templates(qs_with_page)
+        suffix = f"?{qs_with_page}" if qs_with_page else ""
+
+        rows: list[Row] = []
         for obj in page_obj.object_list:
-            urls = self.row_urls(obj, request, params)
-            # Preserva estado (incluye page) como en crud_example.
-            if qs_with_page:
-                for k in ("edit", "delete", "detail"):
-                    if urls.get(k) and urls[k] not in {"#", None} and "?" not in str(urls[k]):
-                        urls[k] = f"{urls[k]}?{qs_with_page}"
-
-            # Build rich cells with column definition
-            raw_cells = self.row_cells(obj)
-            rich_cells = []
-            for i, val in enumerate(raw_cells):
-                col = self.list_columns[i]
-                rich_cells.append({
-                    "value": val,
-                    "col": col.to_template_dict()
-                })
-
-            rows.append(
-                {
-                    "id": getattr(obj, "pk"),
-                    "cells": rich_cells,
-                    "urls": urls,
-                }
-            )
+            if isinstance(obj, dict):
+                # list_projection = "values": misma API por atributo que una instancia.
+                obj = ProjectedRow(obj)
+            pk = getattr(obj, "pk")
+            if templates is not None:
+                urls = templates.for_pk(pk)
+            else:
+                urls = self.row_urls(obj, request, params)
+                # Preserva estado (incluye page) como en crud_example.
+                if suffix:
+                    for k in ("edit", "delete", "detail"):
+                        if urls.get(k) and urls[k] not in {"#", None} and "?" not in str(urls[k]):
+                            urls[k] = f"{urls[k]}{suffix}"
+
+            rows.append(Row(pk, compiled.cells(row_values(obj)), urls))
         return rows
 
-    def paginate(self, qs: QuerySet, params: CrudParams):
-        paginator = Paginator(qs, self.page_size)
+    def is_keyset_paginated(self) -> bool:
+        return (self.pagination_mode or "").strip().lower() == "keyset"
+
+    def count_queryset(self, qs: QuerySet) -> CountResult:
+        return count_queryset(
+            qs,
+            strategy=self.count_strategy,
+            namespace=self.crud_slug,
+            ttl=self.count_cache_ttl,
+            estimate_threshold=self.count_estimate_threshold,
+        )
+
+    def count_for_list(self, qs: QuerySet) -> CountResult | None:
+        """Total del listado, o None si no se cuenta.
+
+        Keyset con count_strategy "exact": sin COUNT (uno exacto por página anularía el costo
+        constante del seek). Con "cached"/"estimated" el total sale amortizado y se muestra.
+        """
+
+        exact = (self.count_strategy or "exact").strip().lower() == "exact"
+        if self.is_keyset_paginated() and exact:
+            return None
+        return self.count_queryset(qs)
+
+    def paginate(
+        self,
+        qs: QuerySet,
+        params: CrudParams,
+        *,
+        total: CountResult | None = None,
+        page_size: int | None = None,
+    ):
+        """Pagina el queryset.
+
+        Si se entrega un `total` exacto, el Paginator lo reutiliza en lugar de lanzar su propio
+        COUNT. Un total estimado o cacheado no se usa como límite (filas nuevas quedarían fuera
+        o sobrarían páginas vacías): se pagina sin total (OffsetPage).
+        `page_size` permite a servicios/APIs pedir otro tamaño (default: self.page_size).
+        """
+
+        page_size = page_size or self.page_size
+        if self.is_keyset_paginated():
+            page = paginate_keyset(qs, cursor=params.cursor, page_size=page_size)
+            if page is not None:
+                return page
+            # Orden no compatible con keyset (sin pk final / expresiones): fallback a offset.
+
+        if total is not None and not total.is_exact:
+            return paginate_offset(qs, page=params.page, page_size=page_size)
+
+        paginator = Paginator(qs, page_size)
+        if total is not None:
+            # Paginator.count es cached_property: sembrarlo evita el segundo COUNT.
+            paginator.count = total.value
         return paginator.get_page(params.page or 1)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
+
+
+logger = logging.getLogger(__name__)
+
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_ESTIMATED = "estimated"
+
+COUNT_STRATEGIES = {COUNT_EXACT, COUNT_CACHED, COUNT_ESTIMATED}
+
+# Versión por namespace (crud_slug): la firma de cada conteo cacheado la incluye, así que
+# invalidate_counts() descarta todos los filtros del CRUD de una vez.
+_VERSION_KEY = "crud:count:{namespace}:v"
+
+
+def humanize_count(value: int) -> str:
+    """1234 -> "1.2K", 1_234_567 -> "1.2M" (sin ceros decimales sobrantes)."""
+
+    for threshold, suffix in ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K")):
+        if value >= threshold:
+            return f"{value / threshold:.1f}".rstrip("0").rstrip(".") + suffix
+    return str(value)
+
+
+@dataclass(frozen=True)
+class CountResult:
+    value: int
+    is_estimate: bool = False
+    cached: bool = False  # servido desde el cache (puede no reflejar altas/bajas recientes)
+
+    @property
+    def is_exact(self) -> bool:
+        """COUNT(*) de este request: se puede usar como límite del Paginator."""
+
+        return not (self.is_estimate or self.cached)
+
+    @property
+    def display(self) -> str:
+        if self.is_estimate:
+            return f"~{humanize_count(self.value)}"
+        return str(self.value)
+
+
+def _signature(qs: QuerySet, *, namespace: str) -> str:
+    """Firma estable del filtro: SQL + params del COUNT (sin ordering)."""
+
+    sql, params = qs.order_by().query.sql_with_params()
+    raw = json.dumps([qs.db, sql, [str(p) for p in params]], separators=(",", ":"))
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    version = cache.get(_VERSION_KEY.format(namespace=namespace)) or 0
+    return f"crud:count:{namespace}:{version}:{digest}"
+
+
+def invalidate_counts(namespace: str) -> None:
+    """Descarta los conteos cacheados de un CRUD (altas/bajas: ver registry.register_crud)."""
+
+    key = _VERSION_KEY.format(namespace=namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def exact_count(qs: QuerySet) -> CountResult:
+    return CountResult(qs.count())
+
+
+def cached_count(qs: QuerySet, *, namespace: str, ttl: int) -> CountResult:
+    key = _signature(qs, namespace=namespace)
+    value = cache.get(key)
+    if value is None:
+        value = qs.count()
+        cache.set(key, value, ttl)
+        return CountResult(int(value))
+    return CountResult(int(value), cached=True)
+
+
+def planner_estimate(qs: QuerySet) -> int | None:
+    """Filas estimadas por el planner (PostgreSQL). None si el backend no lo soporta."""
+
+    connection = connections[qs.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    sql, params = qs.order_by().query.sql_with_params()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+    except Exception:
+        logger.warning("No se pudo estimar el conteo vía EXPLAIN", exc_info=True)
+        return None
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+def count_queryset(
+    qs: QuerySet,
+    *,
+    strategy: str,
+    namespace: str,
+    ttl: int,
+    estimate_threshold: int,
+) -> CountResult:
+    """Cuenta según estrategia.
+
+    - exact: COUNT(*) en cada request.
+    - cached: COUNT(*) cacheado por firma de filtro durante `ttl` segundos.
+    - estimated: estimación del planner; si queda bajo `estimate_threshold`
+      (o el backend no estima) se usa el conteo cacheado exacto.
+    """
+
+    strategy = (strategy or COUNT_EXACT).strip().lower()
+    if strategy not in COUNT_STRATEGIES:
+        raise ValueError(f"count_strategy inválido: {strategy}")
+
+    if strategy == COUNT_EXACT:
+        return exact_count(qs)
+
+    if strategy == COUNT_ESTIMATED:
+        estimate = planner_estimate(qs)
+        if estimate is not None and estimate >= estimate_threshold:
+            return CountResult(estimate, is_estimate=True)
+
+    return cached_count(qs, namespace=namespace, ttl=ttl)
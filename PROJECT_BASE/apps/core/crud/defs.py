@@ -21,6 +21,10 @@ class ColumnDef:
     - extra: configuración extra para el tipo (ej: mapa de colores para badge)
     - order_by: campo(s) reales para QuerySet.order_by
     - value: función que produce el string final para la celda
+    - attr: path de atributo ("name", "user.email" o "user__email"); alternativa
+      declarativa a value que se compila a operator.attrgetter (sin lambda por celda).
+      Si no se declara ni value ni attr, se usa key.
+    - fields: paths ORM que lee la columna (requerido para proyectar columnas con value)
     """
 
     key: str
@@ -32,6 +36,29 @@ class ColumnDef:
 
     order_by: str | tuple[str, ...] | None = None
     value: ValueFunc | None = None
+    attr: str | None = None
+    fields: tuple[str, ...] | None = None
+
+    def attr_path(self) -> str:
+        """Path de atributo en notación de punto (para attrgetter)."""
+        return (self.attr or self.key).replace("__", ".")
+
+    def required_fields(self) -> tuple[str, ...] | None:
+        """Paths ORM que necesita la columna. None si no se pueden inferir (value sin fields)."""
+
+        if self.fields is not None:
+            needed = list(self.fields)
+        elif self.value is None:
+            needed = [(self.attr or self.key).replace(".", "__")]
+        else:
+            return None
+
+        order_by = self.order_by
+        if isinstance(order_by, str):
+            needed.append(order_by)
+        elif order_by:
+            needed.extend(order_by)
+        return tuple(needed)
 
     def to_template_dict(self) -> dict:
         return {
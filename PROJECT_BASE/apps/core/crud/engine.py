@@ -1,10 +1,26 @@
 from __future__ import annotations
 
 from django.http import HttpRequest
+from django.urls import reverse
+
+from apps.core.services.exporting import EXPORT_FORMATS
 
 from .config import CrudConfig
 
 
+def build_export_jobs(config: CrudConfig, request: HttpRequest) -> list[dict]:
+    """Formatos que se ofrecen como export en segundo plano (apps.core.exports)."""
+
+    if not (config.is_export_enabled() and config.exports_declared() and config.can_export(request)):
+        return []
+    url = reverse("exports:start", args=[config.crud_slug])
+    return [
+        {"format": fmt, "label": EXPORT_FORMATS[fmt].label, "url": url}
+        for fmt in config.export_async_formats
+        if fmt in EXPORT_FORMATS and config.allows_async_format(fmt)
+    ]
+
+
 def build_list_context(
     *,
     config: CrudConfig,
@@ -18,7 +34,11 @@ def build_list_context(
 
     params = config.parse_params(request)
     qs = config.queryset_for_list(request, params)
-    page_obj = config.paginate(qs, params)
+    # Solo los campos que pintan las columnas (opt-in vía list_projection).
+    qs = config.apply_projection(qs)
+    # Un solo conteo por request (ninguno en keyset exacto): el Paginator reutiliza el mismo total.
+    total = config.count_for_list(qs)
+    page_obj = config.paginate(qs, params, total=total)
 
     return {
         "crud_urls": crud_urls,
@@ -30,6 +50,9 @@ def build_list_context(
         "columns": config.columns_for_template(),
         "items": config.build_items(page_obj, request, params),
         "page_obj": page_obj,
-        "total_count": qs.count(),
+        "total_count": total.value if total else None,
+        "total_count_display": total.display if total else "",
+        "total_count_is_estimate": bool(total and total.is_estimate),
         "qs": config.build_qs_without_page(params),
+        "export_jobs": build_export_jobs(config, request),
     }
@@ -0,0 +1,176 @@
+"""Export genérico por CrudConfig: un solo endpoint con negociación de formato.
+
+Uso (urls.py de la app):
+
+    export_view = crud_export_view(CRUD_SLUG_ITEM)
+
+    path("export/", export_view, name="export"),                        # ?format= o Accept
+    path("export/csv/", export_view, {"fmt": "csv"}, name="export_csv"),
+
+Todo sale del CrudConfig: permisos (can_export), formatos (export_formats), campos/headers,
+queryset con los mismos filtros/orden del listado (queryset_for_list) y nombre de archivo.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from django.core.exceptions import ImproperlyConfigured
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseForbidden,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBase
+from django.shortcuts import redirect
+from django.views.decorators.http import require_http_methods
+
+from apps.core.exports.services import clean_query, start_export
+from apps.core.queries import count_queries
+from apps.core.services import ExecutionContext
+from apps.core.services.instrumentation import instrument_response
+from apps.core.services.exporting import (
+    EXPORT_FORMATS,
+    ExportLimitExceeded,
+    accepts_gzip,
+    export_filename,
+    export_response,
+    export_schema,
+)
+
+from .config import CrudConfig
+from .registry import get_crud
+
+
+_MEDIA_TYPES = {f.content_type.split(";")[0].strip(): key for key, f in EXPORT_FORMATS.items()}
+
+
+def negotiate_format(
+    request: HttpRequest,
+    config: CrudConfig,
+    fmt: str | None = None,
+    *,
+    default_format: str = "csv",
+) -> str | None:
+    """Formato pedido: kwarg de URL > ?format= > header Accept (en orden del cliente) > default.
+
+    None si el Accept no admite ningún formato permitido (-> 406).
+    """
+
+    explicit = fmt or request.GET.get("format")
+    if explicit:
+        return explicit.strip().lower()
+
+    accept = request.headers.get("Accept") or ""
+    if not accept:
+        return default_format
+
+    ranked: list[tuple[float, int, str]] = []
+    for index, item in enumerate(accept.split(",")):
+        media, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            ranked.append((-quality, index, media.lower()))
+
+    for _, _, media in sorted(ranked):
+        if media in {"*/*", "text/*", "application/*"}:
+            return default_format
+        candidate = _MEDIA_TYPES.get(media)
+        if candidate and config.allows_format(candidate):
+            return candidate
+    return None
+
+
+def _check_export_fields(config: CrudConfig, queryset, fields: list[str]) -> None:
+    """Los paths `a__b` se resuelven con JOINs en el mismo values_list (una sola query, sin N+1).
+
+    Se validan antes de empezar a transmitir: un campo inválido a mitad del stream dejaría
+    un archivo truncado en vez de un error.
+    """
+
+    invalid = [path for path, field in export_schema(queryset, fields) if field is None]
+    if invalid:
+        raise ImproperlyConfigured(f"{config.crud_slug}: export_fields inválidos: {', '.join(invalid)}")
+
+
+def crud_export_view(slug: str, *, default_format: str = "csv") -> Callable[..., HttpResponseBase]:
+    """Construye el view de export de un CRUD registrado (ver docstring del módulo)."""
+
+    @require_http_methods(["GET", "HEAD"])
+    def export_view(request: HttpRequest, fmt: str | None = None) -> HttpResponseBase:
+        config = get_crud(slug)
+        if not config.can_export(request):
+            return HttpResponseForbidden("Forbidden")
+        if not config.is_export_enabled():
+            return HttpResponseForbidden("Export disabled")
+
+        chosen = negotiate_format(request, config, fmt, default_format=default_format)
+        if chosen is None:
+            return HttpResponse("Not Acceptable", status=406)
+        if chosen not in EXPORT_FORMATS or not config.allows_format(chosen):
+            return HttpResponseForbidden("Format not allowed")
+
+        fields = config.get_export_fields()
+        headers = config.get_export_headers()
+        if not fields or not headers:
+            raise ImproperlyConfigured(f"{slug}: export_fields no declarado")
+
+        params = config.parse_params(request)
+        qs = config.queryset_for_list(request=request, params=params)
+        _check_export_fields(config, qs, fields)
+
+        export_format = EXPORT_FORMATS[chosen]
+        if request.method == "HEAD":
+            # Solo metadatos: no se recorre la base ni se arma el archivo, así que el tamaño no
+            # se conoce. Streaming vacío: sin Content-Length (CommonMiddleware pondría 0).
+            head = StreamingHttpResponse(iter(()), content_type=export_format.content_type)
+            filename = export_filename(config.get_export_filename_base(request), export_format.ext)
+            head["Content-Disposition"] = f'attachment; filename="{filename}"'
+            head["Accept-Ranges"] = "none"
+            return head
+
+        started = time.perf_counter()
+        try:
+            with count_queries() as queries:
+                resp = export_response(
+                    chosen,
+                    queryset=qs,
+                    fields=fields,
+                    headers=headers,
+                    filename_base=config.get_export_filename_base(request),
+                    title=config.get_export_title(),
+                    compress=accepts_gzip(request),
+                )
+        except ExportLimitExceeded:
+            # Demasiadas filas para el request: mismo export, en segundo plano.
+            job = start_export(
+                user=request.user,
+                organization=getattr(request, "organization", None),
+                source=slug,
+                fmt=chosen,
+                query=clean_query(request.GET),
+            )
+            return redirect("exports:status", job_id=job.pk)
+
+        # Sin Range: cada request arma el archivo de nuevo y XLSX/PDF llevan timestamps, así que
+        # dos builds no son byte a byte iguales (un resume mezclaría archivos distintos).
+        resp["Accept-Ranges"] = "none"
+        # Tiempo y queries del export (incluido el stream) como service "export.<slug>.<formato>".
+        return instrument_response(
+            resp,
+            service=f"export.{slug}.{chosen}",
+            started=started,
+            queries=queries,
+            request_id=ExecutionContext.for_request(request).request_id,
+        )
+
+    export_view.__name__ = f"export_{slug.replace('.', '_')}"
+    return export_view
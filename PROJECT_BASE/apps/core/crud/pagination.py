@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Model, Q, QuerySet
+
+
+class KeysetPage:
+    """Página keyset (seek) compatible con el contrato de templates/crud/*.
+
+    Expone la misma API mínima que `django.core.paginator.Page` usada por los
+    templates (object_list, has_next, has_previous, has_other_pages) más los
+    cursores opacos `next_cursor` / `previous_cursor`.
+
+    No hay número de página ni total: cada página cuesta lo mismo sin importar
+    la profundidad (no hay OFFSET).
+    """
+
+    is_keyset = True
+    number = None
+    paginator = None
+
+    def __init__(
+        self,
+        object_list: list[Any],
+        *,
+        next_cursor: str | None,
+        previous_cursor: str | None,
+    ) -> None:
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self) -> bool:
+        return bool(self.next_cursor)
+
+    def has_previous(self) -> bool:
+        return bool(self.previous_cursor)
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class OffsetPage:
+    """Página por OFFSET sin total conocido (conteo estimado o cacheado).
+
+    Misma API que `django.core.paginator.Page` para los templates, pero sin Paginator: el
+    total no limita el slice (trae page_size + 1 filas para saber si hay siguiente), así que
+    un conteo viejo o estimado no esconde filas ni deja páginas vacías al final.
+    """
+
+    is_keyset = False
+    paginator = None
+
+    def __init__(self, object_list: list[Any], *, number: int, has_next: bool) -> None:
+        self.object_list = object_list
+        self.number = number
+        self._has_next = has_next
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self.number > 1
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+    def next_page_number(self) -> int:
+        return self.number + 1
+
+    def previous_page_number(self) -> int:
+        return self.number - 1
+
+
+def paginate_offset(qs: QuerySet, *, page: Any, page_size: int) -> OffsetPage:
+    try:
+        number = max(int(page or 1), 1)
+    except (TypeError, ValueError):
+        number = 1
+    offset = (number - 1) * page_size
+    rows = list(qs[offset : offset + page_size + 1])
+    return OffsetPage(rows[:page_size], number=number, has_next=len(rows) > page_size)
+
+
+# --- Cursores opacos ---
+# Formato: base64-url(JSON{"d": "n"|"p", "v": [valores tipados]}).
+# Los tipos no nativos de JSON se etiquetan para reconstruirlos sin pérdida
+# (p.ej. microsegundos en datetimes, que DjangoJSONEncoder trunca).
+# El cursor viene del cliente: solo se aceptan escalares JSON (no null) o valores etiquetados.
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"t": "dt", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"t": "d", "v": value.isoformat()}
+    if isinstance(value, time):
+        return {"t": "tm", "v": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"t": "dec", "v": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"t": "uuid", "v": str(value)}
+    return value
+
+
+def _decode_value(raw: Any) -> Any:
+    if isinstance(raw, (str, int, float)):
+        return raw
+    if not isinstance(raw, dict) or not isinstance(raw.get("v"), str):
+        # null, listas u objetos arbitrarios: cursor adulterado.
+        raise ValueError("Valor de cursor inválido")
+    kind = raw.get("t")
+    value = raw["v"]
+    if kind == "dt":
+        return datetime.fromisoformat(value)
+    if kind == "d":
+        return date.fromisoformat(value)
+    if kind == "tm":
+        return time.fromisoformat(value)
+    if kind == "dec":
+        return Decimal(value)
+    if kind == "uuid":
+        return uuid.UUID(value)
+    raise ValueError("Tipo de cursor desconocido")
+
+
+def encode_cursor(values: list[Any], *, direction: str) -> str:
+    payload = {"d": direction, "v": [_encode_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, list[Any]] | None:
+    """Decodifica un cursor. Retorna None si es inválido (se trata como primera página)."""
+
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        direction = payload["d"]
+        raw_values = payload["v"]
+        if direction not in {"n", "p"} or not isinstance(raw_values, list) or not raw_values:
+            return None
+        values = [_decode_value(v) for v in raw_values]
+    except (binascii.Error, InvalidOperation, KeyError, TypeError, ValueError, UnicodeError):
+        return None
+    return direction, values
+
+
+# --- Seek ---
+
+def _seek_field(model: type[Model], name: str) -> str | None:
+    """Campo a comparar en el seek para `name`; None si no es una columna NOT NULL del modelo.
+
+    NULL no es comparable con > / < (el seek perdería filas), y una FK se compara por su
+    columna `<fk>_id` (el valor del cursor tiene que ser serializable, no una instancia).
+    """
+
+    if name == "pk":
+        return name
+    opts = model._meta
+    parts = name.split("__")
+    field = None
+    for i, part in enumerate(parts):
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            return None  # anotaciones / expresiones: nulabilidad desconocida
+        if field.null or field.many_to_many or field.one_to_many:
+            return None
+        if i < len(parts) - 1:
+            if not field.is_relation:
+                return None
+            opts = field.related_model._meta
+    if field.is_relation and parts[-1] != field.attname:
+        # order_by("fk") ordena por el Meta.ordering del modelo relacionado si lo tiene.
+        if field.related_model._meta.ordering:
+            return None
+        return f"{name}_id"
+    return name
+
+
+def _parse_ordering(ordering: tuple[Any, ...], model: type[Model]) -> list[tuple[str, bool]] | None:
+    """Convierte order_by ("-name", "-pk") en [(campo, desc)]. None si no es keyset-compatible."""
+
+    fields: list[tuple[str, bool]] = []
+    for item in ordering:
+        if not isinstance(item, str) or item == "?":
+            return None
+        desc = item.startswith("-")
+        name = _seek_field(model, item.lstrip("-+"))
+        if name is None:
+            return None
+        fields.append((name, desc))
+
+    if not fields or fields[-1][0] not in {"pk", "id"}:
+        # Sin tie-breaker único no hay orden total: no se puede paginar por keyset.
+        return None
+    return fields
+
+
+def _resolve(obj: Any, path: str) -> Any:
+    if isinstance(obj, dict) and path in obj:
+        # Filas de values(): claves planas ("user__email").
+        return obj[path]
+    value = obj
+    for part in path.split("__"):
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = value.get(part)
+        else:
+            value = getattr(value, part)
+    return value
+
+
+def _seek_filter(fields: list[tuple[str, bool]], values: list[Any], *, forward: bool) -> Q:
+    """(f1 > v1) OR (f1 = v1 AND f2 > v2) OR ... respetando la dirección de cada campo."""
+
+    condition = Q()
+    equal_prefix = Q()
+    for (name, desc), value in zip(fields, values):
+        # asc+forward -> gt; desc+forward -> lt; backward invierte.
+        lookup = "lt" if desc == forward else "gt"
+        condition |= equal_prefix & Q(**{f"{name}__{lookup}": value})
+        equal_prefix &= Q(**{name: value})
+    return condition
+
+
+def paginate_keyset(qs: QuerySet, *, cursor: str, page_size: int) -> KeysetPage | None:
+    """Pagina un queryset ordenado usando seek sobre su order_by.
+
+    Requisitos:
+    - qs debe estar ordenado y terminar en pk (CrudConfig.apply_ordering lo garantiza).
+    - Las columnas de orden deben ser campos NOT NULL (NULL no es comparable con > / <).
+
+    Retorna None si el queryset no es compatible (el caller hace fallback a offset).
+    Un cursor inválido o adulterado se trata como primera página.
+    """
+
+    fields = _parse_ordering(tuple(qs.query.order_by), qs.model)
+    if fields is None:
+        return None
+
+    decoded = decode_cursor(cursor)
+    if decoded and len(decoded[1]) != len(fields):
+        # Cursor de otro orden (p.ej. cambió sort): empezar desde el inicio.
+        decoded = None
+
+    direction, values = decoded if decoded else ("n", [])
+    forward = direction == "n"
+
+    page_qs = qs
+    if values:
+        try:
+            page_qs = page_qs.filter(_seek_filter(fields, values, forward=forward))
+        except (TypeError, ValueError, ValidationError):
+            # Valores de otro tipo que la columna (p.ej. texto para pk): primera página.
+            page_qs, values, forward = qs, [], True
+    if not forward:
+        page_qs = page_qs.reverse()
+
+    rows = list(page_qs[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if not forward:
+        rows.reverse()
+
+    if not rows:
+        return KeysetPage([], next_cursor=None, previous_cursor=None)
+
+    def _key(obj: Any) -> list[Any]:
+        return [_resolve(obj, name) for name, _ in fields]
+
+    if forward:
+        has_next = has_more
+        has_previous = bool(values)
+    else:
+        has_next = True
+        has_previous = has_more
+
+    return KeysetPage(
+        rows,
+        next_cursor=encode_cursor(_key(rows[-1]), direction="n") if has_next else None,
+        previous_cursor=encode_cursor(_key(rows[0]), direction="p") if has_previous else None,
+    )
@@ -1,10 +1,80 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 from django.http import HttpRequest
 
 
+# Memo por request: {(spec, user_pk, org_pk): bool}.
+# Vive en el objeto request, así que nunca sobrevive al ciclo de request/response.
+_REQUEST_CACHE_ATTR = "_permission_decisions"
+
+
+def _active_org(request: HttpRequest, user: Any) -> Any:
+    # Org activa (sesión) si el middleware/decorator la resolvió; si no, la org por defecto del user.
+    # request.organization puede ser un SimpleLazyObject (ActiveOrganizationMiddleware): usar truthiness.
+    org = getattr(request, "organization", None)
+    if not org:
+        org = getattr(user, "current_org", None)
+    return org
+
+
+def _decide(raw: str, user: Any, org: Any) -> bool:
+    if raw.startswith("role:"):
+        roles = {r.strip() for r in raw[len("role:") :].split(",") if r.strip()}
+        if not roles or org is None:
+            return False
+        try:
+            from apps.orgs.services import user_has_org_role
+
+            return user_has_org_role(user, roles=roles, organization=org)
+        except Exception:
+            return False
+
+    # Django permission string: "app_label.codename" (ej: "crud_example.view_item")
+    return bool(getattr(user, "has_perm", lambda p: False)(raw))
+
+
+def has_permission(request: HttpRequest, spec: str | None) -> bool:
+    """Resuelve un spec de permiso con memo por request.
+
+    Clave: (spec, usuario, org activa). Cada permiso distinto se resuelve como
+    máximo una vez por render, aunque lo consulten el engine, la navegación,
+    las vistas y los templates (p.ej. por fila).
+    """
+
+    if not spec:
+        return True
+
+    user = getattr(request, "user", None)
+    if not user or not getattr(user, "is_authenticated", False):
+        return False
+
+    raw = spec.strip()
+    needs_org = raw.startswith("role:")
+    org = _active_org(request, user) if needs_org else None
+    key = (raw, user.pk, getattr(org, "pk", None))
+
+    cache = getattr(request, _REQUEST_CACHE_ATTR, None)
+    if cache is None:
+        cache = {}
+        setattr(request, _REQUEST_CACHE_ATTR, cache)
+    elif key in cache:
+        return cache[key]
+
+    allowed = _decide(raw, user, org)
+    cache[key] = allowed
+    return allowed
+
+
+def clear_permission_cache(request: HttpRequest) -> None:
+    """Descarta las decisiones memorizadas (p.ej. tras cambiar el rol del propio usuario)."""
+
+    if hasattr(request, _REQUEST_CACHE_ATTR):
+        delattr(request, _REQUEST_CACHE_ATTR)
+
+
 @dataclass(frozen=True)
 class CrudPermissionSpec:
     """Spec mínimo (Step 9) para permisos declarativos.
@@ -13,29 +83,11 @@ class CrudPermissionSpec:
     - None: permitido
     - "app_label.codename": usa user.has_perm
     - "role:owner,admin": requiere rol en org actual
+
+    Las decisiones se memorizan por request (ver has_permission).
     """
 
     value: str | None
 
     def is_allowed(self, request: HttpRequest) -> bool:
-        if not self.value:
-            return True
-
-        user = getattr(request, "user", None)
-        if not user or not getattr(user, "is_authenticated", False):
-            return False
-
-        raw = self.value.strip()
-        if raw.startswith("role:"):
-            roles = {r.strip() for r in raw[len("role:") :].split(",") if r.strip()}
-            if not roles:
-                return False
-            try:
-                from apps.orgs.services import user_has_org_role
-
-                return user_has_org_role(user, roles=roles)
-            except Exception:
-                return False
-
-        # Django permission string: "app_label.codename" (ej: "crud_example.view_item")
-        return bool(getattr(user, "has_perm", lambda p: False)(raw))
+        return has_permission(request, self.value)
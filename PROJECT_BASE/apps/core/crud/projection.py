@@ -0,0 +1,154 @@
+"""Proyección de campos para querysets de listado (only()/values()).
+
+A partir de las columnas declaradas se infiere qué campos necesita realmente la tabla:
+- ColumnDef.fields (declaración explícita, requerida si la columna usa un lambda `value`)
+- ColumnDef.attr / key (columnas declarativas)
+- ColumnDef.order_by
+- CrudConfig.list_extra_fields (lo que necesiten row_urls u overrides)
+
+Paths con relaciones FK/O2O agregan select_related; relaciones múltiples (M2M/reverse)
+agregan prefetch_related. Si algún campo no se puede resolver (p.ej. un lambda sin
+`fields`, o una property), no se proyecta: se carga el modelo completo como siempre.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import QuerySet
+
+
+logger = logging.getLogger(__name__)
+
+PROJECTION_ONLY = "only"
+PROJECTION_VALUES = "values"
+
+
+@dataclass(frozen=True)
+class Projection:
+    fields: tuple[str, ...]
+    select_related: tuple[str, ...]
+    prefetch_related: tuple[str, ...]
+
+    @property
+    def supports_values(self) -> bool:
+        # values() aplana relaciones múltiples (duplica filas): solo sin prefetch.
+        return not self.prefetch_related
+
+
+class ProjectedRow:
+    """Fila de values() con acceso por atributo ("row.user.email" lee "user__email").
+
+    Permite que row_urls/attrgetter funcionen igual que con instancias del modelo.
+    """
+
+    __slots__ = ("_data", "_prefix")
+
+    def __init__(self, data: dict[str, Any], prefix: str = "") -> None:
+        self._data = data
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> Any:
+        key = f"{self._prefix}{name}"
+        data = self._data
+        if key in data:
+            return data[key]
+        nested = f"{key}__"
+        if any(k.startswith(nested) for k in data):
+            return ProjectedRow(data, nested)
+        raise AttributeError(name)
+
+    def __repr__(self) -> str:
+        return f"ProjectedRow({self._data!r})"
+
+
+def _prefetch_path(model: type[models.Model], parts: list[str], start: int) -> str:
+    """Path de prefetch hasta la última relación del path ("tags__owner__name" -> "tags__owner")."""
+
+    last_relation = start
+    current = model
+    for i in range(start + 1, len(parts)):
+        field = current._meta.get_field(parts[i])
+        if not field.is_relation:
+            if i != len(parts) - 1:
+                raise ValueError(f"path inválido: {'__'.join(parts)}")
+            break
+        last_relation = i
+        current = field.related_model
+    return "__".join(parts[: last_relation + 1])
+
+
+def _resolve(model: type[models.Model], path: str) -> tuple[str | None, str | None, str | None]:
+    """Clasifica un path -> (campo para only/values, select_related, prefetch_related).
+
+    Lanza FieldDoesNotExist/ValueError si el path no es un campo real.
+    """
+
+    parts = path.split("__")
+    current = model
+    for i, part in enumerate(parts):
+        field = current._meta.pk if part == "pk" else current._meta.get_field(part)
+        is_last = i == len(parts) - 1
+
+        if not field.is_relation:
+            if not is_last:
+                raise ValueError(f"path inválido: {path}")
+            related = "__".join(parts[:-1]) or None
+            return path, related, None
+
+        if field.many_to_many or field.one_to_many or not field.concrete:
+            # Relación múltiple / reverse: se resuelve vía prefetch, no en el SELECT principal.
+            return None, None, _prefetch_path(field.related_model, parts, i)
+
+        if is_last:
+            # FK terminal: en only()/values() trae el id.
+            return path, "__".join(parts[:-1]) or None, None
+        current = field.related_model
+
+    raise ValueError(f"path inválido: {path}")
+
+
+def build_projection(model: type[models.Model], paths: Iterable[str] | None) -> Projection | None:
+    if paths is None:
+        return None
+
+    fields: list[str] = ["pk"]
+    select_related: list[str] = []
+    prefetch_related: list[str] = []
+    for path in paths:
+        if not path:
+            continue
+        try:
+            field, related, prefetch = _resolve(model, path.replace(".", "__"))
+        except (FieldDoesNotExist, ValueError):
+            logger.debug("Proyección deshabilitada: campo no resoluble %s.%s", model.__name__, path)
+            return None
+        for value, bucket in ((field, fields), (related, select_related), (prefetch, prefetch_related)):
+            if value and value not in bucket:
+                bucket.append(value)
+
+    return Projection(
+        fields=tuple(fields),
+        select_related=tuple(select_related),
+        prefetch_related=tuple(prefetch_related),
+    )
+
+
+def apply_projection(qs: QuerySet, projection: Projection | None, *, mode: str | None) -> QuerySet:
+    mode = (mode or "").strip().lower()
+    if projection is None or mode not in {PROJECTION_ONLY, PROJECTION_VALUES}:
+        return qs
+
+    if mode == PROJECTION_VALUES and projection.supports_values:
+        return qs.values(*projection.fields)
+
+    if projection.select_related:
+        qs = qs.select_related(*projection.select_related)
+    if projection.prefetch_related:
+        qs = qs.prefetch_related(*projection.prefetch_related)
+    # only() no acepta "pk" como alias en todos los casos; el pk siempre se carga.
+    return qs.only(*[f for f in projection.fields if f != "pk"])
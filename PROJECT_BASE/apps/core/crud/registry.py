@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from typing import Dict
 
+from django.db.models.signals import post_delete, post_save
+
 from .config import CrudConfig
+from .counting import COUNT_EXACT, invalidate_counts
+from .search import register_search_index
 
 
 _CRUDS: Dict[str, CrudConfig] = {}
@@ -20,6 +24,27 @@ def register_crud(config: CrudConfig) -> None:
 
     _CRUDS[slug] = config
 
+    if config.search_fields and getattr(config, "model", None) is not None:
+        register_search_index(config.model, config.search_fields, backend=config.search_backend)
+
+    if (config.count_strategy or COUNT_EXACT).strip().lower() != COUNT_EXACT:
+        _connect_count_invalidation(config)
+
+
+def _connect_count_invalidation(config: CrudConfig) -> None:
+    """Altas/bajas (y cambios que muevan filas entre filtros) descartan los conteos cacheados."""
+
+    model = getattr(config, "model", None)
+    if model is None:
+        return
+
+    def receiver(sender, **kwargs) -> None:
+        invalidate_counts(config.crud_slug)
+
+    uid = f"crud-count:{config.crud_slug}"
+    post_save.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+
 
 def get_crud(slug: str) -> CrudConfig:
     config = _CRUDS.get(slug)
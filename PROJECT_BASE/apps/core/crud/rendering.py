@@ -0,0 +1,84 @@
+"""Pipeline compilado de render de filas para el CRUD Kit.
+
+Las columnas se "congelan" una vez por config:
+- metadata de template: un mapping inmutable por columna, compartido por todas las celdas
+- valores: operator.attrgetter para columnas declarativas (attr / key), que en el caso
+  común resuelve la fila completa en una sola llamada C en vez de un lambda por celda.
+
+Cada fila se emite como tuplas compactas (Row/Cell) con la misma API que usan
+los templates (item.id, item.cells, item.urls, cell.value, cell.col.*).
+"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, Sequence
+
+from .defs import ColumnDef
+
+
+class Cell(NamedTuple):
+    value: Any
+    col: Mapping[str, Any]
+
+
+class Row(NamedTuple):
+    id: Any
+    cells: tuple[Cell, ...]
+    urls: dict
+
+
+def _safe_attr(key: str) -> Callable[[Any], Any]:
+    # Semántica legacy de row_cells: getattr(obj, key, "").
+    getter = attrgetter(key)
+
+    def _get(obj: Any) -> Any:
+        try:
+            return getter(obj)
+        except AttributeError:
+            return ""
+
+    return _get
+
+
+class CompiledColumns:
+    """Metadata + extractores de valores precomputados para una lista de ColumnDef."""
+
+    __slots__ = ("columns", "_getters", "_row_getter")
+
+    def __init__(self, list_columns: Sequence[ColumnDef]) -> None:
+        self.columns: tuple[Mapping[str, Any], ...] = tuple(
+            MappingProxyType(c.to_template_dict()) for c in list_columns
+        )
+
+        getters: list[Callable[[Any], Any]] = []
+        paths: list[str] = []
+        for c in list_columns:
+            if c.value is not None:
+                getters.append(c.value)
+                continue
+            path = c.attr_path()
+            paths.append(path)
+            getters.append(_safe_attr(path))
+        self._getters = tuple(getters)
+
+        # Fast path: todas las columnas son atributos -> un solo attrgetter por fila.
+        self._row_getter: Callable[[Any], tuple] | None = None
+        if paths and len(paths) == len(getters):
+            many = attrgetter(*paths)
+            self._row_getter = many if len(paths) > 1 else (lambda obj: (many(obj),))
+
+    def values(self, obj: Any) -> tuple:
+        if self._row_getter is not None:
+            try:
+                return self._row_getter(obj)
+            except AttributeError:
+                pass  # algún atributo faltante: caer al camino por columna ("" por celda)
+        return tuple(g(obj) for g in self._getters)
+
+    def cells(self, values: Sequence[Any]) -> tuple[Cell, ...]:
+        return tuple(map(Cell, values, self.columns))
+
+    def render(self, obj: Any) -> tuple[Cell, ...]:
+        return tuple(map(Cell, self.values(obj), self.columns))
@@ -0,0 +1,81 @@
+"""Plantillas de URL por fila para el CRUD Kit.
+
+reverse() recorre el resolver completo en cada llamada. En una tabla de 100 filas
+con 2-3 acciones eso son cientos de reverse() idénticos salvo por el pk.
+
+Aquí cada ruta se resuelve una sola vez (por request) con un pk centinela y se
+parte en (prefijo, sufijo); cada fila solo concatena `prefijo + pk + sufijo`.
+El querystring compartido (estado de la tabla) se agrega al sufijo una sola vez.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Mapping
+from urllib.parse import quote
+
+from django.urls import NoReverseMatch, reverse
+from django.utils.http import RFC3986_SUBDELIMS
+
+
+# Centinelas que aceptan los converters estándar (int/str/slug/path y uuid).
+_SENTINELS: tuple[str, ...] = (
+    "8675309123",
+    str(uuid.UUID("8675309a-0000-4000-8000-00000000cafe")),
+)
+
+_SAFE_CHARS = RFC3986_SUBDELIMS + "/~:@"
+
+
+class UrlTemplate:
+    """Una ruta con kwarg de pk, resuelta una vez: format(pk) -> URL."""
+
+    __slots__ = ("prefix", "suffix")
+
+    def __init__(self, prefix: str, suffix: str) -> None:
+        self.prefix = prefix
+        self.suffix = suffix
+
+    @classmethod
+    def compile(cls, route: str, *, kwarg: str = "id", query: str = "") -> "UrlTemplate":
+        for sentinel in _SENTINELS:
+            try:
+                url = reverse(route, kwargs={kwarg: sentinel})
+            except NoReverseMatch:
+                continue
+            if url.count(sentinel) != 1:
+                continue
+            prefix, suffix = url.split(sentinel)
+            if query and "?" not in suffix:
+                suffix = f"{suffix}?{query}"
+            return cls(prefix, suffix)
+        raise NoReverseMatch(f"No se pudo compilar la ruta '{route}' con kwarg '{kwarg}'.")
+
+    def format(self, pk: Any) -> str:
+        if isinstance(pk, int):
+            value = str(pk)
+        else:
+            # Mismo escapado que aplica reverse() a los argumentos.
+            value = quote(str(pk), safe=_SAFE_CHARS)
+        return f"{self.prefix}{value}{self.suffix}"
+
+
+class RowUrlTemplates:
+    """Conjunto de acciones por fila ({"edit": ruta, "detail": None, ...}) precompiladas."""
+
+    __slots__ = ("_templates", "_static")
+
+    def __init__(self, routes: Mapping[str, str | None], *, kwarg: str = "id", query: str = "") -> None:
+        self._templates: tuple[tuple[str, UrlTemplate], ...] = tuple(
+            (action, UrlTemplate.compile(route, kwarg=kwarg, query=query))
+            for action, route in routes.items()
+            if route
+        )
+        # Acciones declaradas sin ruta (p.ej. detail=None): se mantienen en el dict.
+        self._static = {action: None for action, route in routes.items() if not route}
+
+    def for_pk(self, pk: Any) -> dict:
+        urls = dict(self._static)
+        for action, template in self._templates:
+            urls[action] = template.format(pk)
+        return urls
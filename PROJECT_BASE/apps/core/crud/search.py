@@ -0,0 +1,421 @@
+"""Backends de búsqueda para CrudConfig.search_fields (y servicios que los reutilizan).
+
+Backends disponibles (CrudConfig.search_backend):
+- "icontains": OR de icontains por campo (default; LIKE '%term%', sin índices).
+- "postgres":  SearchVector/SearchQuery (cada palabra como prefijo) + índice GIN funcional.
+               Solo campos del propio modelo; no encuentra subcadenas ("uan" no da "Juan").
+- "trigram":   pg_trgm: similitud por palabra (tolera typos) + icontains indexado (GIN gin_trgm_ops).
+               Requiere la extensión pg_trgm (la crea rebuild_search_indexes).
+- "fts5":      SQLite FTS5 en tabla sombra `<tabla>_fts`, sincronizada por signals.
+               Coincide por prefijo de palabra, no por subcadena: "jua" da "Juan", "uan" no.
+- "auto":      en PostgreSQL "postgres", o "trigram" si algún campo cruza una relación (user__email:
+               sin GIN posible); "fts5" en SQLite; "icontains" en el resto.
+
+Si el backend no aplica al motor de la conexión (p.ej. "postgres" sobre SQLite en dev)
+o su índice/extensión aún no existe (o quedó con otros campos), se usa "icontains": la búsqueda
+nunca falla. "postgres" y "fts5" sí cambian qué coincide (prefijos de palabra en vez de
+subcadenas). Los índices se construyen con `python manage.py rebuild_search_indexes`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from django.db import connections, models
+from django.db.models import F, Q, QuerySet
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """Declaración de un índice de búsqueda: modelo + campos (admite paths con __)."""
+
+    model: type[models.Model]
+    fields: tuple[str, ...]
+    backend: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.model._meta.label}({', '.join(self.fields)})"
+
+
+_INDEXES: dict[tuple[str, tuple[str, ...]], SearchIndex] = {}
+
+
+def _index_name(model: type[models.Model], fields: Iterable[str], suffix: str) -> str:
+    # Nombres de índice deterministas y cortos (límite 30 chars de Django).
+    digest = hashlib.sha1(f"{model._meta.db_table}:{','.join(fields)}".encode()).hexdigest()[:8]
+    return f"{model._meta.db_table[:16]}_{digest}_{suffix}"[:30]
+
+
+def _resolve_path(model: type[models.Model], path: str) -> tuple[type[models.Model], models.Field, list[models.Field]]:
+    """Resuelve "user__email" -> (User, User.email, [Membership.user])."""
+
+    relations: list[models.Field] = []
+    current = model
+    parts = path.split("__")
+    for part in parts[:-1]:
+        field = current._meta.get_field(part)
+        if not field.is_relation or field.many_to_many or field.one_to_many:
+            raise ValueError(f"search_fields solo admite relaciones FK/O2O directas: {path}")
+        relations.append(field)
+        current = field.related_model
+    return current, current._meta.get_field(parts[-1]), relations
+
+
+class SearchBackend:
+    name = "icontains"
+    vendors: set[str] | None = None  # None = todos
+
+    def supports(self, qs: QuerySet) -> bool:
+        return self.vendors is None or connections[qs.db].vendor in self.vendors
+
+    def is_ready(self, qs: QuerySet, fields: tuple[str, ...]) -> bool:
+        return True
+
+    def filter(self, qs: QuerySet, fields: tuple[str, ...], term: str) -> QuerySet:
+        query = Q()
+        for f in fields:
+            query |= Q(**{f"{f}__icontains": term})
+        return qs.filter(query)
+
+    def rebuild(self, index: SearchIndex, *, using: str) -> str:
+        return "sin índice (icontains)"
+
+    def register(self, index: SearchIndex) -> None:
+        """Hook para conectar signals de sincronización (solo FTS5 lo usa)."""
+
+
+class PostgresFullTextBackend(SearchBackend):
+    name = "postgres"
+    vendors = {"postgresql"}
+    config = "simple"
+    # Re-chequeo de existencia del índice GIN (lo crea otro proceso: el comando).
+    ready_ttl = 60.0
+
+    def __init__(self) -> None:
+        self._ready: dict[tuple[str, str], tuple[bool, float]] = {}
+
+    def _vector(self, fields: tuple[str, ...]):
+        from django.contrib.postgres.search import SearchVector
+
+        return SearchVector(*fields, config=self.config)
+
+    def is_ready(self, qs: QuerySet, fields: tuple[str, ...]) -> bool:
+        # Con joins el índice no puede existir: el vector se calcularía fila por fila.
+        if any("__" in f for f in fields):
+            return False
+        name = _index_name(qs.model, fields, "fts")
+        key = (qs.db, name)
+        cached = self._ready.get(key)
+        now = time.monotonic()
+        if cached and now - cached[1] < self.ready_ttl:
+            return cached[0]
+        connection = connections[qs.db]
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, qs.model._meta.db_table)
+        exists = name in constraints
+        self._ready[key] = (exists, now)
+        return exists
+
+    @staticmethod
+    def prefix_query(term: str) -> str:
+        # Cada palabra como prefijo entre comillas ('jua':*), AND entre palabras: sin operadores
+        # del usuario y los emails quedan como un solo lexema.
+        words = [w for w in re.split(r"\s+", term.strip()) if w]
+        return " & ".join("'" + w.replace("\\", "\\\\").replace("'", "''") + "':*" for w in words)
+
+    def filter(self, qs: QuerySet, fields: tuple[str, ...], term: str) -> QuerySet:
+        from django.contrib.postgres.search import SearchQuery
+
+        expression = self.prefix_query(term)
+        if not expression:
+            return qs
+        query = SearchQuery(expression, config=self.config, search_type="raw")
+        return qs.annotate(_crud_search=self._vector(fields)).filter(_crud_search=query)
+
+    def rebuild(self, index: SearchIndex, *, using: str) -> str:
+        from django.contrib.postgres.indexes import GinIndex
+
+        if any("__" in f for f in index.fields):
+            # Un vector sobre columnas de varias tablas no es indexable con un solo índice.
+            return "campos con joins: búsqueda sin índice GIN (se recomienda 'trigram')"
+
+        name = _index_name(index.model, index.fields, "fts")
+        gin = GinIndex(self._vector(index.fields), name=name)
+        connection = connections[using]
+        with connection.schema_editor() as editor:
+            editor.execute(f"DROP INDEX IF EXISTS {editor.quote_name(name)}")
+            editor.add_index(index.model, gin)
+        self._ready[(using, name)] = (True, time.monotonic())
+        return f"GIN {name}"
+
+
+class TrigramBackend(SearchBackend):
+    name = "trigram"
+    vendors = {"postgresql"}
+    # Re-chequeo de la extensión pg_trgm (la instala otro proceso: el comando).
+    ready_ttl = 60.0
+
+    def __init__(self) -> None:
+        self._ready: dict[str, tuple[bool, float]] = {}
+
+    def is_ready(self, qs: QuerySet, fields: tuple[str, ...]) -> bool:
+        # Sin pg_trgm, `%>` / word_similarity fallan: se usa icontains hasta el rebuild.
+        cached = self._ready.get(qs.db)
+        now = time.monotonic()
+        if cached and now - cached[1] < self.ready_ttl:
+            return cached[0]
+        with connections[qs.db].cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            exists = cursor.fetchone() is not None
+        self._ready[qs.db] = (exists, now)
+        return exists
+
+    def filter(self, qs: QuerySet, fields: tuple[str, ...], term: str) -> QuerySet:
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+
+        query = Q()
+        for f in fields:
+            # icontains conserva los resultados previos; la similitud agrega tolerancia a typos.
+            query |= Q(**{f"{f}__icontains": term}) | Q(TrigramWordSimilar(F(f), term))
+        return qs.filter(query)
+
+    def rebuild(self, index: SearchIndex, *, using: str) -> str:
+        from django.contrib.postgres.indexes import GinIndex, OpClass
+        from django.db.models.functions import Cast, Upper
+
+        connection = connections[using]
+        created: list[str] = []
+        with connection.schema_editor() as editor:
+            editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for path in index.fields:
+                target_model, field, _ = _resolve_path(index.model, path)
+                # icontains en PostgreSQL compila a UPPER(col::text) LIKE UPPER(%s).
+                expressions = {
+                    "tu": OpClass(Upper(Cast(F(field.name), models.TextField())), name="gin_trgm_ops"),
+                    "tw": OpClass(F(field.name), name="gin_trgm_ops"),
+                }
+                for suffix, expression in expressions.items():
+                    name = _index_name(target_model, [field.name], suffix)
+                    editor.execute(f"DROP INDEX IF EXISTS {editor.quote_name(name)}")
+                    editor.add_index(target_model, GinIndex(expression, name=name))
+                    created.append(name)
+        self._ready[using] = (True, time.monotonic())
+        return f"GIN trigram: {', '.join(created)}"
+
+
+class SqliteFts5Backend(SearchBackend):
+    name = "fts5"
+    vendors = {"sqlite"}
+    # Re-chequeo de las tablas sombra y sus columnas (las construye otro proceso: el comando).
+    ready_ttl = 60.0
+
+    def __init__(self) -> None:
+        self._ready: dict[tuple[str, str], tuple[tuple[str, ...] | None, float]] = {}
+
+    @staticmethod
+    def table_name(model: type[models.Model]) -> str:
+        return f"{model._meta.db_table}_fts"
+
+    def is_ready(self, qs: QuerySet, fields: tuple[str, ...]) -> bool:
+        return self._matches(qs.model, tuple(fields), qs.db)
+
+    def _matches(self, model: type[models.Model], fields: tuple[str, ...], using: str) -> bool:
+        """La tabla sombra existe y tiene exactamente `fields` (un cambio de search_fields
+        deja una tabla vieja hasta el próximo rebuild: no se usa ni se sincroniza)."""
+
+        return self._columns(model, using) == fields
+
+    def _columns(self, model: type[models.Model], using: str) -> tuple[str, ...] | None:
+        key = (using, self.table_name(model))
+        cached = self._ready.get(key)
+        now = time.monotonic()
+        if cached and now - cached[1] < self.ready_ttl:
+            return cached[0]
+        connection = connections[using]
+        columns = None
+        with connection.cursor() as cursor:
+            if key[1] in connection.introspection.table_names(cursor):
+                cursor.execute(f"PRAGMA table_info({connection.ops.quote_name(key[1])})")
+                columns = tuple(row[1] for row in cursor.fetchall())
+        self._ready[key] = (columns, now)
+        return columns
+
+    @staticmethod
+    def match_expression(term: str) -> str:
+        # Cada palabra como prefijo entre comillas ("foo"*), unidas por AND implícito.
+        words = [w for w in re.split(r"\s+", term.strip()) if w]
+        return " ".join('"' + w.replace('"', '""') + '"*' for w in words)
+
+    def filter(self, qs: QuerySet, fields: tuple[str, ...], term: str) -> QuerySet:
+        expression = self.match_expression(term)
+        if not expression:
+            return qs
+        table = connections[qs.db].ops.quote_name(self.table_name(qs.model))
+        subquery = RawSQL(f"SELECT rowid FROM {table} WHERE {table} MATCH %s", (expression,))
+        return qs.filter(pk__in=subquery)
+
+    def rebuild(self, index: SearchIndex, *, using: str) -> str:
+        model = index.model
+        if not isinstance(model._meta.pk, (models.AutoField, models.BigAutoField, models.IntegerField)):
+            return "pk no entero: FTS5 no soportado (se usa icontains)"
+
+        connection = connections[using]
+        quote = connection.ops.quote_name
+        table = self.table_name(model)
+        columns = ", ".join(quote(f) for f in index.fields)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {quote(table)}")
+            cursor.execute(f"CREATE VIRTUAL TABLE {quote(table)} USING fts5({columns}, tokenize='unicode61')")
+        self._ready[(using, table)] = (index.fields, time.monotonic())
+
+        total = self._write_rows(index, model._default_manager.using(using).all(), using=using)
+        return f"FTS5 {table}: {total} filas"
+
+    def _write_rows(self, index: SearchIndex, qs: QuerySet, *, using: str) -> int:
+        connection = connections[using]
+        quote = connection.ops.quote_name
+        table = quote(self.table_name(index.model))
+        columns = ", ".join(["rowid", *[quote(f) for f in index.fields]])
+        placeholders = ", ".join(["%s"] * (len(index.fields) + 1))
+        sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+        total = 0
+        batch: list[tuple] = []
+        with connection.cursor() as cursor:
+            for row in qs.values_list("pk", *index.fields).iterator(chunk_size=2000):
+                batch.append(tuple("" if v is None else v for v in row))
+                if len(batch) >= 2000:
+                    cursor.executemany(sql, batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(sql, batch)
+                total += len(batch)
+        return total
+
+    def sync(self, index: SearchIndex, qs: QuerySet) -> None:
+        """Re-indexa las filas de qs (delete + insert)."""
+
+        using = qs.db
+        if connections[using].vendor != "sqlite" or not self._matches(index.model, index.fields, using):
+            return
+        pks = list(qs.values_list("pk", flat=True))
+        if not pks:
+            return
+        self.delete(index, pks, using=using)
+        self._write_rows(index, index.model._default_manager.using(using).filter(pk__in=pks), using=using)
+
+    def delete(self, index: SearchIndex, pks: list, *, using: str) -> None:
+        if connections[using].vendor != "sqlite" or not self._matches(index.model, index.fields, using):
+            return
+        connection = connections[using]
+        table = connection.ops.quote_name(self.table_name(index.model))
+        placeholders = ", ".join(["%s"] * len(pks))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE rowid IN ({placeholders})", pks)
+
+    def register(self, index: SearchIndex) -> None:
+        model = index.model
+        uid = f"crud_search_fts5:{index.label}"
+
+        def _on_save(sender, instance, using, **kwargs):
+            self.sync(index, model._default_manager.using(using).filter(pk=instance.pk))
+
+        def _on_delete(sender, instance, using, **kwargs):
+            self.delete(index, [instance.pk], using=using)
+
+        post_save.connect(_on_save, sender=model, weak=False, dispatch_uid=f"{uid}:save")
+        post_delete.connect(_on_delete, sender=model, weak=False, dispatch_uid=f"{uid}:delete")
+
+        # Campos con joins (p.ej. user__email): re-indexar al cambiar el modelo relacionado.
+        seen: set[str] = set()
+        for path in index.fields:
+            _, _, relations = _resolve_path(model, path)
+            if not relations or relations[0].name in seen:
+                continue
+            relation = relations[0]
+            seen.add(relation.name)
+
+            def _on_related_save(sender, instance, using, _relation=relation, **kwargs):
+                related_qs = model._default_manager.using(using).filter(**{_relation.name: instance})
+                self.sync(index, related_qs)
+
+            post_save.connect(
+                _on_related_save,
+                sender=relation.related_model,
+                weak=False,
+                dispatch_uid=f"{uid}:related:{relation.name}",
+            )
+
+
+_BACKENDS: dict[str, SearchBackend] = {
+    b.name: b for b in (SearchBackend(), PostgresFullTextBackend(), TrigramBackend(), SqliteFts5Backend())
+}
+
+_AUTO_BY_VENDOR = {"postgresql": "postgres", "sqlite": "fts5"}
+
+
+def get_search_backend(
+    name: str | None,
+    *,
+    using: str = "default",
+    fields: Iterable[str] = (),
+) -> SearchBackend:
+    key = (name or "icontains").strip().lower()
+    if key == "auto":
+        key = _AUTO_BY_VENDOR.get(connections[using].vendor, "icontains")
+        if key == "postgres" and any("__" in f for f in fields):
+            # Un vector sobre varias tablas no es indexable: trigram indexa cada columna.
+            key = "trigram"
+    backend = _BACKENDS.get(key)
+    if backend is None:
+        raise ValueError(f"search_backend inválido: {name}")
+    return backend
+
+
+def register_search_index(model: type[models.Model], fields: Iterable[str], *, backend: str) -> SearchIndex | None:
+    """Declara un índice para `rebuild_search_indexes` y conecta su sincronización."""
+
+    fields = tuple(fields)
+    if not fields or (backend or "icontains").strip().lower() == "icontains":
+        return None
+
+    key = (model._meta.label, fields)
+    if key in _INDEXES:
+        return _INDEXES[key]
+
+    index = SearchIndex(model=model, fields=fields, backend=backend)
+    _INDEXES[key] = index
+    # FTS5 sincroniza por signals aunque la config diga "auto" (el vendor se decide en runtime).
+    if backend in {"fts5", "auto"}:
+        _BACKENDS["fts5"].register(index)
+    return index
+
+
+def get_search_indexes() -> list[SearchIndex]:
+    return list(_INDEXES.values())
+
+
+def apply_search(qs: QuerySet, fields: Iterable[str], term: str, *, backend: str | None = None) -> QuerySet:
+    """Filtra qs por `term` sobre `fields` con el backend declarado (fallback: icontains)."""
+
+    term = (term or "").strip()
+    fields = tuple(fields)
+    if not term or not fields:
+        return qs
+
+    selected = get_search_backend(backend, using=qs.db, fields=fields)
+    if not selected.supports(qs) or not selected.is_ready(qs, fields):
+        selected = _BACKENDS["icontains"]
+    return selected.filter(qs, fields, term)
@@ -0,0 +1,164 @@
+"""Métricas del dashboard: agregaciones en una sola query + cache corto.
+
+- daily_counts: COUNT por día (TruncDate + annotate) en UNA query, huecos rellenados en Python.
+  El costo no depende del tamaño de la ventana (7, 30 o 90 días = 1 query).
+- cached_metric: cache compartido de Django por (métrica, org, ventana, día de corte).
+  El día de corte en la clave hace que la serie "rote" sola a medianoche.
+- daily_chart: ChartDef de una o más series diarias (rollups o daily_counts).
+
+Las métricas globales (p.ej. usuarios de la plataforma) usan organization=None.
+Para el dashboard, las series salen de los rollups pre-agregados (ver rollups.py).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Sequence, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, QuerySet
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .defs import ChartDataset, ChartDef
+
+
+T = TypeVar("T")
+
+_KEY = "dashboard:metric:{name}:{scope}:{window}:{end}"
+_MISS = object()
+
+# Ventanas (días) aceptadas desde la UI; cualquier otro valor cae al default.
+WINDOW_CHOICES = (7, 30, 90)
+DEFAULT_WINDOW = 7
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "DASHBOARD_METRICS_CACHE_TTL", 60))
+
+
+def _scope(organization: Any) -> str:
+    if organization is None:
+        return "global"
+    return f"org{getattr(organization, 'pk', organization)}"
+
+
+def parse_window(value: str | None, *, default: int = DEFAULT_WINDOW) -> int:
+    """Días de la ventana pedida (?days=), limitada a WINDOW_CHOICES."""
+
+    try:
+        days = int(value or default)
+    except (TypeError, ValueError):
+        return default
+    return days if days in WINDOW_CHOICES else default
+
+
+def window_bounds(days: int, *, end: date | None = None) -> tuple[date, date]:
+    """(primer día, último día) inclusive de una ventana de `days` días que termina hoy."""
+
+    end = end or timezone.localdate()
+    return end - timedelta(days=days - 1), end
+
+
+def day_range(start: date, end: date) -> tuple[datetime, datetime]:
+    """[inicio de start, inicio de end+1) como datetimes aware en la zona horaria actual."""
+
+    tz = timezone.get_current_timezone()
+    lower = timezone.make_aware(datetime.combine(start, time.min), tz)
+    upper = timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min), tz)
+    return lower, upper
+
+
+def cached_metric(
+    name: str,
+    compute: Callable[[], T],
+    *,
+    organization: Any = None,
+    window: int | str = "",
+    end: date | None = None,
+    ttl: int | None = None,
+) -> T:
+    """Valor de `compute()` cacheado por (name, org, window, día de corte) con TTL corto."""
+
+    key = _KEY.format(
+        name=name,
+        scope=_scope(organization),
+        window=window,
+        end=(end or timezone.localdate()).isoformat(),
+    )
+    value = cache.get(key, _MISS)
+    if value is _MISS:
+        value = compute()
+        cache.set(key, value, timeout=_ttl() if ttl is None else ttl)
+    return value
+
+
+def daily_counts(queryset: QuerySet, date_field: str, *, start: date, end: date) -> list[int]:
+    """Cantidad de filas por día de `date_field` en [start, end], una posición por día (0 si no hay).
+
+    Filtra por rango de datetimes (usa el índice de la columna, sin __date) y agrupa con
+    TruncDate en la zona horaria actual, igual que el lookup `__date`.
+    """
+
+    lower, upper = day_range(start, end)
+    rows = (
+        queryset.filter(**{f"{date_field}__gte": lower, f"{date_field}__lt": upper})
+        .order_by()
+        .annotate(day=TruncDate(date_field))
+        .values("day")
+        .annotate(n=Count("pk"))
+        .values_list("day", "n")
+    )
+    counts = dict(rows)
+    days = (end - start).days + 1
+    return [counts.get(start + timedelta(days=i), 0) for i in range(days)]
+
+
+def _day_label(day: date, days: int) -> str:
+    # Semana: día abreviado; ventanas largas: dd/mm.
+    return day.strftime("%a") if days <= 7 else day.strftime("%d/%m")
+
+
+@dataclass(frozen=True)
+class DailySeries:
+    """Una serie de daily_chart: counts(start, end) -> un valor por día."""
+
+    label: str
+    counts: Callable[[date, date], list[int]]
+    color: str = "primary"
+    fill: bool = False
+
+
+def daily_chart(
+    *,
+    name: str,
+    days: int,
+    id: str,
+    title: str,
+    series: Sequence[DailySeries],
+    organization: Any = None,
+    type: str = "line",
+) -> ChartDef:
+    """ChartDef de los últimos `days` días; los datos de todas las series se cachean juntos."""
+
+    start, end = window_bounds(days)
+    data = cached_metric(
+        name,
+        lambda: [s.counts(start, end) for s in series],
+        organization=organization,
+        window=days,
+        end=end,
+    )
+    labels = [_day_label(start + timedelta(days=i), days) for i in range(days)]
+    return ChartDef(
+        id=id,
+        title=title,
+        type=type,
+        labels=labels,
+        datasets=[
+            ChartDataset(label=s.label, data=values, color=s.color, fill=s.fill)
+            for s, values in zip(series, data)
+        ],
+    )
@@ -0,0 +1,243 @@
+"""Rollups diarios del dashboard: contadores pre-agregados por (org, métrica, día).
+
+El dashboard lee DailyMetricRollup (pocas filas, indexadas) en vez de escanear auth_user /
+Membership en cada login. Mantenimiento:
+- signals (apps/core/dashboard/signals.py): un alta/baja/cambio encola el recálculo de los
+  días afectados (job RQ, deduplicado por DASHBOARD_ROLLUP_DEBOUNCE segundos)
+- periódico (cron): `manage.py backfill_dashboard_rollups --days 2` cierra el día anterior
+- backfill: `manage.py backfill_dashboard_rollups --since 2024-01-01`
+
+Tipos de métrica:
+- eventos (cumulative=False): filas cuyo date_field cae en el día (p.ej. altas)
+- acumuladas (cumulative=True): filas con date_field hasta el fin del día (p.ej. total).
+  Los filtros se evalúan con el estado actual: recalcular días pasados no reconstruye
+  el is_active histórico.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Iterable
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, QuerySet
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.core.models import DailyMetricRollup
+
+from .metrics import day_range
+
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "dashboard:rollup:pending:{model}:{start}"
+
+
+@dataclass(frozen=True)
+class RollupMetric:
+    key: str
+    model: str  # "app_label.Model"
+    date_field: str
+    org_field: str | None = None  # None: métrica global
+    filters: tuple[tuple[str, Any], ...] = ()
+    cumulative: bool = False
+
+    def queryset(self) -> QuerySet:
+        model = apps.get_model(self.model)
+        return model._default_manager.filter(**dict(self.filters)).order_by()
+
+
+ROLLUP_METRICS: dict[str, RollupMetric] = {}
+
+
+def register_rollup(metric: RollupMetric) -> RollupMetric:
+    ROLLUP_METRICS[metric.key] = metric
+    return metric
+
+
+USERS_JOINED = register_rollup(RollupMetric("users.joined", settings.AUTH_USER_MODEL, "date_joined"))
+USERS_TOTAL = register_rollup(
+    RollupMetric("users.total", settings.AUTH_USER_MODEL, "date_joined", cumulative=True)
+)
+USERS_ACTIVE = register_rollup(
+    RollupMetric(
+        "users.active",
+        settings.AUTH_USER_MODEL,
+        "date_joined",
+        filters=(("is_active", True),),
+        cumulative=True,
+    )
+)
+MEMBERS_JOINED = register_rollup(
+    RollupMetric("members.joined", "orgs.Membership", "created_at", org_field="organization_id")
+)
+
+
+def metrics_for_model(label: str) -> list[RollupMetric]:
+    label = label.lower()
+    return [m for m in ROLLUP_METRICS.values() if m.model.lower() == label]
+
+
+def _days(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def compute_range(metric: RollupMetric, start: date, end: date) -> dict[tuple[int | None, date], int]:
+    """Valores {(org_id | None, día): n} de [start, end].
+
+    Eventos: una query agrupada por (org, día). Acumuladas: además una query con la base
+    previa a `start` y suma corrida en Python. El costo no depende de la cantidad de días.
+    """
+
+    qs = metric.queryset()
+    scope = [metric.org_field] if metric.org_field else []
+    lower, upper = day_range(start, end)
+
+    daily = (
+        qs.filter(**{f"{metric.date_field}__gte": lower, f"{metric.date_field}__lt": upper})
+        .annotate(day=TruncDate(metric.date_field))
+        .values(*scope, "day")
+        .annotate(n=Count("pk"))
+        .values_list(*scope, "day", "n")
+    )
+    counts: dict[tuple[int | None, date], int] = {}
+    for row in daily:
+        counts[(row[0] if scope else None, row[-2])] = row[-1]
+    if not metric.cumulative:
+        return counts
+
+    before = qs.filter(**{f"{metric.date_field}__lt": lower})
+    if scope:
+        base = dict(before.values(*scope).annotate(n=Count("pk")).values_list(*scope, "n"))
+        # Scopes que ya tenían filas: si bajaron a 0 se escribe el 0 (no queda un valor viejo).
+        previous = (
+            DailyMetricRollup.objects.filter(metric=metric.key, organization__isnull=False)
+            .values_list("organization_id", flat=True)
+            .distinct()
+        )
+        base.update((org_id, 0) for org_id in previous if org_id not in base)
+    else:
+        base = {None: before.count()}
+    base.update((org_id, 0) for org_id, _ in counts if org_id not in base)
+
+    values: dict[tuple[int | None, date], int] = {}
+    for org_id, running in base.items():
+        for day in _days(start, end):
+            running += counts.get((org_id, day), 0)
+            values[(org_id, day)] = running
+    return values
+
+
+def refresh_rollups(start: date, end: date, metrics: Iterable[RollupMetric] | None = None) -> int:
+    """Recalcula y reemplaza los rollups de [start, end]. Devuelve filas escritas.
+
+    Eventos: solo se guardan días con n > 0 (ausente = 0). Acumuladas: todos los días, para
+    que "último valor <= hoy" sea siempre correcto.
+    """
+
+    written = 0
+    for metric in metrics or ROLLUP_METRICS.values():
+        values = compute_range(metric, start, end)
+        rows = [
+            DailyMetricRollup(organization_id=org_id, metric=metric.key, day=day, value=n)
+            for (org_id, day), n in values.items()
+            if n or metric.cumulative
+        ]
+        with transaction.atomic():
+            DailyMetricRollup.objects.filter(metric=metric.key, day__gte=start, day__lte=end).delete()
+            DailyMetricRollup.objects.bulk_create(rows, batch_size=1000)
+        written += len(rows)
+    return written
+
+
+def _debounce() -> int:
+    return int(getattr(settings, "DASHBOARD_ROLLUP_DEBOUNCE", 30))
+
+
+def schedule_refresh(model_label: str, day: date) -> None:
+    """Encola (una vez por ventana de debounce) el recálculo de [day, hoy] para un modelo.
+
+    Lo usan los signals: un import masivo de usuarios termina en un solo job. Un fallo al
+    encolar (sin `rq`, Redis o worker caídos) se loguea y no llega al save que lo disparó:
+    el rollup se pone al día con el próximo cambio o con backfill_dashboard_rollups.
+    """
+
+    start = min(day, timezone.localdate())
+    key = _PENDING_KEY.format(model=model_label.lower(), start=start.isoformat())
+    if not cache.add(key, 1, timeout=_debounce()):
+        return
+
+    from apps.core.jobs import enqueue, refresh_rollups_job
+
+    def _enqueue() -> None:
+        try:
+            enqueue(refresh_rollups_job, model_label, start.isoformat())
+        except Exception:
+            cache.delete(key)  # el próximo cambio vuelve a intentarlo
+            logger.exception("No se pudo encolar el recálculo de rollups (%s desde %s)", model_label, start)
+
+    transaction.on_commit(_enqueue)
+
+
+def run_scheduled_refresh(model_label: str, start: date) -> int:
+    # Se libera antes de calcular: cambios durante el job encolan otro recálculo.
+    cache.delete(_PENDING_KEY.format(model=model_label.lower(), start=start.isoformat()))
+    return refresh_rollups(start, timezone.localdate(), metrics_for_model(model_label))
+
+
+def _scoped(key: str, organization: Any) -> QuerySet:
+    qs = DailyMetricRollup.objects.filter(metric=key)
+    if organization is None:
+        return qs.filter(organization__isnull=True)
+    return qs.filter(organization_id=getattr(organization, "pk", organization))
+
+
+def rollup_series(metric: RollupMetric, *, start: date, end: date, organization: Any = None) -> list[int]:
+    """Un valor por día de [start, end] leído del rollup (eventos: 0 si no hay fila)."""
+
+    rows = dict(
+        _scoped(metric.key, organization)
+        .filter(day__gte=start, day__lte=end)
+        .values_list("day", "value")
+    )
+    return [rows.get(day, 0) for day in _days(start, end)]
+
+
+def rollup_value(metric: RollupMetric, *, day: date | None = None, organization: Any = None) -> int:
+    """Último valor de una métrica acumulada a `day` (hoy por defecto).
+
+    Sin filas todavía (rollup nunca calculado): se devuelve el valor en vivo, sin escribir;
+    materializar queda para el job o backfill_dashboard_rollups (esto corre en GETs).
+    """
+
+    day = day or timezone.localdate()
+    value = (
+        _scoped(metric.key, organization)
+        .filter(day__lte=day)
+        .order_by("-day")
+        .values_list("value", flat=True)
+        .first()
+    )
+    if value is None:
+        return live_value(metric, day=day, organization=organization)
+    return value
+
+
+def live_value(metric: RollupMetric, *, day: date, organization: Any = None) -> int:
+    """Valor de una métrica acumulada a `day` contado sobre la tabla origen (una query)."""
+
+    _, upper = day_range(day, day)
+    qs = metric.queryset().filter(**{f"{metric.date_field}__lt": upper})
+    if metric.org_field:
+        if organization is None:
+            return 0
+        qs = qs.filter(**{metric.org_field: getattr(organization, "pk", organization)})
+    elif organization is not None:
+        return 0
+    return qs.count()
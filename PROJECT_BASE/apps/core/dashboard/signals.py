@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.orgs.models import Membership
+
+from .rollups import schedule_refresh
+
+
+# Campos que mueven algún rollup; el resto de los saves (p.ej. last_login en cada login) se ignora.
+_USER_FIELDS = {"is_active", "date_joined"}
+
+
+def _day(value):
+    return timezone.localdate(value) if value else timezone.localdate()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="dashboard_rollup_user_saved")
+def _user_saved(sender, instance, created: bool, update_fields=None, **kwargs) -> None:
+    if not created and update_fields is not None and not _USER_FIELDS.intersection(update_fields):
+        return
+    schedule_refresh(sender._meta.label, _day(instance.date_joined))
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid="dashboard_rollup_user_deleted")
+def _user_deleted(sender, instance, **kwargs) -> None:
+    schedule_refresh(sender._meta.label, _day(instance.date_joined))
+
+
+@receiver(post_save, sender=Membership, dispatch_uid="dashboard_rollup_membership_saved")
+@receiver(post_delete, sender=Membership, dispatch_uid="dashboard_rollup_membership_deleted")
+def _membership_changed(sender, instance: Membership, **kwargs) -> None:
+    schedule_refresh(sender._meta.label, _day(instance.created_at))
@@ -0,0 +1,6 @@
+"""Exports en segundo plano: ExportJob encolado en RQ, progreso vía HTMX y descarga.
+
+- services.start_export: crea el job y lo encola (al commit).
+- services.run_export:   lo ejecuta el worker (apps.core.jobs.run_export_job).
+- views:                 start / status (polling HTMX) / download.
+"""
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+import tempfile
+from functools import partial
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+
+from apps.core.crud.registry import get_crud
+from apps.core.jobs import enqueue, run_export_job
+from apps.core.models import ExportJob
+from apps.core.services.exporting import (
+    datetime_columns,
+    export_filename,
+    export_schema,
+    get_export_format,
+    iter_rows,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Parámetros que no afectan el contenido del export.
+_IGNORED_PARAMS = {"page", "cursor", "format"}
+
+
+def clean_query(query: QueryDict) -> str:
+    """Querystring de filtros/orden a persistir en el job (sin paginación ni formato)."""
+
+    data = query.copy()
+    for key in _IGNORED_PARAMS:
+        data.pop(key, None)
+    return data.urlencode()
+
+
+def start_export(*, user, organization, source: str, fmt: str, query: str) -> ExportJob:
+    """Crea el ExportJob y lo encola cuando la transacción confirma (el worker debe verlo).
+
+    Los permisos los valida el caller (vista o servicio).
+    """
+
+    job = ExportJob.objects.create(
+        user=user,
+        organization_id=getattr(organization, "pk", None) if organization else None,
+        source=source,
+        query=query,
+        format=fmt,
+    )
+    transaction.on_commit(
+        partial(
+            enqueue,
+            run_export_job,
+            str(job.pk),
+            queue=getattr(settings, "EXPORTS_QUEUE", "default"),
+            job_timeout=getattr(settings, "EXPORTS_JOB_TIMEOUT", None),
+        )
+    )
+    return job
+
+
+def _job_request(job: ExportJob) -> HttpRequest:
+    """Request sintético para reutilizar el CrudConfig (base queryset, filtros, orden) en el worker.
+
+    Los permisos ya se validaron al encolar.
+    """
+
+    request = HttpRequest()
+    request.method = "GET"
+    request.GET = QueryDict(job.query)
+    request.user = job.user
+    request.organization = job.organization
+    return request
+
+
+def run_export(job_id: str) -> None:
+    job = ExportJob.objects.select_related("user", "organization").filter(pk=job_id).first()
+    if job is None or job.status != ExportJob.STATUS_PENDING:
+        # Eliminado o ya tomado (reintento del worker): nada que hacer.
+        return
+
+    ExportJob.objects.filter(pk=job.pk).update(
+        status=ExportJob.STATUS_RUNNING,
+        started_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
+
+    def on_progress(count: int) -> None:
+        ExportJob.objects.filter(pk=job.pk).update(processed_rows=count, updated_at=timezone.now())
+
+    try:
+        config = get_crud(job.source)
+        export_format = get_export_format(job.format)
+        fields = config.get_export_fields()
+        headers = config.get_export_headers()
+        if not fields or not headers:
+            raise ValueError(f"{job.source}: export_fields no declarado")
+
+        request = _job_request(job)
+        params = config.parse_params(request)
+        qs = config.queryset_for_list(request=request, params=params)
+
+        ExportJob.objects.filter(pk=job.pk).update(total_rows=qs.count())
+
+        # Archivo temporal en disco (no en RAM); el storage lo copia por chunks al guardar.
+        with tempfile.TemporaryFile() as tmp:
+            export_format.writer(
+                tmp,
+                rows=iter_rows(qs, fields, on_progress=on_progress),
+                headers=headers,
+                title=config.get_export_title(),
+                sheet_name=config.get_export_title(),
+                datetime_columns=datetime_columns(qs, fields),
+                fields=fields,
+                schema=export_schema(qs, fields),
+            )
+            tmp.seek(0)
+            job.file.save(
+                export_filename(config.get_export_filename_base(request), export_format.ext),
+                File(tmp),
+                save=False,
+            )
+    except Exception as e:
+        logger.exception("Export %s falló", job.pk)
+        ExportJob.objects.filter(pk=job.pk).update(
+            status=ExportJob.STATUS_FAILED,
+            error=str(e)[:1000],
+            finished_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        return
+
+    ExportJob.objects.filter(pk=job.pk).update(
+        status=ExportJob.STATUS_DONE,
+        file=job.file.name,
+        finished_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import views
+
+app_name = "exports"
+
+urlpatterns = [
+    path("<str:slug>/start/", views.start, name="start"),
+    path("jobs/<uuid:job_id>/", views.status, name="status"),
+    path("jobs/<uuid:job_id>/download/", views.download, name="download"),
+]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+from urllib.parse import urlparse
+
+from django.contrib.auth.decorators import login_required
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse, HttpResponseForbidden, QueryDict
+from django.shortcuts import get_object_or_404, render
+from django.views.decorators.http import require_GET, require_POST
+
+from apps.core.crud.registry import get_crud
+from apps.core.models import ExportJob
+
+from .services import clean_query, start_export
+
+
+def _export_query(request: HttpRequest) -> QueryDict:
+    """Filtros/orden activos: de HX-Current-URL (botón en la página de listado) o del GET."""
+
+    current_url = request.headers.get("HX-Current-URL")
+    if current_url:
+        return QueryDict(urlparse(current_url).query)
+    return request.GET
+
+
+@login_required
+@require_POST
+def start(request: HttpRequest, slug: str) -> HttpResponse:
+    try:
+        config = get_crud(slug)
+    except KeyError:
+        raise Http404("CRUD no encontrado")
+
+    fmt = (request.POST.get("format") or request.GET.get("format") or "").strip().lower()
+    if not config.can_export(request):
+        return HttpResponseForbidden("Forbidden")
+    if not config.is_export_enabled() or not config.exports_declared():
+        return HttpResponseForbidden("Export disabled")
+    if not config.allows_async_format(fmt):
+        return HttpResponseForbidden("Format not allowed")
+
+    job = start_export(
+        user=request.user,
+        organization=getattr(request, "organization", None),
+        source=slug,
+        fmt=fmt,
+        query=clean_query(_export_query(request)),
+    )
+    # En modo sync el job ya terminó: recargar para pintar el estado final.
+    job.refresh_from_db()
+    return render(request, "core/exports/_job.html", {"job": job})
+
+
+def _get_job(request: HttpRequest, job_id, **filters) -> ExportJob | HttpResponseForbidden:
+    """Job del usuario, re-validando lo mismo que `start`: el permiso de export del CRUD y la
+    organización activa (un permiso o una membresía revocados cortan el acceso a archivos ya
+    generados)."""
+
+    job = get_object_or_404(ExportJob, pk=job_id, user=request.user, **filters)
+    if job.organization_id is not None:
+        # request.organization evalúa a None si la membresía u org ya no están activas.
+        organization = getattr(request, "organization", None)
+        if getattr(organization, "pk", None) != job.organization_id:
+            raise Http404("Export no encontrado")
+    try:
+        config = get_crud(job.source)
+    except KeyError:
+        raise Http404("CRUD no encontrado")
+    if not config.can_export(request) or not config.is_export_enabled():
+        return HttpResponseForbidden("Forbidden")
+    return job
+
+
+@login_required
+@require_GET
+def status(request: HttpRequest, job_id) -> HttpResponse:
+    job = _get_job(request, job_id)
+    if not isinstance(job, ExportJob):
+        return job
+    if request.headers.get("HX-Request"):
+        return render(request, "core/exports/_job.html", {"job": job})
+    # Página completa: destino de los exports síncronos derivados (ExportLimitExceeded).
+    return render(request, "core/exports/job.html", {"job": job})
+
+
+@login_required
+@require_GET
+def download(request: HttpRequest, job_id) -> FileResponse | HttpResponseForbidden:
+    job = _get_job(request, job_id, status=ExportJob.STATUS_DONE)
+    if not isinstance(job, ExportJob):
+        return job
+    if not job.file:
+        raise Http404("Archivo no disponible")
+    return FileResponse(job.file.open("rb"), as_attachment=True, filename=os.path.basename(job.file.name))
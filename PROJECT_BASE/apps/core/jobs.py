@@ -0,0 +1,87 @@
+"""Jobs de core + helper de encolado (RQ).
+
+Backend (settings.JOBS_BACKEND):
+- "rq":   encola en settings.RQ_QUEUES[<queue>]; lo ejecuta el worker (`manage.py rqworker default`).
+- "sync": ejecuta en el proceso actual (dev/tests sin Redis).
+
+Para tests del camino RQ completo sin Redis: RQ_QUEUES[<queue>] con "ASYNC": False
+(RQ ejecuta el job en proceso) y "FAKE_REDIS": True (conexión fakeredis).
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+from datetime import date
+from typing import Any, Callable
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def _require(module: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except Exception as e:
+        raise RuntimeError(f"Dependencia faltante: {module}") from e
+
+
+def _queue_config(name: str) -> dict:
+    queues = getattr(settings, "RQ_QUEUES", {}) or {}
+    if name not in queues:
+        raise RuntimeError(f"Cola RQ no configurada: {name}")
+    return queues[name]
+
+
+def get_connection(name: str = "default") -> Any:
+    cfg = _queue_config(name)
+    if cfg.get("FAKE_REDIS"):
+        return _require("fakeredis").FakeStrictRedis()
+    return _require("redis").Redis.from_url(cfg["URL"])
+
+
+def get_queue(name: str = "default") -> Any:
+    rq = _require("rq")
+    cfg = _queue_config(name)
+    return rq.Queue(
+        name,
+        connection=get_connection(name),
+        is_async=cfg.get("ASYNC", True),
+        default_timeout=cfg.get("DEFAULT_TIMEOUT"),
+    )
+
+
+def enqueue(
+    func: Callable[..., Any],
+    *args: Any,
+    queue: str = "default",
+    job_timeout: int | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Encola `func(*args, **kwargs)`. En modo "sync" la ejecuta inmediatamente."""
+
+    if getattr(settings, "JOBS_BACKEND", "rq") == "sync":
+        func(*args, **kwargs)
+        return None
+    return get_queue(queue).enqueue(func, *args, job_timeout=job_timeout, **kwargs)
+
+
+# --- Jobs ---
+
+
+def run_export_job(job_id: str) -> None:
+    """Ejecuta un ExportJob (ver apps.core.exports.services.run_export)."""
+
+    from apps.core.exports.services import run_export
+
+    run_export(job_id)
+
+
+def refresh_rollups_job(model_label: str, start: str) -> None:
+    """Recalcula los rollups del dashboard de un modelo desde `start` (ISO) hasta hoy."""
+
+    from apps.core.dashboard.rollups import run_scheduled_refresh
+
+    run_scheduled_refresh(model_label, date.fromisoformat(start))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+
+from apps.core.dashboard.rollups import ROLLUP_METRICS, refresh_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula los rollups diarios del dashboard (DailyMetricRollup). "
+        "Sin --since/--days: desde el primer registro de cada métrica. "
+        "Periódico (cron): --days 2."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", help="Primer día (YYYY-MM-DD).")
+        parser.add_argument("--days", type=int, help="Solo los últimos N días (incluye hoy).")
+        parser.add_argument(
+            "--metric",
+            dest="metrics",
+            action="append",
+            default=[],
+            help=f"Limitar a una métrica ({', '.join(ROLLUP_METRICS)}). Repetible.",
+        )
+
+    def handle(self, *args, **options):
+        unknown = [m for m in options["metrics"] if m not in ROLLUP_METRICS]
+        if unknown:
+            raise CommandError(f"Métricas desconocidas: {', '.join(unknown)}")
+        metrics = [ROLLUP_METRICS[m] for m in options["metrics"]] or list(ROLLUP_METRICS.values())
+
+        today = timezone.localdate()
+        since: date | None = None
+        if options.get("since"):
+            try:
+                since = date.fromisoformat(options["since"])
+            except ValueError as e:
+                raise CommandError("--since debe ser YYYY-MM-DD") from e
+        elif options.get("days"):
+            since = today - timedelta(days=max(options["days"], 1) - 1)
+
+        for metric in metrics:
+            start = since
+            if start is None:
+                first = metric.queryset().aggregate(first=Min(metric.date_field))["first"]
+                if first is None:
+                    self.stdout.write(f"- {metric.key}: sin datos")
+                    continue
+                start = timezone.localdate(first)
+            written = refresh_rollups(start, today, [metric])
+            self.stdout.write(self.style.SUCCESS(f"✓ {metric.key}: {start} → {today} ({written} filas)"))
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.services.exporting import CSV_BLOCK_SIZE, stream_csv
+from apps.crud_example.models import Item
+
+
+_FIELDS = ["name", "status", "created_at"]
+_HEADERS = ["Nombre", "Estado", "Creado"]
+_SEED_BATCH = 10_000
+
+
+class Command(BaseCommand):
+    help = "Mide stream_csv sobre Item: una fila por chunk (anterior) vs bloques de ~64KB (y gzip)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000, help="Filas a exportar (default: 1000000).")
+        parser.add_argument(
+            "--seed",
+            action="store_true",
+            help="Crea Items hasta llegar a --rows (SOLO DEBUG=True).",
+        )
+        parser.add_argument(
+            "--block-size",
+            type=int,
+            default=CSV_BLOCK_SIZE,
+            help=f"Tamaño de bloque en bytes (default: {CSV_BLOCK_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        rows: int = options["rows"]
+        block_size: int = options["block_size"]
+
+        existing = Item.objects.count()
+        if existing < rows:
+            if not options["seed"]:
+                raise CommandError(f"Hay {existing} Items (< {rows}). Usa --seed o baja --rows.")
+            if not settings.DEBUG:
+                raise CommandError("--seed solo puede ejecutarse cuando DEBUG=True")
+            self._seed(rows - existing)
+
+        qs = Item.objects.order_by("pk")[:rows]
+        variants = [
+            ("una fila por chunk", {"block_size": 0}),
+            (f"bloques {block_size // 1024}KB", {"block_size": block_size}),
+            (f"bloques {block_size // 1024}KB + gzip", {"block_size": block_size, "compress": True}),
+        ]
+
+        self.stdout.write(f"{rows} filas · {', '.join(_FIELDS)}")
+        baseline = None
+        for label, kwargs in variants:
+            resp = stream_csv(queryset=qs, fields=_FIELDS, headers=_HEADERS, **kwargs)
+            chunks = 0
+            size = 0
+            started = time.perf_counter()
+            for chunk in resp.streaming_content:
+                chunks += 1
+                size += len(chunk)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f"  {label:<28} {elapsed:7.2f}s  {rows / elapsed:>10,.0f} filas/s  "
+                f"{chunks:>9} chunks  {size / 1e6:8.1f} MB  x{baseline / elapsed:.2f}"
+            )
+
+    def _seed(self, missing: int) -> None:
+        self.stdout.write(f"Creando {missing} Items…")
+        created = 0
+        while created < missing:
+            batch = min(_SEED_BATCH, missing - created)
+            Item.objects.bulk_create(
+                [
+                    Item(
+                        name=f"Benchmark item {created + i}",
+                        status=Item.Status.ACTIVE if (created + i) % 3 else Item.Status.INACTIVE,
+                    )
+                    for i in range(batch)
+                ],
+                batch_size=batch,
+            )
+            created += batch
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import connection
+from django.http import HttpResponse
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.middleware import SetupMiddleware
+from apps.core.models import GlobalConfig
+
+
+class _PerRequestSetupMiddleware:
+    """Comportamiento anterior: GlobalConfig.load() en cada request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not GlobalConfig.load().setup_complete:
+            return HttpResponse(status=302)
+        return self.get_response(request)
+
+
+class Command(BaseCommand):
+    help = "Mide el costo por request de SetupMiddleware: load() por request (anterior) vs latch."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20_000, help="Requests simulados (default: 20000).")
+
+    def handle(self, *args, **options):
+        iterations: int = options["iterations"]
+        if iterations <= 0:
+            raise CommandError("--iterations debe ser > 0")
+        if not GlobalConfig.load().setup_complete:
+            raise CommandError("El setup no está completo: el latch nunca se activa.")
+
+        request = RequestFactory().get("/dashboard/")
+        ok = HttpResponse()
+        variants = [
+            ("sin middleware", lambda r: ok),
+            ("load() por request", _PerRequestSetupMiddleware(lambda r: ok)),
+            ("latch", SetupMiddleware(lambda r: ok)),
+        ]
+
+        self.stdout.write(f"{iterations} requests · GET {request.path}")
+        baseline = None
+        overheads: dict[str, float] = {}
+        for label, middleware in variants:
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    # Mismo ciclo que el handler: SingletonModel revalida por request.
+                    request_started.send(sender=self.__class__)
+                    middleware(request)
+                    request_finished.send(sender=self.__class__)
+                elapsed = time.perf_counter() - started
+
+            per_request = elapsed / iterations * 1_000_000
+            if baseline is None:
+                baseline = per_request
+            overheads[label] = per_request - baseline
+            self.stdout.write(
+                f"{label:<20} {per_request:8.2f} µs/request · {len(queries)} queries"
+                f" · overhead {overheads[label]:6.2f} µs"
+            )
+
+        saved = overheads["load() por request"] - overheads["latch"]
+        self.stdout.write(f"Ahorro por request: {saved:.2f} µs (overhead = total - sin middleware).")
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from apps.core.crud.search import get_search_backend, get_search_indexes
+
+
+class Command(BaseCommand):
+    help = "Construye o reconstruye los índices de búsqueda declarados (search_backend != icontains)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            dest="models",
+            action="append",
+            default=[],
+            help="Limitar a un modelo (app_label.Model). Repetible.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Alias de base de datos (default: default).",
+        )
+
+    def handle(self, *args, **options):
+        using: str = options["database"]
+        wanted = {m.lower() for m in options.get("models") or []}
+
+        indexes = [i for i in get_search_indexes() if not wanted or i.model._meta.label_lower in wanted]
+        if not indexes:
+            raise CommandError("No hay índices de búsqueda declarados para los filtros indicados.")
+
+        for index in indexes:
+            backend = get_search_backend(index.backend, using=using, fields=index.fields)
+            with transaction.atomic(using=using):
+                detail = backend.rebuild(index, using=using)
+            self.stdout.write(self.style.SUCCESS(f"✓ {index.label} [{backend.name}] -> {detail}"))
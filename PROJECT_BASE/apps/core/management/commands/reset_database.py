@@ -68,6 +68,12 @@ class Command(BaseCommand):
         # 2. Ejecutar migraciones desde cero
         self.stdout.write("\n📦 Ejecutando migraciones...\n")
         call_command('migrate', '--noinput', verbosity=1)
+
+        # Procesos en marcha: soltar el latch de SetupMiddleware y la copia cacheada de
+        # GlobalConfig (con cache compartido, p.ej. Redis; con LocMem hay que reiniciarlos).
+        from apps.core.models import GlobalConfig
+
+        GlobalConfig.broadcast_setup_reset()
         
         # 3. Mensaje de éxito
         self.stdout.write(self.style.SUCCESS(
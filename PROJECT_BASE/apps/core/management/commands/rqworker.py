@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import importlib
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.jobs import get_connection, get_queue
+
+
+class Command(BaseCommand):
+    help = "Worker RQ para las colas de settings.RQ_QUEUES (docker-compose: servicio `worker`)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("queues", nargs="*", default=["default"], help="Colas a escuchar (default: default).")
+        parser.add_argument("--burst", action="store_true", help="Procesar lo pendiente y salir.")
+
+    def handle(self, *args, **options):
+        try:
+            queues = [get_queue(name) for name in options["queues"]]
+        except RuntimeError as e:
+            raise CommandError(str(e)) from e
+
+        # get_queue ya validó que rq está instalado.
+        Worker = importlib.import_module("rq").Worker
+        worker = Worker(queues, connection=get_connection(options["queues"][0]))
+        worker.work(burst=options["burst"])
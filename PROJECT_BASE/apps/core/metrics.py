@@ -0,0 +1,130 @@
+"""Métricas en proceso: contadores e histogramas livianos para instrumentación (sin dependencias).
+
+Uso:
+    from apps.core import metrics
+
+    metrics.incr("context_processor.evaluated", processor="navigation")
+    metrics.get("context_processor.evaluated", processor="navigation")  # -> int
+    metrics.snapshot()  # {"context_processor.evaluated{processor=navigation}": 12, ...}
+
+    metrics.observe("service.duration_ms", 12.5, service="ListMembersService")
+    metrics.histogram("service.duration_ms", service="ListMembersService")  # -> Histogram | None
+    metrics.histograms()  # {"service.duration_ms{service=...}": {"count": .., "p95": .., ...}}
+
+Viven en el proceso (cada worker tiene los suyos): sirven para debug, benchmarks y tests,
+no reemplazan a un backend de métricas.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from dataclasses import dataclass, field
+
+
+_lock = threading.Lock()
+_counters: dict[tuple[str, tuple[tuple[str, str], ...]], int] = {}
+_histograms: dict[tuple[str, tuple[tuple[str, str], ...]], "Histogram"] = {}
+
+# Límites superiores de buckets (pensados para milisegundos y conteos de queries).
+DEFAULT_BUCKETS: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class Histogram:
+    """Buckets acumulables (estilo Prometheus: cada valor cae en el primer límite >= valor)."""
+
+    bounds: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)  # len(bounds) + 1: el último es +Inf
+    count: int = 0
+    sum: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimación por bucket: límite superior del bucket que contiene el cuantil q."""
+
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "avg": round(self.sum / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+            "p50": round(self.quantile(0.5), 3),
+            "p95": round(self.quantile(0.95), 3),
+            "p99": round(self.quantile(0.99), 3),
+            "buckets": {
+                **{str(bound): n for bound, n in zip(self.bounds, self.counts)},
+                "+Inf": self.counts[-1],
+            },
+        }
+
+
+def _key(name: str, labels: dict[str, object]) -> tuple[str, tuple[tuple[str, str], ...]]:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format(key: tuple[str, tuple[tuple[str, str], ...]]) -> str:
+    name, labels = key
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+
+def incr(name: str, value: int = 1, **labels: object) -> None:
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def get(name: str, **labels: object) -> int:
+    return _counters.get(_key(name, labels), 0)
+
+
+def snapshot() -> dict[str, int]:
+    with _lock:
+        return {_format(key): value for key, value in sorted(_counters.items())}
+
+
+def observe(name: str, value: float, *, buckets: tuple[float, ...] | None = None, **labels: object) -> None:
+    key = _key(name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = Histogram(bounds=buckets or DEFAULT_BUCKETS)
+        hist.observe(value)
+
+
+def histogram(name: str, **labels: object) -> Histogram | None:
+    return _histograms.get(_key(name, labels))
+
+
+def histograms() -> dict[str, dict[str, object]]:
+    with _lock:
+        return {_format(key): hist.as_dict() for key, hist in sorted(_histograms.items())}
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
@@ -1,14 +1,51 @@
+import logging
+import time
+
+from django.conf import settings
 from django.shortcuts import redirect
 from django.urls import reverse
+
+from . import metrics
 from .models import GlobalConfig
+from .queries import QueryBudgetExceeded, budget_message, record_queries, summarize
+
+logger = logging.getLogger("apps.core.queries")
 
 class SetupMiddleware:
-    """Redirige al wizard de setup si la configuración no está completa."""
+    """Redirige al wizard de setup si la configuración no está completa.
+
+    Latch por proceso: una vez visto setup_complete=True, los requests pasan sin tocar cache
+    ni base. Cada SETUP_LATCH_RECHECK_INTERVAL segundos se compara la versión de setup del
+    cache compartido (GlobalConfig.SETUP_VERSION_KEY); si cambió (reset_database, setup
+    revertido desde el admin), se suelta el latch y se vuelve a leer GlobalConfig.
+    """
     
     def __init__(self, get_response):
         self.get_response = get_response
+        self._latched_version = None  # versión de setup con la que se vio completo
+        self._latched_at = 0.0
+
+    def _latched(self) -> bool:
+        if self._latched_version is None:
+            return False
+        interval = float(getattr(settings, "SETUP_LATCH_RECHECK_INTERVAL", 30) or 0)
+        if time.monotonic() - self._latched_at < interval:
+            return True
+        try:
+            version = GlobalConfig.setup_version()
+        except Exception:
+            return True
+        if version == self._latched_version:
+            self._latched_at = time.monotonic()
+            return True
+        self._latched_version = None
+        return False
 
     def __call__(self, request):
+        # Camino rápido: setup ya visto completo en este proceso.
+        if self._latched():
+            return self.get_response(request)
+
         # Rutas exentas de redirección
         if request.path.startswith("/setup/") or \
            request.path.startswith("/static/") or \
@@ -18,11 +55,77 @@ class SetupMiddleware:
 
         # Verificar estado del setup
         try:
+            version = GlobalConfig.setup_version()
             config = GlobalConfig.load()
             if not config.setup_complete:
                 return redirect("setup_wizard")
+            self._latched_version = version
+            self._latched_at = time.monotonic()
         except Exception:
             # Si falla la DB (ej. migraciones pendientes), dejar pasar para no bloquear
             pass
 
         return self.get_response(request)
+
+
+class QueryInspectorMiddleware:
+    """Debug/staging: queries por request, tiempo de DB, patrones N+1 y presupuesto por view.
+
+    Se instala solo con QUERY_INSPECTOR_ENABLED (ver settings); conviene que sea el primero
+    para contar también sesión/auth/org. Por request:
+    - headers X-Query-Count / X-Query-Time-Ms / X-Query-Duplicates
+    - warning (logger apps.core.queries) por cada fingerprint repetido >= QUERY_NPLUSONE_THRESHOLD
+      veces, con view, template y líneas de código que lo dispararon
+    - presupuesto: @query_budget(n) del view o QUERY_BUDGET_DEFAULT (0 = sin límite); excedido
+      -> warning, o QueryBudgetExceeded con QUERY_INSPECTOR_RAISE=True (hace fallar el test)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        match = request.resolver_match
+        request._query_view = (
+            (match.view_name if match and match.view_name else "")
+            or f"{view_func.__module__}.{getattr(view_func, '__qualname__', view_func.__name__)}",
+            getattr(view_func, "query_budget", None),
+        )
+        return None
+
+    def __call__(self, request):
+        with record_queries() as recorder:
+            response = self.get_response(request)
+
+        view, budget = getattr(request, "_query_view", (request.path, None))
+        if budget is None:
+            budget = int(getattr(settings, "QUERY_BUDGET_DEFAULT", 0) or 0)
+        threshold = int(getattr(settings, "QUERY_NPLUSONE_THRESHOLD", 5))
+        repeated = recorder.duplicates(threshold)
+
+        response["X-Query-Count"] = str(recorder.count)
+        response["X-Query-Time-Ms"] = f"{recorder.total_time * 1000:.1f}"
+        response["X-Query-Duplicates"] = str(sum(d.count - 1 for d in recorder.duplicates()))
+        metrics.incr("db.requests", view=view)
+        metrics.incr("db.queries", recorder.count, view=view)
+
+        for dup in repeated:
+            metrics.incr("db.nplusone", view=view)
+            logger.warning(
+                "N+1 en %s: %dx (%.1f ms) %s | código: %s | template: %s",
+                view,
+                dup.count,
+                dup.duration * 1000,
+                summarize(dup.fingerprint, 300),
+                "; ".join(dup.sources[:3]) or "-",
+                ", ".join(dup.templates) or "-",
+                extra={"view": view, "path": request.path, "query_count": dup.count},
+            )
+
+        if budget and recorder.count > budget:
+            metrics.incr("db.budget_exceeded", view=view)
+            message = budget_message(f"{request.method} {request.path} [{view}]", recorder, budget)
+            if getattr(settings, "QUERY_INSPECTOR_RAISE", False):
+                raise QueryBudgetExceeded(message)
+            logger.warning(message, extra={"view": view, "path": request.path, "query_count": recorder.count})
+
+        return response
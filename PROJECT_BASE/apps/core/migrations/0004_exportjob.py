@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:26
+
+import apps.core.models
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_globalconfig_login_icon_globalconfig_setup_complete_and_more"),
+        ("orgs", "0003_remove_organization_base_color_and_logo_add_updated"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportJob",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("source", models.CharField(max_length=100)),
+                ("query", models.TextField(blank=True, default="")),
+                ("format", models.CharField(max_length=10)),
+                ("status", models.CharField(choices=[("pending", "En cola"), ("running", "Procesando"), ("done", "Listo"), ("failed", "Error")], default="pending", max_length=10)),
+                ("total_rows", models.PositiveIntegerField(blank=True, null=True)),
+                ("processed_rows", models.PositiveIntegerField(default=0)),
+                ("file", models.FileField(blank=True, upload_to=apps.core.models._export_upload_to)),
+                ("error", models.TextField(blank=True, default="")),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("organization", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name="export_jobs", to="orgs.organization")),
+                ("user", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="export_jobs", to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                "verbose_name": "Export",
+                "verbose_name_plural": "Exports",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
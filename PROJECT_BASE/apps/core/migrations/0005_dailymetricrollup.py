@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_exportjob"),
+        ("orgs", "0003_remove_organization_base_color_and_logo_add_updated"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyMetricRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("metric", models.CharField(max_length=64)),
+                ("day", models.DateField()),
+                ("value", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("organization", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name="metric_rollups", to="orgs.organization")),
+            ],
+            options={
+                "verbose_name": "Métrica diaria",
+                "verbose_name_plural": "Métricas diarias",
+                "constraints": [models.UniqueConstraint(fields=("organization", "metric", "day"), name="core_rollup_org_metric_day"), models.UniqueConstraint(condition=models.Q(("organization__isnull", True)), fields=("metric", "day"), name="core_rollup_global_metric_day")],
+            },
+        ),
+    ]
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import copy
+import itertools
+import threading
+import time
 import uuid
 
+from django.conf import settings
 from django.core.cache import cache
+from django.core.signals import request_finished, request_started
 from django.db import models
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
 
@@ -22,8 +29,45 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+# Cache de singletons en dos niveles (por proceso + compartido):
+#   singleton:<label>:v          -> versión (int, time_ns al guardar)
+#   singleton:<label>:<versión>  -> instancia
+# Cada proceso guarda (versión, instancia) y consulta la versión en el cache compartido como
+# mucho una vez por request (o cada SINGLETON_CACHE_CHECK_INTERVAL segundos, si es > 0).
+# Fuera de un request (shell, worker) se consulta en cada load().
+# save() publica una versión nueva: los demás procesos la ven en su próximo check.
+_SINGLETON_VERSION_KEY = "singleton:{label}:v"
+_SINGLETON_ENTRY_KEY = "singleton:{label}:{version}"
+_singleton_local: dict[str, tuple[int, "SingletonModel"]] = {}
+_singleton_checks = threading.local()  # por thread: request en curso + último check por label
+_request_ids = itertools.count(1)
+
+
+@receiver(request_started, dispatch_uid="core_singleton_request_started")
+def _singleton_request_started(**kwargs) -> None:
+    _singleton_checks.request = next(_request_ids)
+
+
+@receiver(request_finished, dispatch_uid="core_singleton_request_finished")
+def _singleton_request_finished(**kwargs) -> None:
+    _singleton_checks.request = None
+
+
+def _last_check(label: str) -> tuple[int | None, float] | None:
+    return getattr(_singleton_checks, "last", {}).get(label)
+
+
+def _mark_checked(label: str) -> None:
+    if not hasattr(_singleton_checks, "last"):
+        _singleton_checks.last = {}
+    _singleton_checks.last[label] = (getattr(_singleton_checks, "request", None), time.monotonic())
+
+
 class SingletonModel(models.Model):
-    """Modelo abstracto para tablas que solo deben tener 1 registro."""
+    """Modelo abstracto para tablas que solo deben tener 1 registro.
+
+    load() sirve una copia de la instancia cacheada en el proceso (ver _singleton_local).
+    """
 
     class Meta:
         abstract = True
@@ -36,17 +80,75 @@ class SingletonModel(models.Model):
     def delete(self, *args, **kwargs):
         pass  # No permitir borrar
 
+    @classmethod
+    def _cache_label(cls) -> str:
+        return cls._meta.label_lower
+
+    @classmethod
+    def _shared_version(cls) -> int | None:
+        label = cls._cache_label()
+        local = _singleton_local.get(label)
+        checked = _last_check(label)
+        if local and checked:
+            request = getattr(_singleton_checks, "request", None)
+            interval = float(getattr(settings, "SINGLETON_CACHE_CHECK_INTERVAL", 0) or 0)
+            if (request is not None and checked[0] == request) or time.monotonic() - checked[1] < interval:
+                # Ya verificada en este request (o dentro del intervalo): sin ir al cache compartido.
+                return local[0]
+
+        version = cache.get(_SINGLETON_VERSION_KEY.format(label=label))
+        _mark_checked(label)
+        return version
+
     @classmethod
     def load(cls):
-        if cache.get(cls.__name__) is None:
-            obj, created = cls.objects.get_or_create(pk=1)
-            if created:
-                obj.set_cache()
-            return obj
-        return cache.get(cls.__name__)
+        label = cls._cache_label()
+        version = cls._shared_version()
+        local = _singleton_local.get(label)
+        if local and version is not None and local[0] == version:
+            return copy.copy(local[1])
 
-    def set_cache(self):
-        cache.set(self.__class__.__name__, self)
+        obj = None
+        if version is not None:
+            obj = cache.get(_SINGLETON_ENTRY_KEY.format(label=label, version=version))
+        if obj is None:
+            obj, _ = cls.objects.get_or_create(pk=1)
+            obj.set_cache(version)
+        else:
+            _singleton_local[label] = (version, obj)
+        # Copia: quien la modifique (p.ej. un form con instance=) no toca la del proceso.
+        return copy.copy(obj)
+
+    def set_cache(self, version: int | None = None) -> int:
+        """Publica esta instancia en el cache compartido y en el del proceso.
+
+        Sin `version` (save/invalidación) se genera una nueva: invalida las copias de
+        todos los procesos. Con `version` se re-siembra la entrada vigente tras un miss.
+        """
+
+        label = self._cache_label()
+        if version is None:
+            version_key = _SINGLETON_VERSION_KEY.format(label=label)
+            previous = cache.get(version_key)
+            if previous is not None:
+                cache.delete(_SINGLETON_ENTRY_KEY.format(label=label, version=previous))
+            version = time.time_ns()
+            cache.set(version_key, version, timeout=None)
+        cache.set(_SINGLETON_ENTRY_KEY.format(label=label, version=version), self, timeout=None)
+        _singleton_local[label] = (version, copy.copy(self))
+        _mark_checked(label)
+        return version
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Descarta las copias cacheadas (p.ej. tras un queryset.update() que no pasa por save())."""
+
+        label = cls._cache_label()
+        version_key = _SINGLETON_VERSION_KEY.format(label=label)
+        version = cache.get(version_key)
+        if version is not None:
+            cache.delete_many([version_key, _SINGLETON_ENTRY_KEY.format(label=label, version=version)])
+        _singleton_local.pop(label, None)
 
 
 class GlobalConfig(SingletonModel):
@@ -124,9 +226,141 @@ class GlobalConfig(SingletonModel):
         help_text="Estado inicial del sidebar.",
     )
 
+    # Versión del estado de setup en el cache compartido. SetupMiddleware la compara para
+    # soltar su latch de "setup completo" cuando el setup vuelve a quedar pendiente.
+    SETUP_VERSION_KEY = "core:setup:v"
+
     class Meta:
         verbose_name = "Configuración Global"
         verbose_name_plural = "Configuración Global"
 
     def __str__(self):
         return "Configuración del Sistema"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if not self.setup_complete:
+            # Setup pendiente otra vez (admin, wizard revertido): avisar a todos los procesos.
+            self.bump_setup_version()
+
+    @classmethod
+    def setup_version(cls) -> int:
+        return int(cache.get(cls.SETUP_VERSION_KEY) or 0)
+
+    @classmethod
+    def bump_setup_version(cls) -> None:
+        try:
+            cache.incr(cls.SETUP_VERSION_KEY)
+        except ValueError:
+            cache.set(cls.SETUP_VERSION_KEY, time.time_ns(), timeout=None)
+
+    @classmethod
+    def broadcast_setup_reset(cls) -> None:
+        """Base reseteada por fuera de save() (reset_database): descarta copias y latches."""
+
+        cls.invalidate_cache()
+        cls.bump_setup_version()
+
+
+def _export_upload_to(instance: "ExportJob", filename: str) -> str:
+    return f"exports/{instance.pk}/{filename}"
+
+
+class ExportJob(UUIDModel, TimeStampedModel):
+    """Export encolado (RQ): el worker escribe el archivo al storage y reporta progreso.
+
+    Lo crea apps.core.exports.services.start_export; lo ejecuta apps.core.jobs.run_export_job.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "En cola"),
+        (STATUS_RUNNING, "Procesando"),
+        (STATUS_DONE, "Listo"),
+        (STATUS_FAILED, "Error"),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="export_jobs")
+    organization = models.ForeignKey(
+        "orgs.Organization",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="export_jobs",
+    )
+
+    # Origen: slug del CrudConfig + querystring de filtros/orden al momento de encolar.
+    source = models.CharField(max_length=100)
+    query = models.TextField(blank=True, default="")
+    format = models.CharField(max_length=10)
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    total_rows = models.PositiveIntegerField(null=True, blank=True)
+    processed_rows = models.PositiveIntegerField(default=0)
+    file = models.FileField(upload_to=_export_upload_to, blank=True)
+    error = models.TextField(blank=True, default="")
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Export"
+        verbose_name_plural = "Exports"
+
+    def __str__(self):
+        return f"{self.source} ({self.format}) · {self.get_status_display()}"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in {self.STATUS_DONE, self.STATUS_FAILED}
+
+    @property
+    def progress_percent(self) -> int:
+        if self.status == self.STATUS_DONE:
+            return 100
+        if not self.total_rows:
+            return 0
+        return min(99, int(self.processed_rows * 100 / self.total_rows))
+
+
+class DailyMetricRollup(models.Model):
+    """Contador diario pre-agregado por (org, métrica, día) que lee el dashboard.
+
+    organization=None: métrica global (p.ej. usuarios de la plataforma).
+    Lo mantiene apps.core.dashboard.rollups (signals + job RQ + backfill_dashboard_rollups).
+    """
+
+    organization = models.ForeignKey(
+        "orgs.Organization",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="metric_rollups",
+    )
+    metric = models.CharField(max_length=64)
+    day = models.DateField()
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["organization", "metric", "day"],
+                name="core_rollup_org_metric_day",
+            ),
+            # NULL no colisiona en el unique anterior: índice parcial para las globales.
+            models.UniqueConstraint(
+                fields=["metric", "day"],
+                condition=models.Q(organization__isnull=True),
+                name="core_rollup_global_metric_day",
+            ),
+        ]
+        verbose_name = "Métrica diaria"
+        verbose_name_plural = "Métricas diarias"
+
+    def __str__(self):
+        scope = self.organization_id or "global"
+        return f"{self.metric} [{scope}] {self.day}: {self.value}"
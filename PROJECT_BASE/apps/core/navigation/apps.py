@@ -7,6 +7,8 @@ class NavigationConfig(AppConfig):
     name = "apps.core.navigation"
 
     def ready(self):
+        from . import signals  # noqa: F401  (invalidación del cache de menús)
+
         # Register System Modules
         registry.register(Module(
             slug="dashboard",
@@ -0,0 +1,100 @@
+"""Cache de menús de navegación por usuario.
+
+Clave en el cache compartido de Django:
+    nav:menu:<registry>:<global>:<user_v>:<user_id>:<org_id> -> (slug, ...)
+
+- registry: digest de los módulos registrados (NavigationRegistry.version)
+- global:   versión de grupos/permisos (Group, Permission, Group.permissions, Organization)
+- user_v:   versión del usuario (sus grupos/permisos, flags, membresías)
+
+Invalidación (apps/core/navigation/signals.py): se sube la versión correspondiente y las
+entradas viejas quedan huérfanas (expiran por NAVIGATION_CACHE_TTL). Memo por request.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+
+from apps.core.crud.permissions import has_permission
+
+from .defs import Module
+from .registry import registry
+
+
+_GLOBAL_VERSION_KEY = "nav:perms:v"
+_USER_VERSION_KEY = "nav:perms:v:{user_id}"
+_MENU_KEY = "nav:menu:{registry}:{global_v}:{user_v}:{user_id}:{org_id}"
+_MEMO_ATTR = "_navigation_modules"
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "NAVIGATION_CACHE_TTL", 300))
+
+
+def _versions(*keys: str) -> list[int]:
+    # Una sola ida al cache; las que falten arrancan en time_ns (nunca reaparece una vieja).
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), timeout=None)
+            found[key] = cache.get(key) or 0
+    return [int(found[key]) for key in keys]
+
+
+def _bump(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_user(user_id: Any) -> None:
+    if user_id is not None:
+        _bump(_USER_VERSION_KEY.format(user_id=user_id))
+
+
+def invalidate_all() -> None:
+    _bump(_GLOBAL_VERSION_KEY)
+
+
+def _needs_org(modules: list[Module]) -> bool:
+    return any((m.permission or "").startswith("role:") for m in modules)
+
+
+def get_navigation_modules(request: HttpRequest) -> list[Module]:
+    """Módulos visibles para el usuario del request, en el orden del registry."""
+
+    memo = getattr(request, _MEMO_ATTR, None)
+    if memo is not None:
+        return memo
+
+    user = getattr(request, "user", None)
+    if not user or not getattr(user, "is_authenticated", False):
+        return []
+
+    modules = registry.get_modules()
+    # La org activa solo entra en la clave si algún módulo usa specs "role:".
+    org = getattr(request, "organization", None) if _needs_org(modules) else None
+    global_v, user_v = _versions(_GLOBAL_VERSION_KEY, _USER_VERSION_KEY.format(user_id=user.pk))
+    key = _MENU_KEY.format(
+        registry=registry.version(),
+        global_v=global_v,
+        user_v=user_v,
+        user_id=user.pk,
+        org_id=getattr(org, "pk", None) if org else None,
+    )
+
+    slugs = cache.get(key)
+    if slugs is None:
+        # Memo por request compartido con el CRUD engine y las vistas.
+        slugs = tuple(m.slug for m in modules if not m.permission or has_permission(request, m.permission))
+        cache.set(key, slugs, timeout=_ttl())
+
+    allowed = [m for m in (registry.get(slug) for slug in slugs) if m is not None]
+    setattr(request, _MEMO_ATTR, allowed)
+    return allowed
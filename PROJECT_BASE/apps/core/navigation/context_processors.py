@@ -1,22 +1,15 @@
 from django.http import HttpRequest
-from apps.core.navigation.registry import registry
+from apps.core.context_processors import lazy_context_value
+from apps.core.navigation.cache import get_navigation_modules
 
 def navigation_context(request: HttpRequest):
     """
     Context processor to inject navigation modules into templates.
-    Filters modules based on user permissions.
+    Filters modules based on user permissions (cacheado por usuario, ver navigation.cache).
+    Lazy: solo se resuelve si el template lee navigation_modules (el sidebar).
     """
-    if not request.user.is_authenticated:
+    # Fragmentos HTMX: no renderizan el sidebar (salvo restore de historial, que pide la página).
+    if request.headers.get("HX-Request") == "true" and not request.headers.get("HX-History-Restore-Request"):
         return {"navigation_modules": []}
 
-    modules = registry.get_modules()
-    allowed_modules = []
-
-    for module in modules:
-        if module.permission:
-            if request.user.has_perm(module.permission):
-                allowed_modules.append(module)
-        else:
-            allowed_modules.append(module)
-
-    return {"navigation_modules": allowed_modules}
+    return {"navigation_modules": lazy_context_value("navigation", lambda: get_navigation_modules(request))}
@@ -1,12 +1,19 @@
-from typing import List, Dict
+import hashlib
+from typing import List, Dict, Optional
 from .defs import Module
 
 class NavigationRegistry:
     _modules: Dict[str, Module] = {}
+    _version: str = ""
 
     @classmethod
     def register(cls, module: Module):
         cls._modules[module.slug] = module
+        cls._version = ""
+
+    @classmethod
+    def get(cls, slug: str) -> Optional[Module]:
+        return cls._modules.get(slug)
 
     @classmethod
     def get_modules(cls) -> List[Module]:
@@ -20,4 +27,12 @@ class NavigationRegistry:
     def get_business_modules(cls) -> List[Module]:
         return [m for m in cls._modules.values() if m.kind == "business"]
 
+    @classmethod
+    def version(cls) -> str:
+        """Digest de los módulos registrados: igual en todos los procesos con el mismo código."""
+        if not cls._version:
+            raw = repr(list(cls._modules.values())).encode()
+            cls._version = hashlib.sha1(raw).hexdigest()[:12]
+        return cls._version
+
 registry = NavigationRegistry()
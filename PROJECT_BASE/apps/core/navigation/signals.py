@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.orgs.models import Membership, Organization
+
+from .cache import invalidate_all, invalidate_user
+
+
+User = get_user_model()
+
+# Saves de User que no cambian permisos (login) no invalidan el menú.
+_IGNORED_USER_FIELDS = {"last_login"}
+
+
+@receiver(m2m_changed, sender=User.groups.through, dispatch_uid="nav_user_groups_changed")
+@receiver(m2m_changed, sender=User.user_permissions.through, dispatch_uid="nav_user_permissions_changed")
+def _user_m2m_changed(sender, instance, action: str, reverse: bool, pk_set=None, **kwargs) -> None:
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_user(instance.pk)
+    elif pk_set:
+        # group.user_set.add(...) / permission.user_set.add(...): los usuarios afectados.
+        for user_id in pk_set:
+            invalidate_user(user_id)
+    else:
+        invalidate_all()
+
+
+@receiver(m2m_changed, sender=Group.permissions.through, dispatch_uid="nav_group_permissions_changed")
+def _group_permissions_changed(sender, action: str, **kwargs) -> None:
+    if action.startswith("post_"):
+        invalidate_all()
+
+
+@receiver(post_save, sender=Group, dispatch_uid="nav_group_saved")
+@receiver(post_delete, sender=Group, dispatch_uid="nav_group_deleted")
+@receiver(post_save, sender=Permission, dispatch_uid="nav_permission_saved")
+@receiver(post_delete, sender=Permission, dispatch_uid="nav_permission_deleted")
+@receiver(post_save, sender=Organization, dispatch_uid="nav_organization_saved")
+@receiver(post_delete, sender=Organization, dispatch_uid="nav_organization_deleted")
+def _global_changed(sender, **kwargs) -> None:
+    invalidate_all()
+
+
+@receiver(post_save, sender=User, dispatch_uid="nav_user_saved")
+def _user_saved(sender, instance, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and set(update_fields) <= _IGNORED_USER_FIELDS:
+        return
+    invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=Membership, dispatch_uid="nav_membership_saved")
+@receiver(post_delete, sender=Membership, dispatch_uid="nav_membership_deleted")
+def _membership_changed(sender, instance: Membership, **kwargs) -> None:
+    invalidate_user(instance.user_id)
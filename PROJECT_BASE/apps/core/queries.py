@@ -0,0 +1,238 @@
+"""Inspección de SQL por request: conteo, tiempo, fingerprints duplicados (N+1) y presupuestos.
+
+Pensado para debug/staging (QUERY_INSPECTOR_ENABLED, ver settings); en producción no se instala.
+
+- QueryRecorder: execute_wrapper de Django (funciona con DEBUG=False, sin connection.queries).
+  Por query guarda fingerprint, duración, la línea de código de la app que la disparó y
+  el template que se estaba renderizando (si hubo).
+- fingerprint(): SQL con literales/parámetros normalizados; mismo fingerprint N veces en un
+  request = patrón N+1 (p.ej. una query por fila de la tabla).
+- query_budget(n): máximo de queries declarado por view. QueryInspectorMiddleware lo compara
+  y, con QUERY_INSPECTOR_RAISE=True (tests), levanta QueryBudgetExceeded.
+- max_queries(n): lo mismo como context manager para código fuera de un view (services, jobs).
+- count_queries(): solo conteo + tiempo, sin stack ni fingerprint (barato: apto producción;
+  lo usa la instrumentación de BaseService).
+
+Uso en un view:
+
+    @login_required
+    @organization_required
+    @query_budget(12)
+    def index(request): ...
+
+Las queries de respuestas streaming ocurren después del middleware: no se cuentan.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+from django.conf import settings
+from django.db import connections
+from django.template.base import Node
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,)*\s*\?\s*\)", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+_SELECT_COLUMNS = re.compile(r"^SELECT (?:DISTINCT )?.+? FROM ", re.IGNORECASE)
+# Control de transacciones (atomic anidados): se repiten por diseño, no son N+1.
+_TRANSACTION = re.compile(r"^(?:BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE)\b", re.IGNORECASE)
+
+_MAX_FRAMES = 80
+# Frames propios del inspector: nunca son "la línea que disparó la query".
+_SKIP_FILES = ("apps/core/queries.py", "apps/core/middleware.py")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Un view (o bloque max_queries) hizo más queries que su presupuesto.
+
+    Hereda de AssertionError: en tests cuenta como fallo, no como error inesperado.
+    """
+
+
+def fingerprint(sql: str) -> str:
+    """SQL sin valores: literales y placeholders -> ?, listas IN (...) colapsadas."""
+
+    sql = sql.replace("%s", "?")
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+def summarize(fp: str, width: int = 200) -> str:
+    """Fingerprint para logs: sin la lista de columnas del SELECT y truncado."""
+
+    fp = _SELECT_COLUMNS.sub("SELECT … FROM ", fp, count=1)
+    return fp if len(fp) <= width else fp[: width - 1] + "…"
+
+
+def query_budget(limit: int) -> Callable[[F], F]:
+    """Declara el máximo de queries de un view. Usar como decorador más interno (junto al view):
+    login_required & co. copian el atributo con functools.wraps.
+    """
+
+    def decorator(view_func: F) -> F:
+        view_func.query_budget = limit  # type: ignore[attr-defined]
+        return view_func
+
+    return decorator
+
+
+@dataclass(frozen=True)
+class QueryRecord:
+    fingerprint: str
+    sql: str
+    duration: float  # segundos
+    source: str  # "apps/usuarios/views.py:63 in _list_members" ("" si no hay frame de la app)
+    template: str  # template en render al ejecutarse ("" si ninguno)
+
+
+@dataclass(frozen=True)
+class DuplicateQuery:
+    fingerprint: str
+    count: int
+    duration: float
+    sources: tuple[str, ...]
+    templates: tuple[str, ...]
+
+
+def _base_dir() -> str:
+    return str(Path(settings.BASE_DIR).resolve()) + "/"
+
+
+def _caller(base_dir: str) -> tuple[str, str]:
+    """(línea de la app, template) del stack actual; recorre pocos frames y solo en debug."""
+
+    source = template = ""
+    frame = sys._getframe(2)
+    depth = 0
+    while frame is not None and depth < _MAX_FRAMES and not (source and template):
+        filename = frame.f_code.co_filename
+        if not source and filename.startswith(base_dir) and "site-packages" not in filename:
+            relative = filename[len(base_dir):]
+            if relative not in _SKIP_FILES:
+                source = f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+        if not template:
+            node = frame.f_locals.get("self")
+            # type() y no isinstance(): un SimpleLazyObject se evaluaría (y haría otra query).
+            if issubclass(type(node), Node) and node.origin is not None:
+                template = node.origin.template_name or node.origin.name
+        frame = frame.f_back
+        depth += 1
+    return source, template
+
+
+@dataclass
+class QueryRecorder:
+    """execute_wrapper que acumula QueryRecord (ver connection.execute_wrapper)."""
+
+    records: list[QueryRecord] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._base_dir = _base_dir()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            source, template = _caller(self._base_dir)
+            self.records.append(QueryRecord(fingerprint(sql), sql, duration, source, template))
+
+    @property
+    def count(self) -> int:
+        return len(self.records)
+
+    @property
+    def total_time(self) -> float:
+        return sum(r.duration for r in self.records)
+
+    def duplicates(self, threshold: int = 2) -> list[DuplicateQuery]:
+        """Fingerprints repetidos >= threshold veces, los más repetidos primero."""
+
+        groups: dict[str, list[QueryRecord]] = {}
+        for record in self.records:
+            if _TRANSACTION.match(record.fingerprint):
+                continue
+            groups.setdefault(record.fingerprint, []).append(record)
+        found = [
+            DuplicateQuery(
+                fingerprint=fp,
+                count=len(records),
+                duration=sum(r.duration for r in records),
+                sources=tuple(dict.fromkeys(r.source for r in records if r.source)),
+                templates=tuple(dict.fromkeys(r.template for r in records if r.template)),
+            )
+            for fp, records in groups.items()
+            if len(records) >= threshold
+        ]
+        return sorted(found, key=lambda d: (-d.count, -d.duration))
+
+
+@dataclass
+class QueryCounter:
+    """execute_wrapper mínimo: cantidad de queries y tiempo total (segundos)."""
+
+    count: int = 0
+    total_time: float = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.total_time += time.perf_counter() - started
+            self.count += 1
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Cuenta las queries de todas las conexiones dentro del bloque (hilo actual)."""
+
+    counter = QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryRecorder]:
+    """Registra las queries de todas las conexiones dentro del bloque (hilo actual)."""
+
+    recorder = QueryRecorder()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        yield recorder
+
+
+@contextmanager
+def max_queries(limit: int, *, label: str = "bloque") -> Iterator[QueryRecorder]:
+    """Falla con QueryBudgetExceeded si el bloque hace más de `limit` queries."""
+
+    with record_queries() as recorder:
+        yield recorder
+    if recorder.count > limit:
+        raise QueryBudgetExceeded(budget_message(label, recorder, limit))
+
+
+def budget_message(label: str, recorder: QueryRecorder, limit: int) -> str:
+    lines = [f"{label}: {recorder.count} queries (presupuesto {limit})"]
+    for dup in recorder.duplicates()[:5]:
+        lines.append(f"  {dup.count}x {summarize(dup.fingerprint)}")
+        lines.extend(f"     desde {source}" for source in dup.sources[:3])
+    return "\n".join(lines)
@@ -0,0 +1,21 @@
+from .base import (
+    BaseService,
+    ExecutionContext,
+    ServiceError,
+    ServiceLogger,
+    ServiceResult,
+    ServiceWarning,
+)
+from .instrumentation import ServiceCall, register_service_observer, unregister_service_observer
+
+__all__ = [
+    "BaseService",
+    "ExecutionContext",
+    "ServiceError",
+    "ServiceLogger",
+    "ServiceResult",
+    "ServiceWarning",
+    "ServiceCall",
+    "register_service_observer",
+    "unregister_service_observer",
+]
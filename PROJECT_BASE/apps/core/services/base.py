@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import logging
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, is_dataclass
 from typing import Any, Dict, List, Optional
 
+from .instrumentation import instrument_execute
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
 
 @dataclass
 class ExecutionContext:
@@ -14,6 +19,22 @@ class ExecutionContext:
     locale: Optional[str] = None
     flags: Dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def for_request(cls, request: Any, **kwargs: Any) -> "ExecutionContext":
+        """Context for a view: actor, active organization and a request_id.
+
+        request_id comes from the X-Request-ID header (proxy/load balancer) or is generated
+        once per request, so every service call of the request shares it.
+        """
+
+        request_id = getattr(request, "request_id", None)
+        if not request_id:
+            request_id = request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+            request.request_id = request_id
+        kwargs.setdefault("actor", getattr(request, "user", None))
+        kwargs.setdefault("organization", getattr(request, "organization", None))
+        return cls(request_id=request_id, **kwargs)
+
 
 class ServiceLogger(logging.LoggerAdapter):
     def __init__(self, service_name: str, context: ExecutionContext | None = None) -> None:
@@ -93,7 +114,16 @@ class ServiceResult:
 
 
 class BaseService(ABC):
-    """Base contract for application services."""
+    """Base contract for application services.
+
+    Every subclass execute() is instrumented (timing, DB queries, outcome, request_id):
+    see apps.core.services.instrumentation.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "execute" in cls.__dict__ and not getattr(cls.execute, "__isabstractmethod__", False):
+            cls.execute = instrument_execute(cls.__dict__["execute"])
 
     def __init__(self, context: ExecutionContext | None = None) -> None:
         service_name = self.__class__.__name__
@@ -2,33 +2,528 @@ from __future__ import annotations
 
 import csv
 import importlib
-from io import BytesIO
-from typing import Iterable
+import io
+import json
+import tempfile
+import zlib
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO, Callable, Iterable, Iterator
 from datetime import datetime
 
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connections, models
 from django.http import FileResponse, StreamingHttpResponse
 from django.utils import timezone
 
 
-class _Echo:
-    """File-like adapter for csv.writer streaming."""
+class ExportLimitExceeded(Exception):
+    """El export síncrono supera el límite de filas: debe ir como export en segundo plano."""
+
+    def __init__(self, *, rows: int, limit: int) -> None:
+        super().__init__(f"El export tiene {rows} filas (límite síncrono: {limit}).")
+        self.rows = rows
+        self.limit = limit
 
-    def write(self, value: str) -> str:  # pragma: no cover
-        return value
 
+def export_filename(base: str, ext: str) -> str:
+    """Nombre de descarga: base saneada + timestamp + extensión."""
 
-def _default_filename(base: str, ext: str) -> str:
     ts = timezone.now().strftime("%Y-%m-%d_%H-%M-%S")
     safe = "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in base.strip())
     safe = safe or "export"
     return f"{safe}_{ts}.{ext}"
 
 
-def _convert_datetime(value):
-    """Convierte datetimes con timezone a naive para Excel."""
-    if isinstance(value, datetime) and value.tzinfo is not None:
-        return value.replace(tzinfo=None)
-    return value
+ROW_CHUNK_SIZE = 2000
+
+# Filas por fetch de iterator() según motor. PostgreSQL usa cursores server-side: chunks más
+# grandes = menos round-trips. SQLite/MySQL leen del cursor del cliente. Override:
+# settings.EXPORTS_ITERATOR_CHUNK_SIZE = {"postgresql": 10000, "default": 2000}.
+_ITERATOR_CHUNK_SIZES = {"postgresql": 5000, "sqlite": ROW_CHUNK_SIZE, "mysql": ROW_CHUNK_SIZE}
+
+
+def iterator_chunk_size(using: str | None = None) -> int:
+    vendor = connections[using or DEFAULT_DB_ALIAS].vendor
+    sizes = {**_ITERATOR_CHUNK_SIZES, **(getattr(settings, "EXPORTS_ITERATOR_CHUNK_SIZE", None) or {})}
+    return int(sizes.get(vendor, sizes.get("default", ROW_CHUNK_SIZE)))
+
+
+def spooled_file() -> IO[bytes]:
+    """Archivo temporal: en memoria hasta EXPORTS_SPOOL_MAX_SIZE, luego en disco.
+
+    Al cerrarse (FileResponse lo cierra al terminar la respuesta) se elimina.
+    """
+
+    max_size = int(getattr(settings, "EXPORTS_SPOOL_MAX_SIZE", 1024 * 1024))
+    return tempfile.SpooledTemporaryFile(max_size=max_size, mode="w+b")
+
+
+def _resolve_field(model, path: str):
+    field = None
+    for part in path.split("__"):
+        if model is None:
+            return None
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        model = field.related_model if field.is_relation else None
+    return field
+
+
+def datetime_columns(queryset, fields: list[str]) -> tuple[int, ...]:
+    """Índices de `fields` que son DateTimeField (para la conversión por columna del XLSX)."""
+
+    model = getattr(queryset, "model", None)
+    if model is None:
+        return ()
+    return tuple(
+        i for i, path in enumerate(fields) if isinstance(_resolve_field(model, path), models.DateTimeField)
+    )
+
+
+def _naive_datetime_batches(
+    rows: Iterable[Iterable],
+    columns: tuple[int, ...] | None,
+    *,
+    batch_size: int = ROW_CHUNK_SIZE,
+) -> Iterator[list[tuple]]:
+    """Lotes de filas con datetimes aware -> naive, convertidos por columna (no celda a celda).
+
+    columns=None: detecta las columnas datetime en el primer lote (writers sin queryset).
+    """
+
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        if columns is None:
+            first = batch[0]
+            columns = tuple(
+                i
+                for i in range(len(first))
+                if any(isinstance(row[i], datetime) for row in batch)
+            )
+        if not columns:
+            yield batch
+            continue
+        cols = [list(c) for c in zip(*batch)]
+        for i in columns:
+            cols[i] = [
+                v.replace(tzinfo=None) if v is not None and v.tzinfo is not None else v
+                for v in cols[i]
+            ]
+        yield list(zip(*cols))
+
+
+def iter_rows(
+    queryset,
+    fields: list[str],
+    *,
+    chunk_size: int | None = None,
+    on_progress: Callable[[int], None] | None = None,
+) -> Iterator[tuple]:
+    """Filas (values_list) en streaming. on_progress(n) se llama cada chunk_size filas y al final.
+
+    chunk_size=None: según el motor de la base del queryset (iterator_chunk_size).
+    """
+
+    if chunk_size is None:
+        chunk_size = iterator_chunk_size(queryset.db)
+    count = 0
+    for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+        yield row
+        count += 1
+        if on_progress is not None and count % chunk_size == 0:
+            on_progress(count)
+    if on_progress is not None:
+        on_progress(count)
+
+
+# --- Writers: escriben a un archivo binario (BytesIO, temp file). Los usan las respuestas
+# HTTP de abajo y los export jobs (apps.core.jobs), que suben el resultado al storage. ---
+
+
+CSV_BLOCK_SIZE = 64 * 1024
+
+
+def _csv_blocks(rows: Iterable[Iterable], headers: list[str], block_size: int) -> Iterator[bytes]:
+    """CSV en bloques de ~block_size: las filas se acumulan en un StringIO reutilizable.
+
+    block_size=0: una fila por chunk (comportamiento anterior; lo usa el benchmark).
+    """
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # UTF-8 BOM ayuda a Excel a detectar UTF-8 correctamente.
+    buffer.write("\ufeff")
+    writer.writerow(headers)
+    for row in rows:
+        writer.writerow(["" if v is None else v for v in row])
+        if buffer.tell() >= block_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def write_csv(out: IO[bytes], *, rows: Iterable[Iterable], headers: list[str], **_: object) -> None:
+    for block in _csv_blocks(rows, headers, CSV_BLOCK_SIZE):
+        out.write(block)
+
+
+def write_xlsx(
+    out: IO[bytes],
+    *,
+    rows: Iterable[Iterable],
+    headers: list[str],
+    sheet_name: str = "Export",
+    datetime_columns: tuple[int, ...] | None = None,
+    **_: object,
+) -> None:
+    try:
+        openpyxl = importlib.import_module("openpyxl")
+        Workbook = getattr(openpyxl, "Workbook")
+    except Exception as e:
+        raise RuntimeError("Dependencia faltante: openpyxl") from e
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=sheet_name[:31])
+
+    ws.append(headers)
+    # Excel no soporta timezone: datetimes aware -> naive, por columna y por lote.
+    for batch in _naive_datetime_batches(rows, datetime_columns):
+        for row in batch:
+            ws.append(row)
+
+    wb.save(out)
+
+
+# Layout fijo del PDF (landscape A4): anchos de columna y alto de fila precalculados, así cada
+# página se dibuja directo en el canvas (texto + una grilla) sin el layout de Table/LongTable.
+_PDF_MARGIN = 24
+_PDF_FONT_SIZE = 9
+_PDF_PADDING_X = 6
+_PDF_ROW_HEIGHT = 17  # font 9 + padding 4/4
+_PDF_HEADER_HEIGHT = 40  # título + fecha de cada página
+_PDF_FOOTER_HEIGHT = 14
+_PDF_MAX_COLUMN_CHARS = 60
+
+
+def _pdf_cell(value, max_chars: int) -> str:
+    text = "" if value is None else str(value)
+    if len(text) > max_chars:
+        return text[: max(max_chars - 1, 1)] + "…"
+    return text
+
+
+def _pdf_column_widths(headers: list[str], sample: list[tuple], total_width: float) -> list[float]:
+    """Anchos proporcionales al header y al p90 del largo de cada columna (muestra: 1ra página)."""
+
+    weights: list[int] = []
+    for i, header in enumerate(headers):
+        lengths = sorted(len(str(row[i])) for row in sample if row[i] is not None)
+        p90 = lengths[int(len(lengths) * 0.9)] if lengths else 0
+        weights.append(max(len(header), min(p90, _PDF_MAX_COLUMN_CHARS), 4))
+    scale = total_width / sum(weights)
+    return [w * scale for w in weights]
+
+
+def write_pdf(
+    out: IO[bytes],
+    *,
+    rows: Iterable[Iterable],
+    headers: list[str],
+    title: str = "Export",
+    **_: object,
+) -> None:
+    """Tabla PDF página a página: bloques de filas de tamaño fijo dibujados en el canvas.
+
+    Nunca se materializan todas las filas: cada página se arma, se dibuja y se descarta.
+    ReportLab retiene el contenido de las páginas emitidas hasta save(); por eso cada página
+    se dibuja con un solo objeto de texto y una grilla (pocos operadores por celda).
+    """
+
+    try:
+        colors = importlib.import_module("reportlab.lib.colors")
+        pagesizes = importlib.import_module("reportlab.lib.pagesizes")
+        canvas_mod = importlib.import_module("reportlab.pdfgen.canvas")
+        A4 = getattr(pagesizes, "A4")
+        landscape = getattr(pagesizes, "landscape")
+        Canvas = getattr(canvas_mod, "Canvas")
+    except Exception as e:
+        raise RuntimeError("Dependencia faltante: reportlab") from e
+
+    now = timezone.localtime(timezone.now())
+    subtitle = now.strftime("%Y-%m-%d %H:%M")
+
+    page_width, page_height = landscape(A4)
+    table_width = page_width - 2 * _PDF_MARGIN
+    table_height = page_height - 2 * _PDF_MARGIN - _PDF_HEADER_HEIGHT - _PDF_FOOTER_HEIGHT
+    rows_per_page = max(int(table_height // _PDF_ROW_HEIGHT) - 1, 1)  # -1: fila de headers
+    table_top = page_height - _PDF_MARGIN - _PDF_HEADER_HEIGHT
+    # Línea base del texto dentro de la fila (centrado vertical aproximado).
+    baseline_offset = (_PDF_ROW_HEIGHT - _PDF_FONT_SIZE) / 2 + 2
+
+    canvas = Canvas(out, pagesize=(page_width, page_height), pageCompression=1)
+    canvas.setTitle(title)
+
+    iterator = iter(rows)
+    block = list(islice(iterator, rows_per_page))
+    widths = _pdf_column_widths(headers, block, table_width)
+    xs = [_PDF_MARGIN]
+    for w in widths:
+        xs.append(xs[-1] + w)
+    # Helvetica ~0.5em por carácter: se recorta el texto que no entra en la celda.
+    max_chars = [max(int((w - 2 * _PDF_PADDING_X) / (_PDF_FONT_SIZE * 0.5)), 1) for w in widths]
+    header_row = [_pdf_cell(h, max_chars[i]) for i, h in enumerate(headers)]
+
+    header_bg = colors.HexColor("#F2F4F7")
+    header_fg = colors.HexColor("#111827")
+    grid_color = colors.HexColor("#D0D5DD")
+
+    page = 0
+    while True:
+        page += 1
+        top = page_height - _PDF_MARGIN
+        canvas.setFillColor(header_fg)
+        canvas.setFont("Helvetica-Bold", 14)
+        canvas.drawString(_PDF_MARGIN, top - 14, title)
+        canvas.setFont("Helvetica", _PDF_FONT_SIZE)
+        canvas.drawString(_PDF_MARGIN, top - 30, subtitle)
+        canvas.drawRightString(page_width - _PDF_MARGIN, _PDF_MARGIN, f"Página {page}")
+
+        n_rows = len(block) + 1
+        ys = [table_top - i * _PDF_ROW_HEIGHT for i in range(n_rows + 1)]
+
+        canvas.setFillColor(header_bg)
+        canvas.rect(_PDF_MARGIN, ys[1], table_width, _PDF_ROW_HEIGHT, stroke=0, fill=1)
+
+        text = canvas.beginText()
+        text.setFillColor(header_fg)
+        text.setFont("Helvetica-Bold", _PDF_FONT_SIZE)
+        y = ys[1] + baseline_offset
+        for i, value in enumerate(header_row):
+            text.setTextOrigin(xs[i] + _PDF_PADDING_X, y)
+            text.textOut(value)
+        text.setFont("Helvetica", _PDF_FONT_SIZE)
+        for r, row in enumerate(block, start=2):
+            y = ys[r] + baseline_offset
+            for i, value in enumerate(row):
+                cell = _pdf_cell(value, max_chars[i])
+                if cell:
+                    text.setTextOrigin(xs[i] + _PDF_PADDING_X, y)
+                    text.textOut(cell)
+        canvas.drawText(text)
+
+        canvas.setStrokeColor(grid_color)
+        canvas.setLineWidth(0.25)
+        canvas.grid(xs, ys)
+        canvas.showPage()
+
+        block = list(islice(iterator, rows_per_page))
+        if not block:
+            break
+
+    canvas.save()
+
+
+# --- Formatos tipados (analytics): NDJSON y Parquet. Las claves/columnas son los paths de
+# export_fields (no los headers de display) y los tipos salen del modelo (export_schema). ---
+
+_PARQUET_ROW_GROUP_SIZE = 50_000
+
+
+def export_schema(queryset, fields: list[str]) -> list[tuple[str, models.Field | None]]:
+    """[(path, field del modelo | None)] para cada export field."""
+
+    model = getattr(queryset, "model", None)
+    return [(path, _resolve_field(model, path) if model is not None else None) for path in fields]
+
+
+def _ndjson_blocks(rows: Iterable[Iterable], keys: list[str], block_size: int) -> Iterator[bytes]:
+    # DjangoJSONEncoder: datetime/date/Decimal/UUID -> ISO/str; números y booleanos nativos.
+    encoder = DjangoJSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(encoder.encode(dict(zip(keys, row))))
+        buffer.write("\n")
+        if buffer.tell() >= block_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def write_ndjson(
+    out: IO[bytes],
+    *,
+    rows: Iterable[Iterable],
+    headers: list[str],
+    fields: list[str] | None = None,
+    **_: object,
+) -> None:
+    for block in _ndjson_blocks(rows, list(fields or headers), CSV_BLOCK_SIZE):
+        out.write(block)
+
+
+_ARROW_INT_TYPES = {
+    "AutoField",
+    "BigAutoField",
+    "SmallAutoField",
+    "IntegerField",
+    "BigIntegerField",
+    "SmallIntegerField",
+    "PositiveIntegerField",
+    "PositiveBigIntegerField",
+    "PositiveSmallIntegerField",
+}
+
+
+def _arrow_type(pa, field: models.Field | None):
+    if field is not None and field.is_relation:
+        # FK/O2O exportado como id: tipo del pk destino.
+        field = field.target_field
+    internal = field.get_internal_type() if field is not None else ""
+    if internal in _ARROW_INT_TYPES:
+        return pa.int64()
+    if internal == "BooleanField":
+        return pa.bool_()
+    if internal == "FloatField":
+        return pa.float64()
+    if internal == "DecimalField":
+        return pa.decimal128(field.max_digits, field.decimal_places)
+    if internal == "DateTimeField":
+        return pa.timestamp("us", tz="UTC")
+    if internal == "DateField":
+        return pa.date32()
+    return pa.string()
+
+
+def _as_text(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return str(value)
+
+
+def write_parquet(
+    out: IO[bytes],
+    *,
+    rows: Iterable[Iterable],
+    headers: list[str],
+    fields: list[str] | None = None,
+    schema: list[tuple[str, models.Field | None]] | None = None,
+    **_: object,
+) -> None:
+    """Parquet por row groups de _PARQUET_ROW_GROUP_SIZE filas (memoria acotada por grupo)."""
+
+    try:
+        pa = importlib.import_module("pyarrow")
+        pq = importlib.import_module("pyarrow.parquet")
+    except Exception as e:
+        raise RuntimeError("Dependencia faltante: pyarrow") from e
+
+    if schema is None:
+        schema = [(name, None) for name in (fields or headers)]
+    arrow_schema = pa.schema([(name, _arrow_type(pa, field)) for name, field in schema])
+
+    writer = pq.ParquetWriter(out, arrow_schema, compression="snappy")
+    try:
+        iterator = iter(rows)
+        while True:
+            batch = list(islice(iterator, _PARQUET_ROW_GROUP_SIZE))
+            if not batch:
+                break
+            columns = zip(*batch)
+            writer.write_table(
+                pa.Table.from_arrays(
+                    [
+                        pa.array(
+                            [_as_text(v) for v in col] if pa.types.is_string(f.type) else list(col),
+                            type=f.type,
+                        )
+                        for f, col in zip(arrow_schema, columns)
+                    ],
+                    schema=arrow_schema,
+                )
+            )
+    finally:
+        writer.close()
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    ext: str
+    label: str
+    content_type: str
+    writer: Callable[..., None]
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    "csv": ExportFormat("csv", "CSV", "text/csv; charset=utf-8", write_csv),
+    "xlsx": ExportFormat(
+        "xlsx",
+        "Excel",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        write_xlsx,
+    ),
+    "pdf": ExportFormat("pdf", "PDF", "application/pdf", write_pdf),
+    "ndjson": ExportFormat("ndjson", "NDJSON", "application/x-ndjson; charset=utf-8", write_ndjson),
+    "parquet": ExportFormat("parquet", "Parquet", "application/vnd.apache.parquet", write_parquet),
+}
+
+
+def get_export_format(fmt: str) -> ExportFormat:
+    try:
+        return EXPORT_FORMATS[(fmt or "").strip().lower()]
+    except KeyError:
+        raise ValueError(f"Formato de exportación no soportado: {fmt}") from None
+
+
+def accepts_gzip(request) -> bool:
+    """True si EXPORTS_CSV_GZIP está activo y el Accept-Encoding admite gzip con q > 0.
+
+    Un `gzip` explícito manda sobre `*` (p.ej. "gzip;q=0, *" rechaza gzip).
+    """
+
+    if not getattr(settings, "EXPORTS_CSV_GZIP", False) or request is None:
+        return False
+
+    qualities: dict[str, float] = {}
+    for item in (request.META.get("HTTP_ACCEPT_ENCODING") or "").split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            if param.lower().startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def _gzip_blocks(blocks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: formato gzip
+    for block in blocks:
+        data = compressor.compress(block)
+        if data:
+            yield data
+    yield compressor.flush()
 
 
 def stream_csv(
@@ -37,24 +532,27 @@ def stream_csv(
     fields: list[str],
     headers: list[str],
     filename_base: str = "export",
+    block_size: int = CSV_BLOCK_SIZE,
+    compress: bool = False,
 ) -> StreamingHttpResponse:
-    """Stream CSV without loading all rows in memory."""
+    """Stream CSV without loading all rows in memory.
+
+    Emite bloques de ~64KB (no un chunk por fila). compress=True aplica
+    Content-Encoding: gzip (ver accepts_gzip).
+    """
 
     if len(fields) != len(headers):
         raise ValueError("fields y headers deben tener el mismo tamaño")
 
-    pseudo_buffer = _Echo()
-    writer = csv.writer(pseudo_buffer)
+    blocks = _csv_blocks(iter_rows(queryset, fields), headers, block_size)
+    if compress:
+        blocks = _gzip_blocks(blocks)
 
-    def row_iter() -> Iterable[bytes]:
-        # UTF-8 BOM ayuda a Excel a detectar UTF-8 correctamente.
-        yield b"\xef\xbb\xbf"
-        yield writer.writerow(headers).encode("utf-8")
-        for row in queryset.values_list(*fields).iterator(chunk_size=2000):
-            yield writer.writerow(["" if v is None else v for v in row]).encode("utf-8")
-
-    resp = StreamingHttpResponse(row_iter(), content_type="text/csv; charset=utf-8")
-    resp["Content-Disposition"] = f'attachment; filename="{_default_filename(filename_base, "csv")}"'
+    resp = StreamingHttpResponse(blocks, content_type="text/csv; charset=utf-8")
+    resp["Content-Disposition"] = f'attachment; filename="{export_filename(filename_base, "csv")}"'
+    if compress:
+        resp["Content-Encoding"] = "gzip"
+        resp["Vary"] = "Accept-Encoding"
     return resp
 
 
@@ -66,36 +564,35 @@ def build_xlsx(
     filename_base: str = "export",
     sheet_name: str = "Export",
 ) -> FileResponse:
-    """Generate XLSX (Excel). Uses write_only mode to reduce memory, but returns a bytes response."""
+    """Generate XLSX (Excel) with constant memory.
+
+    write_only + archivo spooled (disco si supera EXPORTS_SPOOL_MAX_SIZE); FileResponse lo
+    sirve por bloques y lo cierra (y elimina) al terminar.
+    """
 
     if len(fields) != len(headers):
         raise ValueError("fields y headers deben tener el mismo tamaño")
 
+    out = spooled_file()
     try:
-        openpyxl = importlib.import_module("openpyxl")
-        Workbook = getattr(openpyxl, "Workbook")
-    except Exception as e:
-        raise RuntimeError("Dependencia faltante: openpyxl") from e
-
-    wb = Workbook(write_only=True)
-    ws = wb.create_sheet(title=sheet_name[:31])
-
-    ws.append(headers)
-    for row in queryset.values_list(*fields).iterator(chunk_size=2000):
-        # Convertir datetimes con timezone a naive para Excel
-        converted_row = [_convert_datetime(v) for v in row]
-        ws.append(list(converted_row))
-
-    bio = BytesIO()
-    wb.save(bio)
-    bio.seek(0)
+        write_xlsx(
+            out,
+            rows=iter_rows(queryset, fields),
+            headers=headers,
+            sheet_name=sheet_name,
+            datetime_columns=datetime_columns(queryset, fields),
+        )
+        out.seek(0)
+    except BaseException:
+        out.close()
+        raise
 
-    filename = _default_filename(filename_base, "xlsx")
+    filename = export_filename(filename_base, "xlsx")
     return FileResponse(
-        bio,
+        out,
         as_attachment=True,
         filename=filename,
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        content_type=EXPORT_FORMATS["xlsx"].content_type,
     )
 
 
@@ -106,80 +603,118 @@ def build_pdf_table(
     headers: list[str],
     title: str = "Export",
     filename_base: str = "export",
+    max_rows: int | None = None,
 ) -> FileResponse:
-    """Generate a simple professional PDF table (landscape) with header title + date."""
+    """Generate a simple professional PDF table (landscape) with header title + date.
+
+    Síncrono: si el queryset supera max_rows (default EXPORTS_PDF_MAX_ROWS) levanta
+    ExportLimitExceeded para que el caller lo derive a un export en segundo plano.
+    """
 
     if len(fields) != len(headers):
         raise ValueError("fields y headers deben tener el mismo tamaño")
 
-    try:
-        colors = importlib.import_module("reportlab.lib.colors")
-        pagesizes = importlib.import_module("reportlab.lib.pagesizes")
-        styles_mod = importlib.import_module("reportlab.lib.styles")
-        platypus = importlib.import_module("reportlab.platypus")
-        tables_mod = importlib.import_module("reportlab.platypus.tables")
-        A4 = getattr(pagesizes, "A4")
-        landscape = getattr(pagesizes, "landscape")
-        getSampleStyleSheet = getattr(styles_mod, "getSampleStyleSheet")
-        LongTable = getattr(platypus, "LongTable")
-        Paragraph = getattr(platypus, "Paragraph")
-        SimpleDocTemplate = getattr(platypus, "SimpleDocTemplate")
-        Spacer = getattr(platypus, "Spacer")
-        TableStyle = getattr(tables_mod, "TableStyle")
-    except Exception as e:
-        raise RuntimeError("Dependencia faltante: reportlab") from e
+    if max_rows is None:
+        max_rows = int(getattr(settings, "EXPORTS_PDF_MAX_ROWS", 5000))
+    if max_rows:
+        rows = queryset.count()
+        if rows > max_rows:
+            raise ExportLimitExceeded(rows=rows, limit=max_rows)
 
-    now = timezone.localtime(timezone.now())
-    subtitle = now.strftime("%Y-%m-%d %H:%M")
+    out = spooled_file()
+    try:
+        write_pdf(out, rows=iter_rows(queryset, fields), headers=headers, title=title)
+        out.seek(0)
+    except BaseException:
+        out.close()
+        raise
 
-    # Construimos data (header + rows). Para PDFs muy grandes, esto puede crecer.
-    data: list[list[str]] = [headers]
-    for row in queryset.values_list(*fields).iterator(chunk_size=2000):
-        data.append(["" if v is None else str(v) for v in row])
-
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=landscape(A4),
-        leftMargin=24,
-        rightMargin=24,
-        topMargin=24,
-        bottomMargin=24,
-        title=title,
+    return FileResponse(
+        out,
+        as_attachment=True,
+        filename=export_filename(filename_base, "pdf"),
+        content_type="application/pdf",
     )
 
-    styles = getSampleStyleSheet()
-    story = [
-        Paragraph(title, styles["Title"]),
-        Paragraph(subtitle, styles["Normal"]),
-        Spacer(1, 12),
-    ]
-
-    table = LongTable(data, repeatRows=1)
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#F2F4F7")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#111827")),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#D0D5DD")),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                ("TOPPADDING", (0, 0), (-1, -1), 4),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ]
-        )
-    )
 
-    story.append(table)
-    doc.build(story)
+def stream_ndjson(
+    *,
+    queryset,
+    fields: list[str],
+    filename_base: str = "export",
+    compress: bool = False,
+) -> StreamingHttpResponse:
+    """NDJSON (un objeto por línea, claves = export fields) en bloques de ~64KB."""
+
+    blocks = _ndjson_blocks(iter_rows(queryset, fields), fields, CSV_BLOCK_SIZE)
+    if compress:
+        blocks = _gzip_blocks(blocks)
+
+    resp = StreamingHttpResponse(blocks, content_type=EXPORT_FORMATS["ndjson"].content_type)
+    resp["Content-Disposition"] = f'attachment; filename="{export_filename(filename_base, "ndjson")}"'
+    if compress:
+        resp["Content-Encoding"] = "gzip"
+        resp["Vary"] = "Accept-Encoding"
+    return resp
+
+
+def build_parquet(
+    *,
+    queryset,
+    fields: list[str],
+    filename_base: str = "export",
+) -> FileResponse:
+    """Parquet con tipos del modelo, armado en archivo spooled (requiere pyarrow)."""
+
+    out = spooled_file()
+    try:
+        write_parquet(
+            out,
+            rows=iter_rows(queryset, fields),
+            headers=fields,
+            schema=export_schema(queryset, fields),
+        )
+        out.seek(0)
+    except BaseException:
+        out.close()
+        raise
 
-    buffer.seek(0)
     return FileResponse(
-        buffer,
+        out,
         as_attachment=True,
-        filename=_default_filename(filename_base, "pdf"),
-        content_type="application/pdf",
+        filename=export_filename(filename_base, "parquet"),
+        content_type=EXPORT_FORMATS["parquet"].content_type,
     )
+
+
+def export_response(
+    fmt: str,
+    *,
+    queryset,
+    fields: list[str],
+    headers: list[str],
+    filename_base: str = "export",
+    title: str = "Export",
+    compress: bool = False,
+) -> StreamingHttpResponse | FileResponse:
+    """Respuesta síncrona para cualquier formato de EXPORT_FORMATS.
+
+    Puede levantar ExportLimitExceeded (PDF) y ValueError (formato desconocido).
+    """
+
+    ext = get_export_format(fmt).ext
+    if ext == "csv":
+        return stream_csv(
+            queryset=queryset, fields=fields, headers=headers, filename_base=filename_base, compress=compress
+        )
+    if ext == "ndjson":
+        return stream_ndjson(queryset=queryset, fields=fields, filename_base=filename_base, compress=compress)
+    if ext == "xlsx":
+        return build_xlsx(
+            queryset=queryset, fields=fields, headers=headers, filename_base=filename_base, sheet_name=title
+        )
+    if ext == "pdf":
+        return build_pdf_table(
+            queryset=queryset, fields=fields, headers=headers, title=title, filename_base=filename_base
+        )
+    return build_parquet(queryset=queryset, fields=fields, filename_base=filename_base)
@@ -0,0 +1,211 @@
+"""Instrumentación de BaseService.execute: tiempo, queries, resultado y request_id por llamada.
+
+Todo subclass de BaseService que define execute() queda envuelto (BaseService.__init_subclass__);
+los services no cambian. Por llamada se arma un ServiceCall y se publica en:
+
+- log estructurado: logger `service_core.<Service>` (ServiceLogger), mensaje "service.execute"
+  con extra {service, outcome, error_codes, duration_ms, db_queries, db_time_ms, request_id}.
+  DEBUG normalmente; WARNING si dura >= SERVICES_SLOW_MS.
+- métricas en proceso (apps.core.metrics):
+  - histogramas service.duration_ms / service.db_queries / service.db_time_ms {service}
+  - contadores service.calls {service, outcome} y service.errors {service, code}
+- observers registrados con register_service_observer(fn): fn(call) para exportar a otro
+  backend (tracing, StatsD...). Un observer que falla se loguea y no afecta al service.
+
+Exports síncronos (crud_export_view) no son un service: usan instrument_response(), que publica
+un ServiceCall "export.<slug>.<formato>" al terminar de transmitir, con las queries del armado y
+las del stream (CSV/NDJSON consultan la base mientras se envía la respuesta, cuando
+QueryInspectorMiddleware ya terminó).
+
+SERVICES_INSTRUMENTATION=False desactiva todo (execute original, sin overhead).
+Llamadas anidadas (un service que llama a otro) se miden cada una por su lado: las queries
+del interno también cuentan en el externo.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+from django.conf import settings
+from django.http.response import HttpResponseBase
+
+from apps.core import metrics
+from apps.core.queries import QueryCounter, count_queries
+
+
+logger = logging.getLogger(__name__)
+
+ServiceObserver = Callable[["ServiceCall"], None]
+
+_observers: list[ServiceObserver] = []
+
+# Buckets de conteo de queries (los de tiempo usan metrics.DEFAULT_BUCKETS, en ms).
+QUERY_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+
+@dataclass(frozen=True)
+class ServiceCall:
+    service: str
+    outcome: str  # "ok" | "error" (ServiceResult con errores) | "exception" | "aborted" (stream cortado)
+    error_codes: tuple[str, ...]
+    duration_ms: float
+    db_queries: int
+    db_time_ms: float
+    request_id: str | None
+
+    def as_log_extra(self) -> dict[str, Any]:
+        return {
+            "outcome": self.outcome,
+            "error_codes": list(self.error_codes),
+            "duration_ms": round(self.duration_ms, 2),
+            "db_queries": self.db_queries,
+            "db_time_ms": round(self.db_time_ms, 2),
+            "request_id": self.request_id,
+        }
+
+
+def register_service_observer(observer: ServiceObserver) -> ServiceObserver:
+    """Agrega un observer de llamadas a services (usable como decorador)."""
+
+    if observer not in _observers:
+        _observers.append(observer)
+    return observer
+
+
+def unregister_service_observer(observer: ServiceObserver) -> None:
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def _enabled() -> bool:
+    return bool(getattr(settings, "SERVICES_INSTRUMENTATION", True))
+
+
+def _slow_ms() -> float:
+    return float(getattr(settings, "SERVICES_SLOW_MS", 500))
+
+
+def _outcome(result: Any) -> tuple[str, tuple[str, ...]]:
+    errors = getattr(result, "errors", None) or []
+    if not errors:
+        return "ok", ()
+    return "error", tuple(dict.fromkeys(getattr(e, "code", "unknown") for e in errors))
+
+
+def publish(call: ServiceCall, service_logger: logging.LoggerAdapter | None = None) -> None:
+    metrics.observe("service.duration_ms", call.duration_ms, service=call.service)
+    metrics.observe("service.db_queries", call.db_queries, buckets=QUERY_BUCKETS, service=call.service)
+    metrics.observe("service.db_time_ms", call.db_time_ms, service=call.service)
+    metrics.incr("service.calls", service=call.service, outcome=call.outcome)
+    for code in call.error_codes:
+        metrics.incr("service.errors", service=call.service, code=code)
+
+    level = logging.WARNING if call.duration_ms >= _slow_ms() else logging.DEBUG
+    target = service_logger or logger
+    if target.isEnabledFor(level):
+        # request_id del extra tiene prioridad sobre el del contexto con que se creó el logger.
+        target.log(level, "service.execute", extra=call.as_log_extra())
+
+    for observer in list(_observers):
+        try:
+            observer(call)
+        except Exception:
+            logger.exception("Observer de services falló: %r", observer)
+
+
+def instrument_response(
+    response: HttpResponseBase,
+    *,
+    service: str,
+    started: float,
+    queries: QueryCounter,
+    request_id: str | None = None,
+) -> HttpResponseBase:
+    """Publica el ServiceCall de un view cuando la respuesta termina de enviarse.
+
+    `started` (perf_counter) y `queries` cubren el armado dentro del view. Si la respuesta es
+    streaming sobre un iterador (no un archivo ya armado), se envuelve su contenido para sumar
+    el tiempo y las queries del stream.
+    """
+
+    def call(outcome: str, codes: tuple[str, ...], extra: QueryCounter | None = None) -> ServiceCall:
+        return ServiceCall(
+            service=service,
+            outcome=outcome,
+            error_codes=codes,
+            duration_ms=(time.perf_counter() - started) * 1000,
+            db_queries=queries.count + (extra.count if extra else 0),
+            db_time_ms=(queries.total_time + (extra.total_time if extra else 0.0)) * 1000,
+            request_id=request_id,
+        )
+
+    if not _enabled():
+        return response
+    if not response.streaming or getattr(response, "file_to_stream", None) is not None:
+        publish(call("ok", ()))
+        return response
+
+    content = response.streaming_content
+
+    def stream() -> Iterator[bytes]:
+        outcome, codes = "exception", ()
+        with count_queries() as streamed:
+            try:
+                yield from content
+                outcome = "ok"
+            except GeneratorExit:
+                # Cliente desconectado: el servidor cierra el iterador.
+                outcome = "aborted"
+                raise
+            except Exception as exc:
+                codes = (type(exc).__name__,)
+                raise
+            finally:
+                publish(call(outcome, codes, streamed))
+
+    response.streaming_content = stream()
+    return response
+
+
+def instrument_execute(execute: Callable[..., Any]) -> Callable[..., Any]:
+    """Envuelve un execute() de BaseService (idempotente)."""
+
+    if getattr(execute, "__instrumented__", False):
+        return execute
+
+    @functools.wraps(execute)
+    def wrapper(self, input_data: Any, *args: Any, **kwargs: Any) -> Any:
+        if not _enabled():
+            return execute(self, input_data, *args, **kwargs)
+
+        context = kwargs.get("context") or getattr(self, "_context", None)
+        outcome, codes = "exception", ()
+        started = time.perf_counter()
+        with count_queries() as queries:
+            try:
+                result = execute(self, input_data, *args, **kwargs)
+                outcome, codes = _outcome(result)
+                return result
+            except Exception as exc:
+                codes = (type(exc).__name__,)
+                raise
+            finally:
+                publish(
+                    ServiceCall(
+                        service=type(self).__name__,
+                        outcome=outcome,
+                        error_codes=codes,
+                        duration_ms=(time.perf_counter() - started) * 1000,
+                        db_queries=queries.count,
+                        db_time_ms=queries.total_time * 1000,
+                        request_id=getattr(context, "request_id", None),
+                    ),
+                    getattr(self, "logger", None),
+                )
+
+    wrapper.__instrumented__ = True  # type: ignore[attr-defined]
+    return wrapper
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.core.crud.counting import cached_count, count_queryset, invalidate_counts
+from apps.core.crud.registry import get_crud
+from apps.orgs.models import Membership, Organization
+from apps.usuarios.crud_config import CRUD_SLUG_MEMBERS
+
+
+class CachedCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.org = Organization.objects.create(name="Org", slug="org")
+        User = get_user_model()
+        for i in range(3):
+            Membership.objects.create(user=User.objects.create_user(f"user{i}"), organization=cls.org)
+
+    def setUp(self):
+        cache.clear()
+        self.qs = Membership.objects.filter(organization=self.org)
+
+    def _count(self):
+        return cached_count(self.qs, namespace=CRUD_SLUG_MEMBERS, ttl=300)
+
+    def test_second_count_is_served_from_cache(self):
+        first = self._count()
+        self.assertEqual((first.value, first.cached, first.is_exact), (3, False, True))
+
+        with self.assertNumQueries(0):
+            second = self._count()
+        self.assertEqual((second.value, second.cached, second.is_exact), (3, True, False))
+
+    def test_invalidate_counts_drops_every_filter_of_the_namespace(self):
+        self._count()
+        invalidate_counts(CRUD_SLUG_MEMBERS)
+        self.assertFalse(self._count().cached)
+
+    def test_save_and_delete_bump_the_version(self):
+        # usuarios.members usa count_strategy="cached": register_crud conecta la invalidación.
+        self.assertNotEqual(get_crud(CRUD_SLUG_MEMBERS).count_strategy, "exact")
+        self._count()
+
+        user = get_user_model().objects.create_user("nuevo")
+        membership = Membership.objects.create(user=user, organization=self.org)
+        added = self._count()
+        self.assertEqual((added.value, added.cached), (4, False))
+
+        membership.delete()
+        removed = self._count()
+        self.assertEqual((removed.value, removed.cached), (3, False))
+
+    def test_unknown_strategy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            count_queryset(self.qs, strategy="magic", namespace="x", ttl=1, estimate_threshold=0)
+
+    def test_estimated_falls_back_to_cached_count_outside_postgres(self):
+        result = count_queryset(
+            self.qs, strategy="estimated", namespace=CRUD_SLUG_MEMBERS, ttl=300, estimate_threshold=0
+        )
+        self.assertEqual((result.value, result.is_estimate), (3, False))
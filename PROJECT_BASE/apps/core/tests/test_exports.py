@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from apps.core.crud.exports import crud_export_view
+from apps.core.models import ExportJob, GlobalConfig
+from apps.core.services.exporting import EXPORT_FORMATS
+from apps.crud_example.crud_config import CRUD_SLUG_ITEM
+from apps.crud_example.models import Item
+from apps.orgs.models import Membership, Organization
+from apps.orgs.utils import SESSION_KEY
+
+
+class CrudExportViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.admin = User.objects.create_superuser("admin", "admin@example.com", "x")
+        cls.viewer = User.objects.create_user("sin_permisos")
+        for i in range(3):
+            Item.objects.create(name=f"Item {i}")
+
+    def setUp(self):
+        self.view = crud_export_view(CRUD_SLUG_ITEM)
+        self.factory = RequestFactory()
+
+    def _get(self, user=None, method="get", **kwargs):
+        fmt = kwargs.pop("fmt", None)
+        request = getattr(self.factory, method)("/crud-example/export/", **kwargs)
+        request.user = user or self.admin
+        return self.view(request, fmt=fmt)
+
+    def test_each_format_status_and_content_type(self):
+        for key, export_format in EXPORT_FORMATS.items():
+            with self.subTest(format=key):
+                if key == "parquet" and importlib.util.find_spec("pyarrow") is None:
+                    self.skipTest("pyarrow no instalado")
+                response = self._get(fmt=key)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response["Content-Type"], export_format.content_type)
+                self.assertIn(f'.{export_format.ext}"', response["Content-Disposition"])
+                self.assertEqual(response["Accept-Ranges"], "none")
+                body = b"".join(response.streaming_content) if response.streaming else response.content
+                self.assertTrue(body)
+
+    def test_csv_and_ndjson_contain_every_row(self):
+        csv = b"".join(self._get(fmt="csv").streaming_content).decode("utf-8-sig")
+        self.assertEqual(len(csv.strip().splitlines()), 4)  # header + 3 filas
+
+        ndjson = b"".join(self._get(fmt="ndjson").streaming_content).decode()
+        rows = [json.loads(line) for line in ndjson.splitlines()]
+        self.assertEqual(sorted(r["name"] for r in rows), ["Item 0", "Item 1", "Item 2"])
+
+    def test_head_has_no_body_nor_length(self):
+        response = self._get(method="head", fmt="csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Length", response)
+        self.assertEqual(b"".join(response.streaming_content), b"")
+
+    def test_accept_negotiation(self):
+        response = self._get(HTTP_ACCEPT="application/x-ndjson, text/csv;q=0.5")
+        self.assertEqual(response["Content-Type"], EXPORT_FORMATS["ndjson"].content_type)
+        b"".join(response.streaming_content)
+
+        self.assertEqual(self._get(HTTP_ACCEPT="image/png").status_code, 406)
+
+    def test_forbidden_without_permission_or_unknown_format(self):
+        self.assertEqual(self._get(user=self.viewer, fmt="csv").status_code, 403)
+        self.assertEqual(self._get(fmt="docx").status_code, 403)
+
+
+class ExportJobViewTests(TestCase):
+    """status/download re-validan permiso y organización, no solo que el job sea del usuario."""
+
+    @classmethod
+    def setUpTestData(cls):
+        config = GlobalConfig.load()
+        config.setup_complete = True
+        config.save()
+        cls.user = get_user_model().objects.create_user("exporta")
+        cls.user.user_permissions.add(Permission.objects.get(codename="view_item"))
+        cls.org = Organization.objects.create(name="Org", slug="org")
+        cls.membership = Membership.objects.create(user=cls.user, organization=cls.org)
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        media_override = override_settings(MEDIA_ROOT=media)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        cache.clear()
+
+        self.job = ExportJob.objects.create(
+            user=self.user,
+            organization=self.org,
+            source=CRUD_SLUG_ITEM,
+            format="csv",
+            status=ExportJob.STATUS_DONE,
+        )
+        self.job.file.save("items.csv", ContentFile(b"name\nA\n"))
+        self.client.force_login(self.user)
+        session = self.client.session
+        session[SESSION_KEY] = self.org.pk
+        session.save()
+
+    def _status_codes(self):
+        return (
+            self.client.get(reverse("exports:status", args=[self.job.pk])).status_code,
+            self.client.get(reverse("exports:download", args=[self.job.pk])).status_code,
+        )
+
+    def test_owner_with_permission(self):
+        self.assertEqual(self._status_codes(), (200, 200))
+
+    def test_revoked_permission_blocks_status_and_download(self):
+        self.user.user_permissions.clear()
+        self.assertEqual(self._status_codes(), (403, 403))
+
+    def test_revoked_membership_hides_the_job(self):
+        Membership.objects.filter(pk=self.membership.pk).update(is_active=False)
+        self.assertEqual(self._status_codes(), (404, 404))
+
+    def test_other_users_job_is_not_found(self):
+        other = get_user_model().objects.create_superuser("otro", "otro@example.com", "x")
+        self.client.force_login(other)
+        self.assertEqual(self._status_codes(), (404, 404))
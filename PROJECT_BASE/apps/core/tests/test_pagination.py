@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import base64
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from apps.core.crud.pagination import (
+    _parse_ordering,
+    decode_cursor,
+    encode_cursor,
+    paginate_keyset,
+)
+from apps.crud_example.models import Item
+from apps.orgs.models import Membership
+
+
+def _raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip_keeps_types(self):
+        values = [
+            datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            date(2024, 5, 1),
+            Decimal("10.50"),
+            uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "texto",
+            42,
+            True,
+        ]
+        cursor = encode_cursor(values, direction="p")
+        self.assertEqual(decode_cursor(cursor), ("p", values))
+
+    def test_invalid_cursors_mean_first_page(self):
+        tampered = [
+            "",
+            "no-es-base64!!",
+            base64.urlsafe_b64encode(b"no json").decode(),
+            _raw_cursor([1, 2]),
+            _raw_cursor({"d": "x", "v": [1]}),
+            _raw_cursor({"d": "n", "v": "abc"}),
+            _raw_cursor({"d": "n", "v": []}),
+            _raw_cursor({"d": "n", "v": [None, None]}),
+            _raw_cursor({"d": "n", "v": [[1], 2]}),
+            _raw_cursor({"d": "n", "v": [{"x": 1}, 2]}),
+            _raw_cursor({"d": "n", "v": [{"t": "dec", "v": "abc"}, 2]}),
+            _raw_cursor({"d": "n", "v": [{"t": "dt", "v": 5}, 2]}),
+            _raw_cursor({"d": "n", "v": [{"t": "???", "v": "a"}, 2]}),
+        ]
+        for cursor in tampered:
+            with self.subTest(cursor=cursor):
+                self.assertIsNone(decode_cursor(cursor))
+
+
+class ParseOrderingTests(SimpleTestCase):
+    def test_requires_pk_tie_breaker(self):
+        self.assertIsNone(_parse_ordering(("name",), Item))
+        self.assertEqual(_parse_ordering(("-name", "-pk"), Item), [("name", True), ("pk", True)])
+
+    def test_nullable_and_unknown_fields_fall_back_to_offset(self):
+        User = get_user_model()
+        self.assertIsNone(_parse_ordering(("last_login", "pk"), User))
+        self.assertIsNone(_parse_ordering(("user__last_login", "pk"), Membership))
+        self.assertIsNone(_parse_ordering(("anotacion", "pk"), Item))
+
+    def test_foreign_keys_seek_on_their_column(self):
+        self.assertEqual(
+            _parse_ordering(("organization", "pk"), Membership),
+            [("organization_id", False), ("pk", False)],
+        )
+        self.assertEqual(
+            _parse_ordering(("user__email", "pk"), Membership),
+            [("user__email", False), ("pk", False)],
+        )
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Empates en name: el pk desempata y ninguna fila se repite ni se pierde entre páginas.
+        for name in ["b", "a", "c", "a", "b", "a", "c"]:
+            Item.objects.create(name=name)
+
+    def _walk_forward(self, qs, page_size):
+        pages, cursor = [], ""
+        while True:
+            page = paginate_keyset(qs, cursor=cursor, page_size=page_size)
+            pages.append(page)
+            if not page.has_next():
+                return pages
+            cursor = page.next_cursor
+
+    def test_forward_and_backward_across_ties(self):
+        for ordering in (("name", "pk"), ("-name", "-pk")):
+            with self.subTest(ordering=ordering):
+                qs = Item.objects.order_by(*ordering)
+                expected = list(qs.values_list("pk", flat=True))
+
+                pages = self._walk_forward(qs, 2)
+                self.assertEqual([item.pk for page in pages for item in page], expected)
+                self.assertFalse(pages[0].has_previous())
+                self.assertEqual(len(pages), 4)
+
+                # Volviendo con previous_cursor se obtienen las mismas páginas.
+                page = pages[-1]
+                for previous in reversed(pages[:-1]):
+                    page = paginate_keyset(qs, cursor=page.previous_cursor, page_size=2)
+                    self.assertEqual([i.pk for i in page], [i.pk for i in previous])
+                    self.assertTrue(page.has_next())
+                self.assertFalse(page.has_previous())
+
+    def test_invalid_or_mistyped_cursor_returns_first_page(self):
+        qs = Item.objects.order_by("name", "pk")
+        first = [i.pk for i in paginate_keyset(qs, cursor="", page_size=3)]
+        for cursor in (
+            _raw_cursor({"d": "n", "v": [None, None]}),
+            encode_cursor(["a", "no-es-un-pk"], direction="n"),
+            encode_cursor(["a"], direction="n"),  # cursor de otro orden
+        ):
+            with self.subTest(cursor=cursor):
+                page = paginate_keyset(qs, cursor=cursor, page_size=3)
+                self.assertEqual([i.pk for i in page], first)
+
+    def test_incompatible_ordering_returns_none(self):
+        self.assertIsNone(paginate_keyset(Item.objects.order_by("name"), cursor="", page_size=2))
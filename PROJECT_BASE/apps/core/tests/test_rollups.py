@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.core.dashboard.rollups import (
+    USERS_ACTIVE,
+    USERS_JOINED,
+    USERS_TOTAL,
+    refresh_rollups,
+    rollup_series,
+    rollup_value,
+)
+from apps.core.models import DailyMetricRollup
+
+
+class RollupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_value_without_rollups_is_live_and_read_only(self):
+        User = get_user_model()
+        User.objects.create_user("activo")
+        User.objects.create_user("inactivo", is_active=False)
+        DailyMetricRollup.objects.all().delete()
+
+        self.assertEqual(rollup_value(USERS_TOTAL), 2)
+        self.assertEqual(rollup_value(USERS_ACTIVE), 1)
+        self.assertFalse(DailyMetricRollup.objects.exists())
+
+    def test_refresh_writes_cumulative_and_event_rows(self):
+        get_user_model().objects.create_user("uno")
+        today = timezone.localdate()
+        refresh_rollups(today, today)
+
+        self.assertEqual(rollup_value(USERS_TOTAL), 1)
+        self.assertEqual(rollup_series(USERS_JOINED, start=today, end=today), [1])
+
+    @override_settings(JOBS_BACKEND="rq", RQ_QUEUES={})
+    def test_enqueue_failure_does_not_reach_the_save(self):
+        # Cola no configurada (igual que sin rq o con Redis caído): se loguea y el alta sigue.
+        with self.assertLogs("apps.core.dashboard.rollups", level="ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                user = get_user_model().objects.create_user("sin_worker")
+        self.assertTrue(get_user_model().objects.filter(pk=user.pk).exists())
+
+    @override_settings(JOBS_BACKEND="sync")
+    def test_sync_backend_refreshes_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            get_user_model().objects.create_user("con_sync")
+        today = timezone.localdate()
+        self.assertTrue(DailyMetricRollup.objects.filter(metric=USERS_TOTAL.key, day=today).exists())
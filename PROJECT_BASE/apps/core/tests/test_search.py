@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from apps.core.crud import search
+from apps.core.crud.search import SearchIndex, apply_search, get_search_backend
+from apps.crud_example.models import Item
+
+
+class BackendSelectionTests(TestCase):
+    def test_auto_by_vendor_and_fields(self):
+        self.assertEqual(get_search_backend("auto").name, "fts5")  # tests corren en SQLite
+        self.assertEqual(get_search_backend(None).name, "icontains")
+
+        with mock.patch.object(connection, "vendor", "postgresql"):
+            self.assertEqual(get_search_backend("auto", fields=("name",)).name, "postgres")
+            self.assertEqual(get_search_backend("auto", fields=("user__email",)).name, "trigram")
+
+        with mock.patch.object(connection, "vendor", "mysql"):
+            self.assertEqual(get_search_backend("auto").name, "icontains")
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            get_search_backend("elastic")
+
+
+class SearchFallbackTests(TransactionTestCase):
+    # SQLite no admite CREATE VIRTUAL TABLE dentro de los savepoints de TestCase.
+
+    def setUp(self):
+        for name in ["Juan Pérez", "Juana", "Pedro"]:
+            Item.objects.create(name=name)
+        self.fts = search._BACKENDS["fts5"]
+        self.fts._ready.clear()
+        self.addCleanup(self.fts._ready.clear)
+        self.addCleanup(self._drop_fts_table)
+
+    @staticmethod
+    def _drop_fts_table():
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS crud_example_item_fts")
+
+    def _names(self, term, backend):
+        return sorted(apply_search(Item.objects.all(), ["name"], term, backend=backend).values_list("name", flat=True))
+
+    def test_backends_for_other_vendors_fall_back_to_icontains(self):
+        for backend in ("postgres", "trigram"):
+            with self.subTest(backend=backend):
+                self.assertEqual(self._names("uan", backend), ["Juan Pérez", "Juana"])
+
+    def test_fts5_without_table_falls_back_to_icontains(self):
+        self.assertEqual(self._names("uan", "fts5"), ["Juan Pérez", "Juana"])
+
+    def test_fts5_matches_word_prefixes_once_built(self):
+        self.fts.rebuild(SearchIndex(Item, ("name",), "fts5"), using="default")
+        self.assertEqual(self._names("jua", "fts5"), ["Juan Pérez", "Juana"])
+        self.assertEqual(self._names("pér", "fts5"), ["Juan Pérez"])
+        self.assertEqual(self._names("uan", "fts5"), [])  # prefijo de palabra, no subcadena
+
+    def test_fts5_with_stale_columns_falls_back_to_icontains(self):
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE VIRTUAL TABLE crud_example_item_fts USING fts5(otro_campo)")
+        self.assertFalse(self.fts.is_ready(Item.objects.all(), ("name",)))
+        self.assertEqual(self._names("uan", "fts5"), ["Juan Pérez", "Juana"])
+
+    def test_trigram_is_not_ready_without_pg_trgm(self):
+        trigram = search._BACKENDS["trigram"]
+        trigram._ready.clear()
+        self.addCleanup(trigram._ready.clear)
+        cursor = mock.MagicMock()
+        cursor.__enter__.return_value.fetchone.return_value = None
+        with mock.patch.object(connection, "cursor", return_value=cursor):
+            self.assertFalse(trigram.is_ready(Item.objects.all(), ("name",)))
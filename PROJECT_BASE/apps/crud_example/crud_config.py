@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from django.db.models import QuerySet
 from django.http import HttpRequest
-from django.urls import reverse
 
 from apps.core.crud import ColumnDef, CrudConfig, FilterDef, register_crud
 
@@ -37,7 +36,7 @@ class ItemCrudConfig(CrudConfig):
             sortable=True,
             nowrap=True,
             order_by=("name",),
-            value=lambda o: o.name,
+            attr="name",
         ),
         ColumnDef(
             key="status",
@@ -50,7 +49,7 @@ class ItemCrudConfig(CrudConfig):
             sortable=True,
             nowrap=True,
             order_by=("status",),
-            value=lambda o: o.status,
+            attr="status",
         ),
         ColumnDef(
             key="created_at",
@@ -59,7 +58,7 @@ class ItemCrudConfig(CrudConfig):
             sortable=True,
             nowrap=True,
             order_by=("created_at",),
-            value=lambda o: o.created_at,
+            attr="created_at",
         ),
     ]
 
@@ -71,6 +70,9 @@ class ItemCrudConfig(CrudConfig):
 
     status_options = [("all", "Todos"), ("active", "Activo"), ("inactive", "Inactivo")]
 
+    # La tabla solo lee name/status/created_at (+ pk para row_urls).
+    list_projection = "only"
+
     # Step 8 (MVP): forms + modal metadata (sin auto-generación)
     create_form_class = ItemForm
     edit_form_class = ItemForm
@@ -99,14 +101,18 @@ class ItemCrudConfig(CrudConfig):
         "status": "Estado",
         "created_at": "Creado",
     }
-    export_formats = {"csv", "xlsx", "pdf"}
-
-    def row_urls(self, obj: Item, request: HttpRequest, params) -> dict:
-        return {
-            "detail": None,
-            "edit": reverse("crud_example:edit", kwargs={"id": obj.pk}),
-            "delete": reverse("crud_example:delete", kwargs={"id": obj.pk}),
-        }
+    export_formats = {"csv", "xlsx", "pdf", "ndjson", "parquet"}
+    # NDJSON/Parquet (analytics): solo como export en segundo plano en esta UI.
+    export_async_formats = ("xlsx", "pdf", "ndjson", "parquet")
+    export_filename_base = "crud_example_items"
+    export_title = "CRUD Example · Items"
+
+    # Acciones por fila: se resuelven una vez por render (ver apps.core.crud.routing).
+    row_url_routes = {
+        "detail": None,
+        "edit": "crud_example:edit",
+        "delete": "crud_example:delete",
+    }
 
 
 def register() -> None:
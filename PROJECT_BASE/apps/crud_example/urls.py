@@ -1,16 +1,22 @@
 from django.urls import path
 
+from apps.core.crud.exports import crud_export_view
+
 from . import views
+from .crud_config import CRUD_SLUG_ITEM
 
 app_name = "crud_example"
 
+export_view = crud_export_view(CRUD_SLUG_ITEM)
+
 urlpatterns = [
     path("", views.list_view, name="list"),
     path("table/", views.table_view, name="table"),
     path("create/", views.create_view, name="create"),
     path("<int:id>/edit/", views.edit_view, name="edit"),
     path("<int:id>/delete/", views.delete_view, name="delete"),
-    path("export/csv/", views.export_csv_view, name="export_csv"),
-    path("export/xlsx/", views.export_xlsx_view, name="export_xlsx"),
-    path("export/pdf/", views.export_pdf_view, name="export_pdf"),
+    path("export/", export_view, name="export"),
+    path("export/csv/", export_view, {"fmt": "csv"}, name="export_csv"),
+    path("export/xlsx/", export_view, {"fmt": "xlsx"}, name="export_xlsx"),
+    path("export/pdf/", export_view, {"fmt": "pdf"}, name="export_pdf"),
 ]
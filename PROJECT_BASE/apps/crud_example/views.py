@@ -17,10 +17,10 @@ from .models import Item
 
 from apps.core.crud.engine import build_list_context
 from apps.core.crud.registry import get_crud
+from apps.core.crud.routing import UrlTemplate
+from apps.core.queries import query_budget
 from .crud_config import CRUD_SLUG_ITEM
 
-from apps.core.services.exporting import build_pdf_table, build_xlsx, stream_csv
-
 
 @dataclass(frozen=True)
 class _Col:
@@ -124,18 +124,16 @@ def _columns() -> list[dict]:
 def _items(page_obj, *, params: dict[str, str]) -> list[dict]:
     rows = []
     qs_with_page = urlencode({k: v for k, v in params.items() if v not in {"", "all"}})
+    # Un reverse() por acción para toda la página (no por fila).
+    edit_url = UrlTemplate.compile("crud_example:edit", query=qs_with_page)
+    delete_url = UrlTemplate.compile("crud_example:delete", query=qs_with_page)
     for obj in page_obj.object_list:
-        edit_url = reverse("crud_example:edit", kwargs={"id": obj.pk})
-        delete_url = reverse("crud_example:delete", kwargs={"id": obj.pk})
-        if qs_with_page:
-            edit_url = f"{edit_url}?{qs_with_page}"
-            delete_url = f"{delete_url}?{qs_with_page}"
         rows.append(
             {
                 "id": obj.pk,
                 "cells": [obj.name, obj.get_status_display(), obj.created_at.strftime("%Y-%m-%d")],
                 # No implementamos modales en Step 2: dejamos placeholders.
-                "urls": {"detail": None, "edit": edit_url, "delete": delete_url},
+                "urls": {"detail": None, "edit": edit_url.format(obj.pk), "delete": delete_url.format(obj.pk)},
             }
         )
     return rows
@@ -169,7 +167,7 @@ def _context(request: HttpRequest) -> dict:
         "columns": _columns(),
         "items": _items(page_obj, params=params),
         "page_obj": page_obj,
-        "total_count": qs.count(),
+        "total_count": paginator.count,
         "qs": _build_qs_without_page(params),
     }
 
@@ -207,11 +205,12 @@ def _context_for_refresh(request: HttpRequest) -> dict:
         "columns": _columns(),
         "items": _items(page_obj, params=params),
         "page_obj": page_obj,
-        "total_count": qs.count(),
+        "total_count": paginator.count,
         "qs": _build_qs_without_page(params),
     }
 
 
+@query_budget(10)
 def list_view(request: HttpRequest) -> HttpResponse:
     config = get_crud(CRUD_SLUG_ITEM)
     if not config.can_list(request):
@@ -230,6 +229,7 @@ def list_view(request: HttpRequest) -> HttpResponse:
     return render(request, "crud/list.html", ctx)
 
 
+@query_budget(10)
 def table_view(request: HttpRequest) -> HttpResponse:
     # Endpoint HTMX: solo el partial de tabla
     config = get_crud(CRUD_SLUG_ITEM)
@@ -248,79 +248,6 @@ def table_view(request: HttpRequest) -> HttpResponse:
     return render(request, "crud/_table.html", ctx)
 
 
-def _export_queryset(request: HttpRequest):
-    params = _get_params(request)
-    return _queryset(params)
-
-
-def export_csv_view(request: HttpRequest) -> HttpResponseBase:
-    config = get_crud(CRUD_SLUG_ITEM)
-    if not config.can_export(request):
-        return HttpResponseForbidden("Forbidden")
-    if not config.is_export_enabled():
-        return HttpResponseForbidden("Export disabled")
-    if not config.allows_format("csv"):
-        return HttpResponseForbidden("Format not allowed")
-
-    params = config.parse_params(request)
-    qs = config.queryset_for_list(request=request, params=params)
-
-    fields = config.get_export_fields() or ["name", "status", "created_at"]
-    headers = config.get_export_headers() or ["Nombre", "Estado", "Creado"]
-    return stream_csv(
-        queryset=qs,
-        fields=fields,
-        headers=headers,
-        filename_base="crud_example_items",
-    )
-
-
-def export_xlsx_view(request: HttpRequest) -> HttpResponseBase:
-    config = get_crud(CRUD_SLUG_ITEM)
-    if not config.can_export(request):
-        return HttpResponseForbidden("Forbidden")
-    if not config.is_export_enabled():
-        return HttpResponseForbidden("Export disabled")
-    if not config.allows_format("xlsx"):
-        return HttpResponseForbidden("Format not allowed")
-
-    params = config.parse_params(request)
-    qs = config.queryset_for_list(request=request, params=params)
-
-    fields = config.get_export_fields() or ["name", "status", "created_at"]
-    headers = config.get_export_headers() or ["Nombre", "Estado", "Creado"]
-    return build_xlsx(
-        queryset=qs,
-        fields=fields,
-        headers=headers,
-        filename_base="crud_example_items",
-        sheet_name="Items",
-    )
-
-
-def export_pdf_view(request: HttpRequest) -> HttpResponseBase:
-    config = get_crud(CRUD_SLUG_ITEM)
-    if not config.can_export(request):
-        return HttpResponseForbidden("Forbidden")
-    if not config.is_export_enabled():
-        return HttpResponseForbidden("Export disabled")
-    if not config.allows_format("pdf"):
-        return HttpResponseForbidden("Format not allowed")
-
-    params = config.parse_params(request)
-    qs = config.queryset_for_list(request=request, params=params)
-
-    fields = config.get_export_fields() or ["name", "status", "created_at"]
-    headers = config.get_export_headers() or ["Nombre", "Estado", "Creado"]
-    return build_pdf_table(
-        queryset=qs,
-        fields=fields,
-        headers=headers,
-        title="CRUD Example · Items",
-        filename_base="crud_example_items",
-    )
-
-
 def _hx_modal_success_refresh(request: HttpRequest) -> HttpResponse:
     """Respuesta estándar de éxito para modales:
 
@@ -14,19 +14,24 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import random
-from datetime import timedelta
-from django.utils import timezone
 
-from django.contrib import messages
-from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render, redirect
 
-from apps.core.dashboard.defs import KpiDef, ChartDef, ChartDataset
+from apps.core.dashboard.defs import KpiDef
+from apps.core.dashboard.metrics import DailySeries, cached_metric, daily_chart, parse_window
+from apps.core.queries import query_budget
+from apps.core.dashboard.rollups import (
+    MEMBERS_JOINED,
+    USERS_ACTIVE,
+    USERS_JOINED,
+    USERS_TOTAL,
+    rollup_series,
+    rollup_value,
+)
 from apps.orgs.decorators import organization_required
-from apps.orgs.utils import SESSION_KEY
 from .forms import DemoQuickActionForm, DemoTableFilterForm
 
 
@@ -41,33 +46,32 @@ def dashboard(request: HttpRequest) -> HttpResponse:
     if not request.user.is_staff and not request.user.groups.exists():
         return redirect("accounts:verification_pending")
 
-    org = getattr(request, "organization", None)
-    if org and not getattr(org, "is_active", False):
-        request.session.pop(SESSION_KEY, None)
-        messages.error(request, "Selecciona una organización válida para continuar.")
-        return redirect("orgs:select")
-
-    return render(request, "pages/dashboard.html", {"organization": org})
+    # organization_required ya validó org + membresía activas (una sola query).
+    return render(request, "pages/dashboard.html", {"organization": request.organization})
 
 
 @login_required
+@query_budget(10)
 def kpis(request: HttpRequest) -> HttpResponse:
-    User = get_user_model()
-    user_count = User.objects.count()
-    active_users = User.objects.filter(is_active=True).count()
-    
+    # Usuarios: métrica de plataforma (User no pertenece a una org) -> scope global.
+    # Se leen de los rollups diarios (sin escanear auth_user), cacheados con TTL corto.
+    users = cached_metric(
+        "users_totals",
+        lambda: {"total": rollup_value(USERS_TOTAL), "active": rollup_value(USERS_ACTIVE)},
+    )
+
     # Simulación de datos reales
     kpi_list = [
         KpiDef(
             label="Usuarios Totales",
-            value=str(user_count),
+            value=str(users["total"]),
             sub_label="Registrados",
             badge_text="Total",
             badge_color="primary"
         ),
         KpiDef(
             label="Usuarios Activos",
-            value=str(active_users),
+            value=str(users["active"]),
             sub_label="En plataforma",
             badge_text="Activos",
             badge_color="success"
@@ -91,32 +95,34 @@ def kpis(request: HttpRequest) -> HttpResponse:
 
 
 @login_required
+@query_budget(10)
 def charts(request: HttpRequest) -> HttpResponse:
-    # Gráfico real: Usuarios registrados últimos 7 días
-    User = get_user_model()
-    today = timezone.now().date()
-    labels = []
-    data_users = []
-    
-    for i in range(6, -1, -1):
-        day = today - timedelta(days=i)
-        count = User.objects.filter(date_joined__date=day).count()
-        labels.append(day.strftime("%a"))
-        data_users.append(count)
-    
-    chart_main = ChartDef(
+    # Gráfico real: altas por día (?days=7|30|90) leídas de los rollups diarios.
+    # Registros de la plataforma (global) + altas en la org activa, si hay una.
+    org = getattr(request, "organization", None) or None  # SimpleLazyObject -> org | None
+    days = parse_window(request.GET.get("days"))
+    series = [
+        DailySeries(
+            label="Registros",
+            counts=lambda start, end: rollup_series(USERS_JOINED, start=start, end=end),
+            fill=True,
+        ),
+    ]
+    if org:
+        series.append(
+            DailySeries(
+                label="Altas en la organización",
+                counts=lambda start, end: rollup_series(MEMBERS_JOINED, start=start, end=end, organization=org),
+                color="success",
+            )
+        )
+    chart_main = daily_chart(
+        name="signups",
+        days=days,
         id="mainChart",
-        title="Nuevos Usuarios (7 días)",
-        type="line",
-        labels=labels,
-        datasets=[
-            ChartDataset(
-                label="Registros",
-                data=data_users,
-                color="primary",
-                fill=True
-            ),
-        ]
+        title=f"Nuevos Usuarios ({days} días)",
+        series=series,
+        organization=org,
     )
 
     return render(request, "dashboard/_charts.html", {"charts": [chart_main]})
@@ -12,6 +12,7 @@ class OrgsConfig(AppConfig):
         # Additive, tenant-ready: expose user.current_org without custom User model.
         from django.contrib.auth import get_user_model
 
+        from . import signals  # noqa: F401  (invalidación del cache de membresías)
         from .services import get_current_organization
 
         User = get_user_model()
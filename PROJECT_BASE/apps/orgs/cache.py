@@ -0,0 +1,183 @@
+"""Cache de membresías (user, org) para checks de acceso/rol.
+
+Dos niveles:
+- memo en el objeto User (vive lo que vive el request; mismo patrón que _current_org_cache)
+- cache compartido de Django con claves versionadas por organización:
+    orgs:membership:v:<org_id>                -> versión (int)
+    orgs:membership:<org_id>:<versión>:<user> -> (id, role, is_active, org_is_active) | ()
+
+Invalidación (apps/orgs/signals.py): post_save/post_delete de Membership u Organization
+suben la versión de la org, así que todas sus entradas quedan huérfanas (expiran por TTL).
+El memo local además se descarta en el mismo proceso vía un contador de generación.
+
+La versión tiene que vivir en un cache compartido (DJANGO_CACHE_URL). Con LocMem (por proceso)
+otros workers no ven la invalidación: el TTL baja a ORGS_MEMBERSHIP_LOCAL_CACHE_TTL.
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+
+from .models import Membership
+
+
+_MEMO_ATTR = "_org_membership_memo"
+_VERSION_KEY = "orgs:membership:v:{org_id}"
+_ENTRY_KEY = "orgs:membership:{org_id}:{version}:{user_id}"
+_MISS = object()
+
+# Generación local: cualquier invalidación en este proceso descarta memos ya creados.
+_generation = itertools.count(1)
+_current_generation = next(_generation)
+
+
+@dataclass(frozen=True)
+class CachedMembership:
+    id: int
+    organization_id: int
+    role: str
+    is_active: bool
+    organization_is_active: bool
+
+    @property
+    def is_usable(self) -> bool:
+        """Membresía activa en una org activa (lo que exige organization_required)."""
+        return self.is_active and self.organization_is_active
+
+    def has_role(self, roles: Iterable[str]) -> bool:
+        return self.is_active and self.role in set(roles)
+
+
+def _ttl() -> int:
+    ttl = int(getattr(settings, "ORGS_MEMBERSHIP_CACHE_TTL", 300))
+    if isinstance(caches["default"], LocMemCache):
+        return min(ttl, int(getattr(settings, "ORGS_MEMBERSHIP_LOCAL_CACHE_TTL", 5)))
+    return ttl
+
+
+def _org_id(organization: Any) -> Optional[int]:
+    if organization is None:
+        return None
+    return getattr(organization, "pk", organization)
+
+
+def _version(org_id: int) -> int:
+    key = _VERSION_KEY.format(org_id=org_id)
+    version = cache.get(key)
+    if version is None:
+        # Versión inicial basada en tiempo: si la clave fue desalojada, nunca reaparece
+        # una versión vieja con entradas obsoletas. add() no pisa a otro proceso.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key) or 0
+    return int(version)
+
+
+def _load(user_id: int, org_id: int) -> Optional[CachedMembership]:
+    row = (
+        Membership.objects.filter(user_id=user_id, organization_id=org_id)
+        .values_list("id", "role", "is_active", "organization__is_active")
+        .first()
+    )
+    if not row:
+        return None
+    return CachedMembership(
+        id=row[0],
+        organization_id=org_id,
+        role=row[1],
+        is_active=row[2],
+        organization_is_active=row[3],
+    )
+
+
+def _memo(user: Any) -> dict:
+    memo = getattr(user, _MEMO_ATTR, None)
+    if memo is None or memo.get("_gen") != _current_generation:
+        memo = {"_gen": _current_generation}
+        setattr(user, _MEMO_ATTR, memo)
+    return memo
+
+
+def get_membership(user: Any, organization: Any) -> Optional[CachedMembership]:
+    """Membresía (activa o no) de `user` en `organization` (instancia o id). None si no existe."""
+
+    org_id = _org_id(organization)
+    if org_id is None or not user or not getattr(user, "is_authenticated", False):
+        return None
+
+    memo = _memo(user)
+    if org_id in memo:
+        return memo[org_id]
+
+    key = _ENTRY_KEY.format(org_id=org_id, version=_version(org_id), user_id=user.pk)
+    cached = cache.get(key, _MISS)
+    if cached is _MISS:
+        membership = _load(user.pk, org_id)
+        # Se cachean también los negativos (tupla vacía) para no repetir el lookup.
+        cache.set(
+            key,
+            (
+                membership.id,
+                membership.role,
+                membership.is_active,
+                membership.organization_is_active,
+            )
+            if membership
+            else (),
+            timeout=_ttl(),
+        )
+    elif cached:
+        membership = CachedMembership(
+            id=cached[0],
+            organization_id=org_id,
+            role=cached[1],
+            is_active=cached[2],
+            organization_is_active=cached[3],
+        )
+    else:
+        membership = None
+
+    memo[org_id] = membership
+    return membership
+
+
+def remember_membership(user: Any, membership: Membership) -> None:
+    """Siembra el memo del request con una membresía ya cargada (p.ej. por el middleware)."""
+
+    _memo(user)[membership.organization_id] = CachedMembership(
+        id=membership.pk,
+        organization_id=membership.organization_id,
+        role=membership.role,
+        is_active=membership.is_active,
+        organization_is_active=membership.organization.is_active,
+    )
+
+
+def get_active_membership(user: Any, organization: Any) -> Optional[CachedMembership]:
+    """Como get_membership, pero solo si la membresía está activa."""
+
+    membership = get_membership(user, organization)
+    return membership if membership and membership.is_active else None
+
+
+def invalidate_organization(organization: Any) -> None:
+    """Invalida todas las membresías cacheadas de una org (cache compartido + memos locales)."""
+
+    global _current_generation
+
+    org_id = _org_id(organization)
+    if org_id is None:
+        return
+    key = _VERSION_KEY.format(org_id=org_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Sin versión previa (o desalojada): arrancar una nueva.
+        cache.set(key, time.time_ns(), timeout=None)
+    _current_generation = next(_generation)
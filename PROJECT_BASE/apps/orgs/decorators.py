@@ -9,8 +9,7 @@ from django.shortcuts import redirect
 from django.urls import reverse
 from django.conf import settings
 
-from .models import Membership, Organization
-from .utils import SESSION_KEY, get_active_organization
+from .utils import SESSION_KEY, get_active_membership
 
 
 def _clear_active_org(request: HttpRequest) -> None:
@@ -33,30 +32,23 @@ def organization_required(view_func: Callable) -> Callable:
                 login_url = login_url or "/accounts/login/"
             return redirect(login_url)
 
+        had_active_org = bool(request.session.get(SESSION_KEY))
         try:
-            org = get_active_organization(request)
+            # Una query: org + membresía (ambas activas). Memo por request.
+            membership = get_active_membership(request)
         except Exception:
             _clear_active_org(request)
             messages.error(request, "Selecciona una organización válida para continuar.")
             return redirect("orgs:select")
 
-        if not org or not getattr(org, "is_active", False):
+        if not membership:
             _clear_active_org(request)
+            if had_active_org:
+                messages.error(request, "Selecciona una organización válida para continuar.")
             return redirect("orgs:select")
 
-        membership_exists = Membership.objects.filter(
-            user=user,
-            organization=org,
-            is_active=True,
-            organization__is_active=True,
-        ).exists()
-
-        if not membership_exists:
-            _clear_active_org(request)
-            messages.error(request, "Selecciona una organización válida para continuar.")
-            return redirect("orgs:select")
-
-        request.organization = org
+        request.membership = membership
+        request.organization = membership.organization
         return view_func(request, *args, **kwargs)
 
     return _wrapped
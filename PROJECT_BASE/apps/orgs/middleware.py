@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from django.utils.functional import SimpleLazyObject
+
+from .utils import get_active_membership
+
+
+class ActiveOrganizationMiddleware:
+    """Expone request.membership y request.organization de forma lazy.
+
+    Igual que request.user: no hay query hasta que algo los lee, y entonces una sola
+    (membresía + org vía JOIN, ver get_active_membership). Sin org activa válida ambos
+    evalúan a None (falsy).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.membership = SimpleLazyObject(lambda: get_active_membership(request))
+        request.organization = SimpleLazyObject(lambda: _organization(request))
+        return self.get_response(request)
+
+
+def _organization(request):
+    membership = get_active_membership(request)
+    return membership.organization if membership else None
@@ -4,6 +4,7 @@ from typing import Optional
 
 from django.contrib.auth.models import AnonymousUser
 
+from .cache import get_membership
 from .models import Membership, Organization
 
 
@@ -39,14 +40,12 @@ def get_current_organization(user) -> Optional[Organization]:
     return org
 
 
-def user_has_org_role(user, *, roles: set[str]) -> bool:
-    org = getattr(user, "current_org", None)
+def user_has_org_role(user, *, roles: set[str], organization: Optional[Organization] = None) -> bool:
+    """True si el usuario tiene alguno de `roles` en `organization` (default: user.current_org)."""
+
+    org = organization if organization is not None else getattr(user, "current_org", None)
     if not org:
         return False
 
-    return Membership.objects.filter(
-        user=user,
-        organization=org,
-        is_active=True,
-        role__in=list(roles),
-    ).exists()
+    membership = get_membership(user, org)
+    return bool(membership and membership.has_role(roles))
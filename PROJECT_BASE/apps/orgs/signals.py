@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_organization
+from .models import Membership, Organization
+
+
+def _invalidate(org_id: int) -> None:
+    invalidate_organization(org_id)
+    # Dentro de una transacción, otro request podría cachear el valor previo antes del commit.
+    transaction.on_commit(lambda: invalidate_organization(org_id))
+
+
+@receiver(post_save, sender=Membership, dispatch_uid="orgs_membership_saved")
+@receiver(post_delete, sender=Membership, dispatch_uid="orgs_membership_deleted")
+def _membership_changed(sender, instance: Membership, **kwargs) -> None:
+    _invalidate(instance.organization_id)
+
+
+@receiver(post_save, sender=Organization, dispatch_uid="orgs_organization_saved")
+@receiver(post_delete, sender=Organization, dispatch_uid="orgs_organization_deleted")
+def _organization_changed(sender, instance: Organization, **kwargs) -> None:
+    _invalidate(instance.pk)
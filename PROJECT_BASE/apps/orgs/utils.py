@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+from .cache import remember_membership
 from .models import Membership, Organization
 
 SESSION_KEY = "active_org_id"
@@ -29,15 +30,48 @@ def set_active_organization(request, org_id: int) -> bool:
     return True
 
 
-def get_active_organization(request) -> Optional[Organization]:
+# Memo por request: evita repetir el lookup entre middleware, decorator y vistas.
+_REQUEST_MEMBERSHIP_ATTR = "_active_membership_cache"
+_UNRESOLVED = object()
+
+
+def get_active_membership(request) -> Optional[Membership]:
+    """Membresía activa del usuario en la org de sesión (con la org cargada vía JOIN).
+
+    Una sola query resuelve org + membresía y valida ambos is_active.
+    Si la org de sesión ya no es válida, limpia la sesión y retorna None.
+    """
+
+    cached = getattr(request, _REQUEST_MEMBERSHIP_ATTR, _UNRESOLVED)
+    if cached is not _UNRESOLVED:
+        return cached
+
+    membership = None
+    user = getattr(request, "user", None)
     org_id = request.session.get(SESSION_KEY)
     if not org_id:
         request.session.pop(SESSION_KEY, None)
-        return None
+    elif user and getattr(user, "is_authenticated", False):
+        membership = (
+            Membership.objects.select_related("organization")
+            .filter(
+                user=user,
+                organization_id=org_id,
+                is_active=True,
+                organization__is_active=True,
+            )
+            .first()
+        )
+        if membership:
+            # Los checks de rol del mismo request (cache de membresías) no vuelven a la DB.
+            remember_membership(user, membership)
+        else:
+            request.session.pop(SESSION_KEY, None)
 
-    organization = Organization.objects.filter(pk=org_id, is_active=True).first()
-    if not organization:
-        request.session.pop(SESSION_KEY, None)
-        return None
+    setattr(request, _REQUEST_MEMBERSHIP_ATTR, membership)
+    return membership
 
-    return organization
+
+def get_active_organization(request) -> Optional[Organization]:
+    membership = get_active_membership(request)
+    return membership.organization if membership else None
@@ -7,3 +7,10 @@ class UsuariosConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.usuarios"
     verbose_name = "Usuarios (Business)"
+
+    def ready(self) -> None:
+        # Registro explícito del listado de miembros; register_crud también declara
+        # el índice de búsqueda (sync por signals + rebuild_search_indexes).
+        from . import crud_config
+
+        crud_config.register()
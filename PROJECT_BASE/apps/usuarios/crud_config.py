@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils.text import slugify
+
+from apps.core.crud import ColumnDef, CrudConfig, FilterDef, register_crud
+from apps.core.crud.permissions import has_permission
+from apps.orgs.models import Membership
+
+from .domain.permissions import PERMISSION_MANAGE_MEMBERS
+from .domain.search import MEMBER_SEARCH_BACKEND, MEMBER_SEARCH_FIELDS
+
+
+CRUD_SLUG_MEMBERS = "usuarios.members"
+
+
+def _filter_status(qs: QuerySet, value: str, request: HttpRequest | None) -> QuerySet:
+    if value == "active":
+        return qs.filter(is_active=True)
+    if value == "inactive":
+        return qs.filter(is_active=False)
+    return qs
+
+
+def _filter_role(qs: QuerySet, value: str, request: HttpRequest | None) -> QuerySet:
+    if value not in {Membership.ROLE_ADMIN, Membership.ROLE_MEMBER}:
+        return qs
+    return qs.filter(role=value)
+
+
+class MembersCrudConfig(CrudConfig):
+    """Listado de miembros de la org activa.
+
+    La UI sigue siendo usuarios/_table.html (modales + toggle propios); el engine aporta
+    búsqueda, filtros, orden y paginación. ListMembersService lo usa sin request.
+    """
+
+    crud_slug = CRUD_SLUG_MEMBERS
+    model = Membership
+
+    page_title = "Miembros"
+    entity_label = "Miembro"
+    entity_label_plural = "Miembros"
+
+    page_size = 25
+    # Keyset (?cursor=): apply_ordering cierra con pk y las columnas de orden son NOT NULL.
+    # El badge de total usa un COUNT cacheado por filtro (invalidado al guardar/borrar Membership)
+    # en vez de un COUNT exacto por página.
+    pagination_mode = "keyset"
+    count_strategy = "cached"
+
+    search_fields = list(MEMBER_SEARCH_FIELDS)
+    search_backend = MEMBER_SEARCH_BACKEND
+
+    list_columns = [
+        ColumnDef(
+            key="email",
+            label="Email",
+            sortable=True,
+            order_by=("user__email", "user__username"),
+            attr="user.email",
+        ),
+        ColumnDef(
+            key="name",
+            label="Nombre",
+            sortable=True,
+            order_by=("user__first_name", "user__last_name"),
+            value=lambda m: m.user.get_full_name() or m.user.username,
+            fields=("user__first_name", "user__last_name", "user__username"),
+        ),
+        ColumnDef(key="role", label="Rol", sortable=True, order_by=("role",), attr="role"),
+        ColumnDef(key="status", label="Estado", sortable=True, order_by=("is_active",), attr="is_active"),
+    ]
+
+    filters = [
+        FilterDef(name="status", apply=_filter_status),
+        FilterDef(name="role", apply=_filter_role),
+    ]
+
+    default_sort_key = "email"
+    default_dir = "asc"
+
+    status_options = [("all", "Todos"), ("active", "Activo"), ("inactive", "Inactivo")]
+
+    # Columnas del export (síncrono vía crud_export_view y en segundo plano).
+    export_fields = [
+        "user__email",
+        "user__first_name",
+        "user__last_name",
+        "role",
+        "is_active",
+        "created_at",
+    ]
+    export_headers = {
+        "user__email": "Email",
+        "user__first_name": "Nombre",
+        "user__last_name": "Apellido",
+        "role": "Rol",
+        "is_active": "Activo",
+        "created_at": "Fecha Alta",
+    }
+    export_formats = ("csv", "xlsx", "pdf", "ndjson", "parquet")
+    export_filename_base = "miembros"
+    export_title = "Miembros"
+
+    def can_export(self, request: HttpRequest) -> bool:
+        # Solo admins de la org activa.
+        return has_permission(request, PERMISSION_MANAGE_MEMBERS)
+
+    def get_export_filename_base(self, request: HttpRequest | None = None) -> str:
+        # miembros_<org>: el mismo nombre de archivo en el export directo y en el job.
+        org = getattr(request, "organization", None) if request is not None else None
+        org_slug = (getattr(org, "slug", None) or getattr(org, "name", None)) if org else None
+        return f"{self.export_filename_base}_{slugify(org_slug or 'org')}"
+
+    def queryset_for_organization(self, organization_id: int) -> QuerySet:
+        return Membership.objects.select_related("user", "organization").filter(
+            organization_id=organization_id
+        )
+
+    def get_base_queryset(self, request: HttpRequest) -> QuerySet:
+        org = getattr(request, "organization", None)
+        if not org:
+            return self.model.objects.none()
+        return self.queryset_for_organization(org.pk)
+
+
+def register() -> None:
+    register_crud(MembersCrudConfig())
@@ -10,6 +10,17 @@ class ListMembersInput:
     search: str | None = None
     role: str | None = None
     is_active: bool | None = None
+    # Paginación/orden (ver MembersCrudConfig): sort es la key de columna ("email", "name", ...).
+    page: int = 1
+    page_size: int | None = None
+    sort: str = ""
+    dir: str = ""
+    # Cursor keyset opaco (solo si MembersCrudConfig.pagination_mode = "keyset").
+    cursor: str = ""
+    # Solo el total filtrado (sin cargar la página): badges tras mutaciones.
+    count_only: bool = False
+    # Solo esta membresía, si cumple búsqueda/filtros (parche de fila tras mutaciones).
+    member_id: int | None = None
 
 
 @dataclass
@@ -36,13 +47,3 @@ class ToggleMemberActiveInput:
     organization_id: int
     member_id: int
     active: bool
-
-
-@dataclass
-class ExportMembersInput:
-    organization_id: int
-    include_inactive: bool = False
-    search: str | None = None
-    role: str | None = None
-    is_active: bool | None = None
-    format: str = "csv"
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+
+# Gestionar miembros (crear/editar/activar): solo admins de la org activa.
+# Spec compatible con CrudPermissionSpec; se resuelve con memo por request.
+PERMISSION_MANAGE_MEMBERS = "role:admin"
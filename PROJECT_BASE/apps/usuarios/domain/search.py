@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+
+# Búsqueda de miembros: columnas del usuario (join). "auto" usa FTS5 (SQLite) o trigram
+# (PostgreSQL: con joins no hay GIN de full-text posible) cuando el índice / pg_trgm existe
+# (ver rebuild_search_indexes) y icontains si no. Con FTS5 la búsqueda es por prefijo de
+# palabra ("jua" encuentra "Juan", "uan" no).
+MEMBER_SEARCH_FIELDS = ("user__first_name", "user__last_name", "user__email")
+MEMBER_SEARCH_BACKEND = "auto"
@@ -5,6 +5,7 @@ from typing import Any
 from django.contrib.auth import get_user_model
 from django.db import transaction
 
+from apps.orgs.cache import get_active_membership
 from apps.orgs.models import Membership
 from apps.core.exceptions import ServiceValidationException
 from apps.core.services import BaseService, ServiceError, ServiceResult
@@ -20,11 +21,7 @@ class CreateMemberService(BaseService):
         if not actor or not actor.is_authenticated:
             return ServiceResult.failure([ServiceError(code="unauthorized", message="Usuario no autenticado.")])
 
-        actor_membership = Membership.objects.filter(
-            user=actor,
-            organization_id=input_data.organization_id,
-            is_active=True
-        ).first()
+        actor_membership = get_active_membership(actor, input_data.organization_id)
 
         if not actor_membership or actor_membership.role != "admin":
             return ServiceResult.failure([ServiceError(code="forbidden", message="No tienes permisos para agregar miembros.")])
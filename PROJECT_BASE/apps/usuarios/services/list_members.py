@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 
+from apps.orgs.cache import get_membership
 from apps.orgs.models import Membership
+from apps.core.crud import CrudParams, get_crud
 from apps.core.services import BaseService, ServiceResult
+from apps.usuarios.crud_config import CRUD_SLUG_MEMBERS
 from apps.usuarios.domain.inputs import ListMembersInput
 
 
@@ -17,11 +20,7 @@ class ListMembersService(BaseService):
         # 2. Defensive Membership bootstrap
         # Si el actor no tiene membresía en la org activa, crearla como admin para evitar bloqueos.
         if actor and actor.is_authenticated:
-            exists = Membership.objects.filter(
-                user=actor,
-                organization_id=input_data.organization_id
-            ).exists()
-            if not exists:
+            if get_membership(actor, input_data.organization_id) is None:
                 Membership.objects.create(
                     user=actor,
                     organization_id=input_data.organization_id,
@@ -29,27 +28,55 @@ class ListMembersService(BaseService):
                     is_active=True
                 )
 
-        qs: QuerySet = (
-            Membership.objects.select_related("user", "organization")
-            .filter(organization_id=input_data.organization_id)
-        )
+        config = get_crud(CRUD_SLUG_MEMBERS)
+        params = self._params(input_data)
 
-        if input_data.search:
-            term = input_data.search.strip()
-            if term:
-                qs = qs.filter(
-                    Q(user__first_name__icontains=term)
-                    | Q(user__last_name__icontains=term)
-                    | Q(user__email__icontains=term)
-                )
+        qs: QuerySet = config.queryset_for_organization(input_data.organization_id)
+        qs = config.apply_search(qs, params)
+        qs = config.apply_filters(qs, params, None)
+        if input_data.is_active is None and not input_data.include_inactive:
+            qs = qs.filter(is_active=True)
+        qs = config.apply_ordering(qs, params)
 
-        if input_data.role:
-            qs = qs.filter(role=input_data.role)
+        if input_data.count_only:
+            return ServiceResult.success(data={"total": config.count_queryset(qs), "params": params})
 
-        if input_data.is_active is not None:
-            qs = qs.filter(is_active=input_data.is_active)
-        elif not input_data.include_inactive:
-            qs = qs.filter(is_active=True)
+        if input_data.member_id is not None:
+            # Vacío si la fila ya no está en el listado filtrado (p.ej. desactivada con status=active).
+            memberships = list(qs.filter(pk=input_data.member_id)[:1])
+            return ServiceResult.success(data={"memberships": memberships, "params": params})
+
+        # Solo la página pedida: un COUNT (cacheado/estimado según count_strategy; ninguno en
+        # keyset exacto) + un SELECT con LIMIT.
+        total = config.count_for_list(qs)
 
-        memberships = list(qs.order_by("user__email", "user__username"))
-        return ServiceResult.success(data={"memberships": memberships})
+        page_obj = config.paginate(qs, params, total=total, page_size=input_data.page_size)
+        return ServiceResult.success(
+            data={
+                "memberships": list(page_obj.object_list),
+                "page_obj": page_obj,
+                "total": total,
+                "params": params,
+            }
+        )
+
+    @staticmethod
+    def _params(input_data: ListMembersInput) -> CrudParams:
+        status = ""
+        if input_data.is_active is True:
+            status = "active"
+        elif input_data.is_active is False:
+            status = "inactive"
+
+        direction = (input_data.dir or "").strip().lower()
+        return CrudParams(
+            q=(input_data.search or "").strip(),
+            status=status,
+            sort=(input_data.sort or "").strip(),
+            dir=direction if direction in {"asc", "desc"} else "asc",
+            page=str(input_data.page or 1),
+            date_from="",
+            date_to="",
+            cursor=(input_data.cursor or "").strip(),
+            extra=(("role", input_data.role or ""),),
+        )
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.core.models import GlobalConfig
+from apps.orgs.models import Membership, Organization
+from apps.orgs.utils import SESSION_KEY
+
+
+HTMX = {"HTTP_HX_REQUEST": "true"}
+
+
+class MemberPatchResponseTests(TestCase):
+    """Tras una mutación solo se parchea la fila si sigue en el listado filtrado del cliente."""
+
+    @classmethod
+    def setUpTestData(cls):
+        config = GlobalConfig.load()
+        config.setup_complete = True
+        config.save()
+        User = get_user_model()
+        cls.org = Organization.objects.create(name="Org", slug="org")
+        cls.admin = User.objects.create_user("admin", "admin@example.com")
+        Membership.objects.create(user=cls.admin, organization=cls.org, role="admin")
+        cls.member = Membership.objects.create(
+            user=User.objects.create_user("ana", "ana@example.com"), organization=cls.org
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.admin)
+        session = self.client.session
+        session[SESSION_KEY] = self.org.pk
+        session.save()
+
+    def _toggle(self, active: bool, **state):
+        data = {"active": "true" if active else "false", **{f"list_{k}": v for k, v in state.items()}}
+        return self.client.post(f"/usuarios/{self.member.pk}/toggle/", data, **HTMX).content.decode()
+
+    def test_toggled_row_is_patched_while_it_matches(self):
+        body = self._toggle(False, status="inactive")
+        self.assertIn(f'<tr id="member-row-{self.member.pk}" hx-swap-oob="true">', body)
+
+    def test_toggled_row_is_removed_when_it_leaves_the_filter(self):
+        body = self._toggle(False, status="active")
+        self.assertIn(f'<tr id="member-row-{self.member.pk}" hx-swap-oob="delete">', body)
+
+    def test_created_member_refreshes_the_table_only_if_it_matches(self):
+        body = self.client.post(
+            "/usuarios/create/submit/", {"email": "zoe@example.com", "list_q": "nadie"}, **HTMX
+        ).content.decode()
+        self.assertNotIn("zoe@example.com", body)
+        self.assertNotIn('id="members-table"', body)
+
+        body = self.client.post(
+            "/usuarios/create/submit/", {"email": "leo@example.com", "list_sort": "email"}, **HTMX
+        ).content.decode()
+        self.assertIn('<div id="members-table" hx-swap-oob="innerHTML">', body)
+        # Orden por email: leo queda después de admin y ana, no insertado arriba de todo.
+        self.assertLess(body.index("admin@example.com"), body.index("ana@example.com"))
+        self.assertLess(body.index("ana@example.com"), body.index("leo@example.com"))
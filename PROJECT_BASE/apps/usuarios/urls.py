@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from django.contrib.auth.decorators import login_required
 from django.urls import path
 
+from apps.core.crud.exports import crud_export_view
+from apps.orgs.decorators import organization_required
+
 from . import views
+from .crud_config import CRUD_SLUG_MEMBERS
 
 app_name = "usuarios"
 
@@ -10,7 +15,7 @@ urlpatterns = [
     path("", views.index, name="index"),
     path("create/", views.create_modal, name="create"),
     path("create/submit/", views.create_submit, name="create_submit"),
-    path("export/", views.export_members, name="export"),
+    path("export/", login_required(organization_required(crud_export_view(CRUD_SLUG_MEMBERS))), name="export"),
     path("<int:member_id>/edit/", views.edit_member_modal, name="edit"),
     path("<int:member_id>/edit/submit/", views.edit_member_submit, name="edit_submit"),
     path("<int:member_id>/toggle/", views.toggle_member_active, name="toggle"),
@@ -1,43 +1,69 @@
 from __future__ import annotations
 
+from urllib.parse import urlparse
+
 from django.contrib.auth.decorators import login_required
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, QueryDict
 from django.shortcuts import redirect, render
+from django.template.loader import render_to_string
+from django.urls import reverse
 from django.views.decorators.http import require_POST
 
 from apps.orgs.decorators import organization_required
 from apps.orgs.models import Membership
 from apps.orgs.utils import get_active_organization
+from apps.core.crud import get_crud
+from apps.core.crud.engine import build_export_jobs
+from apps.core.crud.permissions import has_permission
+from apps.core.queries import query_budget
 from apps.core.services import ExecutionContext, ServiceError
 from apps.usuarios.domain.inputs import (
     CreateMemberInput,
-    ExportMembersInput,
     ListMembersInput,
     ToggleMemberActiveInput,
     UpdateMemberInput,
 )
+from apps.usuarios.crud_config import CRUD_SLUG_MEMBERS
+from apps.usuarios.domain.permissions import PERMISSION_MANAGE_MEMBERS
 from apps.usuarios.services.create_member import CreateMemberService
-from apps.usuarios.services.export_members import ExportMembersService
 from apps.usuarios.services.list_members import ListMembersService
 from apps.usuarios.services.toggle_member import ToggleMemberService
 from apps.usuarios.services.update_member import UpdateMemberService
 
 
-def _build_context(request: HttpRequest, memberships):
-    return {
-        "memberships": memberships,
-        "organization": getattr(request, "organization", None),
-    }
+# Prefijo de los campos de estado del listado en mutaciones (sin chocar con los del form: role).
+_LIST_STATE_PREFIX = "list_"
+
 
+def _list_query(request: HttpRequest) -> QueryDict:
+    """Estado de la tabla (filtros/orden/página).
 
-def _list_members(request: HttpRequest):
+    En GET viene en la URL. En mutaciones (POST vía modal/toggle) viene en los campos list_*
+    (hx-include="#members-list-state", ver usuarios/_table.html): los filtros se aplican por
+    HTMX sin cambiar la URL, así que HX-Current-URL queda solo como fallback.
+    """
+
+    if request.method == "GET":
+        return request.GET
+    state = QueryDict(mutable=True)
+    for key in request.POST:
+        if key.startswith(_LIST_STATE_PREFIX):
+            state.setlist(key[len(_LIST_STATE_PREFIX):], request.POST.getlist(key))
+    if state:
+        return state
+    current_url = request.headers.get("HX-Current-URL") or ""
+    return QueryDict(urlparse(current_url).query)
+
+
+def _list_members(request: HttpRequest, *, count_only: bool = False, member_id: int | None = None) -> dict:
     org = getattr(request, "organization", None) or get_active_organization(request)
     if not org:
-        return []
-    service = ListMembersService()
-    search = request.GET.get("q") or None
-    role = request.GET.get("role") or None
-    status = request.GET.get("status") or None
+        return {"memberships": []}
+    query = _list_query(request)
+    service = ListMembersService(context=ExecutionContext.for_request(request, organization=org))
+    search = query.get("q") or None
+    role = query.get("role") or None
+    status = query.get("status") or None
 
     is_active = None
     if status == "active":
@@ -45,6 +71,7 @@ def _list_members(request: HttpRequest):
     elif status == "inactive":
         is_active = False
 
+    page = query.get("page") or "1"
     result = service.execute(
         ListMembersInput(
             organization_id=org.id,
@@ -52,20 +79,105 @@ def _list_members(request: HttpRequest):
             search=search,
             role=role,
             is_active=is_active,
+            page=int(page) if page.isdigit() else 1,
+            sort=query.get("sort") or "",
+            dir=query.get("dir") or "",
+            cursor=query.get("cursor") or "",
+            count_only=count_only,
+            member_id=member_id,
         ),
         actor=request.user,
     )
-    return result.data.get("memberships", []) if result.ok else []
+    return result.data if result.ok else {"memberships": []}
+
+
+def _build_context(request: HttpRequest) -> dict:
+    """Context de usuarios/_table.html (contrato de paginación/orden de templates/crud/*)."""
+
+    data = _list_members(request)
+    config = get_crud(CRUD_SLUG_MEMBERS)
+    params = data.get("params")
+    total = data.get("total")
+    list_url = reverse("usuarios:index")
+    return {
+        "memberships": data.get("memberships", []),
+        "organization": getattr(request, "organization", None),
+        "can_manage_members": _can_manage_members(request),
+        "columns": config.columns_for_template(),
+        "page_obj": data.get("page_obj"),
+        "total_count": total.value if total else None,
+        "total_count_display": total.display if total else "",
+        "current_filters": params.as_dict() if params else {},
+        "qs": config.build_qs_without_page(params) if params else "",
+        # index devuelve solo la tabla en requests HTMX: list y table comparten URL.
+        "crud_urls": {"list": list_url, "table": list_url},
+        "crud_target": "#members-table",
+    }
+
+
+def _member_patch_response(
+    request: HttpRequest,
+    member_id: int,
+    *,
+    created: bool = False,
+    close_modal: bool = False,
+) -> HttpResponse:
+    """Respuesta incremental tras una mutación: solo fragmentos OOB.
+
+    Con el estado del listado que envía el cliente (_list_query):
+    - fila editada que sigue cumpliendo búsqueda/filtros: reemplazo por id; si ya no (p.ej.
+      desactivada con status=active): se quita de la tabla
+    - alta que cumple los filtros: la tabla se re-renderiza con su orden/cursor (la posición
+      depende del orden activo); si no los cumple, no se muestra
+    - badge de conteo con los filtros actuales, sin cargar la página
+    - (opcional) cierre del modal
+
+    Los parciales se renderizan sin request: no necesitan context processors.
+    """
+
+    visible = _list_members(request, member_id=member_id).get("memberships")
+
+    parts: list[str] = []
+    if created and visible:
+        table_html = render_to_string("usuarios/_table.html", _build_context(request))
+        parts.append(f'<div id="members-table" hx-swap-oob="innerHTML">{table_html}</div>')
+    else:
+        if visible:
+            parts.append(
+                render_to_string(
+                    "usuarios/_row.html",
+                    {
+                        "membership": visible[0],
+                        "can_manage_members": _can_manage_members(request),
+                        "oob": True,
+                    },
+                )
+            )
+        elif not created:
+            parts.append(f'<tr id="member-row-{int(member_id)}" hx-swap-oob="delete"></tr>')
+        parts.append(_count_html(request))
+    if close_modal:
+        parts.append('<div id="modal-container" hx-swap-oob="true"></div>')
+    return HttpResponse("".join(parts))
+
+
+def _count_html(request: HttpRequest) -> str:
+    """Badge de conteo (OOB) con los filtros actuales del listado."""
+
+    total = _list_members(request, count_only=True).get("total")
+    return render_to_string(
+        "usuarios/_count.html",
+        {
+            "oob": True,
+            "total_count": total.value if total else None,
+            "total_count_display": total.display if total else "",
+        },
+    )
 
 
-def _get_actor_membership(request: HttpRequest, organization):
-    if not organization or not request.user.is_authenticated:
-        return None
-    return Membership.objects.filter(
-        user=request.user,
-        organization=organization,
-        is_active=True,
-    ).first()
+def _can_manage_members(request: HttpRequest) -> bool:
+    # Decisión memorizada por request (org activa = request.organization).
+    return has_permission(request, PERMISSION_MANAGE_MEMBERS)
 
 
 def _parse_bool(value: str | None, default: bool = False) -> bool:
@@ -77,13 +189,11 @@ def _parse_bool(value: str | None, default: bool = False) -> bool:
 
 @login_required
 @organization_required
+@query_budget(12)
 def index(request: HttpRequest) -> HttpResponse:
-    memberships = _list_members(request)
-    membership = _get_actor_membership(request, getattr(request, "organization", None))
-    context = _build_context(request, memberships)
-    can_manage = bool(membership and membership.role == "admin")
-    context["can_create_members"] = can_manage
-    context["can_manage_members"] = can_manage
+    context = _build_context(request)
+    context["can_create_members"] = context["can_manage_members"]
+    context["export_jobs"] = build_export_jobs(get_crud(CRUD_SLUG_MEMBERS), request)
     context["filters"] = {
         "q": request.GET.get("q", ""),
         "role": request.GET.get("role", ""),
@@ -102,15 +212,13 @@ def create_modal(request: HttpRequest) -> HttpResponse:
     org = getattr(request, "organization", None)
     
     # Check permissions explicitly for UI feedback
-    membership = _get_actor_membership(request, org)
-    if not membership or membership.role != "admin":
+    if not _can_manage_members(request):
         return render(request, "usuarios/_modal_form.html", {
             "errors": [ServiceError(code="forbidden", message="Solo los administradores pueden agregar miembros.")],
             "org": org
         })
 
-    context = _build_context(request, _list_members(request))
-    context.update({"errors": [], "org": org})
+    context = {"errors": [], "org": org}
     return render(request, "usuarios/_modal_form.html", context)
 
 
@@ -130,19 +238,13 @@ def create_submit(request: HttpRequest) -> HttpResponse:
         role=request.POST.get("role", "member"),
     )
 
-    context = ExecutionContext(actor=request.user, organization=org)
+    context = ExecutionContext.for_request(request, organization=org)
     service = CreateMemberService(context=context)
     result = service.execute(input_obj, actor=request.user)
 
     if result.ok:
-        memberships = _list_members(request)
-        table_html = render(request, "usuarios/_table.html", _build_context(request, memberships)).content.decode("utf-8")
-        # 3. UX HTMX robusta: OOB swap para tabla y limpiar modal
-        oob_content = (
-            f'<div id="members-table" hx-swap-oob="true">{table_html}</div>'
-            f'<div id="modal-container" hx-swap-oob="true"></div>'
-        )
-        return HttpResponse(oob_content)
+        # 3. UX HTMX: tabla (si el alta cumple los filtros) + conteo (OOB) y limpiar modal.
+        return _member_patch_response(request, result.data["member_id"], created=True, close_modal=True)
 
     # Si falla, mantenemos el modal abierto (target es #modal-container)
     errors = result.errors or [ServiceError(code="unknown", message="No se pudo crear el miembro.")]
@@ -160,8 +262,7 @@ def create_submit(request: HttpRequest) -> HttpResponse:
 @organization_required
 def edit_member_modal(request: HttpRequest, member_id: int) -> HttpResponse:
     org = getattr(request, "organization", None)
-    membership = _get_actor_membership(request, org)
-    if not membership or membership.role != "admin":
+    if not _can_manage_members(request):
         return HttpResponse(status=403)
 
     target = (
@@ -212,18 +313,12 @@ def edit_member_submit(request: HttpRequest, member_id: int) -> HttpResponse:
         is_active=_parse_bool(request.POST.get("is_active"), default=False),
     )
 
-    context = ExecutionContext(actor=request.user, organization=org)
+    context = ExecutionContext.for_request(request, organization=org)
     service = UpdateMemberService(context=context)
     result = service.execute(input_obj, actor=request.user)
 
     if result.ok:
-        memberships = _list_members(request)
-        table_html = render(request, "usuarios/_table.html", _build_context(request, memberships)).content.decode("utf-8")
-        oob_content = (
-            f'<div id="members-table" hx-swap-oob="true">{table_html}</div>'
-            f'<div id="modal-container" hx-swap-oob="true"></div>'
-        )
-        return HttpResponse(oob_content)
+        return _member_patch_response(request, member_id, close_modal=True)
 
     errors = result.errors or [ServiceError(code="unknown", message="No se pudo actualizar el miembro.")]
     form_data = {
@@ -264,15 +359,12 @@ def toggle_member_active(request: HttpRequest, member_id: int) -> HttpResponse:
         active=active,
     )
 
-    context = ExecutionContext(actor=request.user, organization=org)
+    context = ExecutionContext.for_request(request, organization=org)
     service = ToggleMemberService(context=context)
     result = service.execute(input_obj, actor=request.user)
 
     if result.ok:
-        memberships = _list_members(request)
-        table_html = render(request, "usuarios/_table.html", _build_context(request, memberships)).content.decode("utf-8")
-        oob_content = f'<div id="members-table" hx-swap-oob="true">{table_html}</div>'
-        return HttpResponse(oob_content)
+        return _member_patch_response(request, member_id)
 
     errors = result.errors or [ServiceError(code="unknown", message="No se pudo actualizar el estado del miembro.")]
     error_html = "".join([
@@ -282,41 +374,3 @@ def toggle_member_active(request: HttpRequest, member_id: int) -> HttpResponse:
     oob_message = f'<div id="messages" hx-swap-oob="true">{error_html}</div>'
     return HttpResponse(oob_message, status=200)
 
-
-@login_required
-@organization_required
-def export_members(request: HttpRequest) -> HttpResponse:
-    org = getattr(request, "organization", None)
-    if not org:
-        return redirect("orgs:select")
-
-    fmt = (request.GET.get("format") or "csv").lower()
-    search = request.GET.get("q") or None
-    role = request.GET.get("role") or None
-    status = request.GET.get("status") or None
-
-    is_active = None
-    if status == "active":
-        is_active = True
-    elif status == "inactive":
-        is_active = False
-
-    input_obj = ExportMembersInput(
-        organization_id=org.id,
-        include_inactive=True,
-        search=search,
-        role=role,
-        is_active=is_active,
-        format=fmt,
-    )
-
-    context = ExecutionContext(actor=request.user, organization=org)
-    service = ExportMembersService(context=context)
-    result = service.execute(input_obj, actor=request.user)
-
-    if result.ok and result.data.get("http_response"):
-        return result.data["http_response"]
-
-    errors = result.errors or [ServiceError(code="unknown", message="No se pudo exportar los miembros.")]
-    # Respond with 400 and plain text error
-    return HttpResponse("; ".join([e.message for e in errors]), status=400)
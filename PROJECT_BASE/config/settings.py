@@ -11,6 +11,7 @@ Si en el futuro se desea, puede dividirse en settings/base.py, settings/dev.py,
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import secrets
 from pathlib import Path
@@ -89,11 +90,24 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.orgs.middleware.ActiveOrganizationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "apps.core.middleware.SetupMiddleware",
 ]
 
+# --- Inspector de queries (debug/staging) ---
+# apps.core.middleware.QueryInspectorMiddleware: queries/tiempo de DB por request, patrones N+1
+# (mismo SQL >= QUERY_NPLUSONE_THRESHOLD veces) y presupuesto por view (@query_budget).
+# QUERY_INSPECTOR_RAISE=True (tests/CI): exceder el presupuesto levanta QueryBudgetExceeded.
+QUERY_INSPECTOR_ENABLED = _env_bool("QUERY_INSPECTOR_ENABLED", default=DEBUG)
+QUERY_INSPECTOR_RAISE = _env_bool("QUERY_INSPECTOR_RAISE", default=False)
+QUERY_NPLUSONE_THRESHOLD = int(os.getenv("QUERY_NPLUSONE_THRESHOLD", "5"))
+# Presupuesto de views sin @query_budget (0 = sin límite).
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "0"))
+if QUERY_INSPECTOR_ENABLED:
+    MIDDLEWARE.insert(0, "apps.core.middleware.QueryInspectorMiddleware")
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -205,13 +219,87 @@ RQ_QUEUES = {
     "default": {
         "URL": os.getenv("REDIS_URL", "redis://redis:6379/0"),
         "DEFAULT_TIMEOUT": int(os.getenv("RQ_DEFAULT_TIMEOUT", "300")),
+        # Tests: ASYNC=False ejecuta el job en proceso; FAKE_REDIS=True usa fakeredis.
+        "ASYNC": _env_bool("RQ_ASYNC", default=True),
+        "FAKE_REDIS": _env_bool("RQ_FAKE_REDIS", default=False),
     },
 }
 
 # Convención de jobs: definir funciones en apps/<module>/jobs.py.
 # El servidor web no debe ejecutar tareas largas; usar worker RQ cuando aplique.
+# JOBS_BACKEND: "rq" (encola; requiere Redis + worker) o "sync" (en proceso; dev/tests).
+# Default "rq" solo sin DEBUG y con el paquete `rq` instalado (no está en requirements.txt).
+JOBS_BACKEND = os.getenv(
+    "JOBS_BACKEND",
+    "rq" if not DEBUG and importlib.util.find_spec("rq") is not None else "sync",
+)
+
+# --- Exports en segundo plano (apps.core.exports) ---
+EXPORTS_QUEUE = os.getenv("EXPORTS_QUEUE", "default")
+EXPORTS_JOB_TIMEOUT = int(os.getenv("EXPORTS_JOB_TIMEOUT", "1800"))
+# Exports síncronos: el archivo se arma en memoria hasta este tamaño (bytes) y luego en disco.
+EXPORTS_SPOOL_MAX_SIZE = int(os.getenv("EXPORTS_SPOOL_MAX_SIZE", str(1024 * 1024)))
+# PDF síncrono: por encima de este número de filas se deriva a un export en segundo plano (0 = sin límite).
+EXPORTS_PDF_MAX_ROWS = int(os.getenv("EXPORTS_PDF_MAX_ROWS", "5000"))
+# CSV síncrono: Content-Encoding gzip cuando el cliente lo acepta (CSV comprime ~5-10x). Opt-in:
+# activarlo solo si el proxy no comprime ya la respuesta.
+EXPORTS_CSV_GZIP = _env_bool("EXPORTS_CSV_GZIP", default=False)
+
+# --- Services (apps.core.services) ---
+# Instrumentación de BaseService.execute: tiempo, queries, resultado y request_id por llamada
+# (logs estructurados + histogramas en apps.core.metrics). Llamadas >= SERVICES_SLOW_MS se loguean
+# como WARNING.
+SERVICES_INSTRUMENTATION = _env_bool("SERVICES_INSTRUMENTATION", default=True)
+SERVICES_SLOW_MS = float(os.getenv("SERVICES_SLOW_MS", "500"))
 
 # --- Authentication ---
 LOGIN_URL = "/accounts/login/"
 LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "/accounts/login/"
+
+# --- Cache ---
+# Las invalidaciones por versión (membresías, navegación, singletons, setup) solo llegan a todos
+# los procesos (workers de gunicorn, RQ) con un cache compartido: DJANGO_CACHE_URL=redis://...
+# (p.ej. redis://redis:6379/1, el Redis de docker-compose). Sin URL se usa LocMem, que es
+# por proceso: alcanza para un único proceso de dev; con varios, los TTL acotan el desfase.
+DJANGO_CACHE_URL = os.getenv("DJANGO_CACHE_URL", "")
+if DJANGO_CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": DJANGO_CACHE_URL,
+        }
+    }
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# --- Orgs ---
+# TTL (segundos) del cache compartido de membresías (user, org). Se invalida por signals
+# al guardar/eliminar Membership u Organization; el TTL solo acota entradas huérfanas.
+ORGS_MEMBERSHIP_CACHE_TTL = int(os.getenv("ORGS_MEMBERSHIP_CACHE_TTL", "300"))
+# TTL con cache por proceso (LocMem): la invalidación no llega a otros workers, así que una
+# baja de rol/membresía se ve en otro proceso con hasta N segundos de demora.
+ORGS_MEMBERSHIP_LOCAL_CACHE_TTL = int(os.getenv("ORGS_MEMBERSHIP_LOCAL_CACHE_TTL", "5"))
+
+# --- Singletons (GlobalConfig) ---
+# Copia por proceso de cada SingletonModel; la versión en el cache compartido se consulta una vez
+# por request. Con N > 0, como mucho cada N segundos (cambios se ven con hasta N s de demora).
+SINGLETON_CACHE_CHECK_INTERVAL = float(os.getenv("SINGLETON_CACHE_CHECK_INTERVAL", "0"))
+
+# --- Setup ---
+# SetupMiddleware: tras ver el setup completo, requests sin cache ni base; cada N segundos compara
+# la versión de setup del cache compartido (reset_database / setup revertido).
+SETUP_LATCH_RECHECK_INTERVAL = float(os.getenv("SETUP_LATCH_RECHECK_INTERVAL", "30"))
+
+# --- Navegación ---
+# TTL (segundos) del menú filtrado por usuario. Se invalida por signals (grupos, permisos,
+# membresías); el TTL solo acota entradas huérfanas.
+NAVIGATION_CACHE_TTL = int(os.getenv("NAVIGATION_CACHE_TTL", "300"))
+
+# --- Dashboard ---
+# TTL (segundos) de las métricas agregadas del dashboard (KPIs/series). Las claves incluyen
+# org, ventana y día de corte; sin invalidación explícita: el TTL acota el desfase.
+DASHBOARD_METRICS_CACHE_TTL = int(os.getenv("DASHBOARD_METRICS_CACHE_TTL", "60"))
+# Ventana (segundos) en la que varios cambios de usuarios/membresías encolan un solo
+# recálculo de rollups (apps.core.dashboard.rollups).
+DASHBOARD_ROLLUP_DEBOUNCE = int(os.getenv("DASHBOARD_ROLLUP_DEBOUNCE", "30"))
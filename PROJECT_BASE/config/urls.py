@@ -22,6 +22,7 @@ urlpatterns = [
         include(("django.contrib.auth.urls", "accounts_auth"), namespace="accounts-auth"),
     ),
     # Apps
+    path("exports/", include(("apps.core.exports.urls", "exports"), namespace="exports")),
     path("crud-example/", include("apps.crud_example.urls")),
     path("dashboard/", include(("apps.dashboard.urls", "dashboard"), namespace="dashboard")),
     path("organization/", include("apps.organization_admin.urls")),